@@ -1,56 +1,104 @@
 from flask import Flask, request, jsonify, render_template
 from flask_cors import CORS
-import csv
 from datetime import datetime
-import os
+from hashlib import md5
+from threading import Lock
+
+from modules.history_db import query_applied_jobs, get_history_version, update_date_applied, update_dates_applied
 
 app = Flask(__name__)
 CORS(app)
 
-PATH = 'all excels/'
 ##> ------ Karthik Sarode : karthik.sarode23@gmail.com - UI for excel files ------
 @app.route('/')
 def home():
     """Displays the home page of the application."""
     return render_template('index.html')
 
+# Fields of the API mapped to columns of applications history database
+job_fields = {
+    'Job_ID': 'job_id', 'Title': 'title', 'Company': 'company', 'HR_Name': 'hr_name', 'HR_Link': 'hr_link',
+    'Job_Link': 'job_link', 'External_Job_link': 'external_job_link', 'Date_Applied': 'date_applied',
+}
+
+# Query results cached in memory, cleared whenever the history database changes
+query_cache = {}
+query_cache_version = None
+query_cache_lock = Lock()
+QUERY_CACHE_SIZE = 64
+
+def get_cached_jobs(query: tuple) -> tuple:
+    """
+    Returns ((jobs, total), database version) for the given query arguments of `query_applied_jobs`, from cache if the history database hasn't changed.
+    """
+    global query_cache_version
+    version = get_history_version()
+    with query_cache_lock:
+        if version != query_cache_version:
+            query_cache.clear()
+            query_cache_version = version
+        if query in query_cache:
+            return query_cache[query], version
+    company, date_from, date_to, application_type, sort_by, descending, limit, offset = query
+    rows, total = query_applied_jobs(job_fields.values(), company, date_from, date_to, application_type, sort_by, descending, limit, offset)
+    jobs = [{field: row[column] for field, column in job_fields.items()} for row in rows]
+    with query_cache_lock:
+        if version == query_cache_version:
+            if len(query_cache) >= QUERY_CACHE_SIZE: query_cache.pop(next(iter(query_cache)))
+            query_cache[query] = (jobs, total)
+    return (jobs, total), version
+
 @app.route('/applied-jobs', methods=['GET'])
 def get_applied_jobs():
     '''
-    Retrieves a list of applied jobs from the applications history CSV file.
+    Retrieves a list of applied jobs from the applications history database.
     
     Returns a JSON response containing a list of jobs, each with details such as 
     Job ID, Title, Company, HR Name, HR Link, Job Link, External Job link, and Date Applied.
+    The number of jobs matching the filters (before `limit` and `offset`) is sent in the `X-Total-Count` header.
+
+    Query parameters (all optional):
+        limit, offset: Window of jobs to return. All jobs are returned if `limit` is not given.
+        sort: One of the job fields (Eg: Date_Applied), by default jobs are in the order they were saved.
+        order: 'asc' or 'desc'.
+        company: Part of company name to filter by.
+        date_from, date_to: Range of Date Applied to filter by (Eg: 2024-12-31, both inclusive).
+        type: 'easy' for Easy Applied jobs or 'external' for jobs with external links.
     
-    If the CSV file is not found, returns a 404 error with a relevant message.
+    Supports ETag, returns 304 if the jobs haven't changed since last request.
+    If no applications history is found, returns a 404 error with a relevant message.
+    If query parameters are invalid, returns a 400 error.
     If any other exception occurs, returns a 500 error with the exception message.
     '''
 
     try:
-        jobs = []
-        with open(PATH + 'all_applied_applications_history.csv', 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                jobs.append({
-                    'Job_ID': row['Job ID'],
-                    'Title': row['Title'],
-                    'Company': row['Company'],
-                    'HR_Name': row['HR Name'],
-                    'HR_Link': row['HR Link'],
-                    'Job_Link': row['Job Link'],
-                    'External_Job_link': row['External Job link'],
-                    'Date_Applied': row['Date Applied']
-                })
-        return jsonify(jobs)
-    except FileNotFoundError:
-        return jsonify({"error": "No applications history found"}), 404
+        args = request.args
+        limit = args.get('limit', type=int)
+        offset = args.get('offset', 0, type=int)
+        sort = args.get('sort')
+        order = args.get('order', 'asc')
+        application_type = args.get('type') or None
+        if (limit is not None and limit < 0) or offset < 0 or (sort and sort not in job_fields) or order not in ('asc', 'desc') or application_type not in (None, 'easy', 'external'):
+            return jsonify({"error": "Invalid query parameters"}), 400
+        query = (args.get('company') or None, args.get('date_from') or None, args.get('date_to') or None, application_type,
+                 job_fields[sort] if sort else 'id', order == 'desc', limit, offset)
+
+        (jobs, total), version = get_cached_jobs(query)
+        if total == 0 and not any(query[:4]):
+            return jsonify({"error": "No applications history found"}), 404
+
+        response = jsonify(jobs)
+        response.headers['X-Total-Count'] = str(total)
+        response.headers['Access-Control-Expose-Headers'] = 'X-Total-Count'
+        response.set_etag(md5(repr((version, query)).encode()).hexdigest())
+        return response.make_conditional(request)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/applied-jobs/<job_id>', methods=['PUT'])
 def update_applied_date(job_id):
     """
-    Updates the 'Date Applied' field of a job in the applications history CSV file.
+    Updates the 'Date Applied' field of a job in the applications history database.
 
     Args:
         job_id (str): The Job ID of the job to be updated.
@@ -62,36 +110,40 @@ def update_applied_date(job_id):
         exception message.
     """
     try:
-        data = []
-        csvPath = PATH + 'all_applied_applications_history.csv'
-        
-        if not os.path.exists(csvPath):
-            return jsonify({"error": f"CSV file not found at {csvPath}"}), 404
-            
-        # Read current CSV content
-        with open(csvPath, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            fieldNames = reader.fieldnames
-            found = False
-            for row in reader:
-                if row['Job ID'] == job_id:
-                    row['Date Applied'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    found = True
-                data.append(row)
-        
-        if not found:
+        if not update_date_applied(job_id, datetime.now().strftime('%Y-%m-%d %H:%M:%S')):
             return jsonify({"error": f"Job ID {job_id} not found"}), 404
-
-        with open(csvPath, 'w', encoding='utf-8', newline='') as file:
-            writer = csv.DictWriter(file, fieldnames=fieldNames)
-            writer.writeheader()
-            writer.writerows(data)
         
         return jsonify({"message": "Date Applied updated successfully"}), 200
     except Exception as e:
         print(f"Error updating applied date: {str(e)}")  # Debug log
         return jsonify({"error": str(e)}), 500
 
+@app.route('/applied-jobs', methods=['PUT'])
+def update_applied_dates():
+    """
+    Updates the 'Date Applied' field of many jobs in one request, all in a single atomic update.
+
+    Request body:
+        JSON object with "job_ids", a list of Job IDs to be updated. Eg: {"job_ids": ["4012345678", "4012345679"]}
+
+    Returns:
+        A JSON response with lists of "updated" and "not_found" Job IDs. If the
+        request body is invalid, returns a 400 error. If any other exception
+        occurs, returns a 500 error with the exception message.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        job_ids = data.get('job_ids')
+        if not isinstance(job_ids, list) or not job_ids or not all(isinstance(job_id, str) for job_id in job_ids):
+            return jsonify({"error": "Request body must have a non-empty list of Job IDs in 'job_ids'"}), 400
+
+        updated = update_dates_applied(job_ids, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        not_found = [job_id for job_id in dict.fromkeys(job_ids) if job_id not in updated]
+        return jsonify({"updated": updated, "not_found": not_found}), 200
+    except Exception as e:
+        print(f"Error updating applied dates: {str(e)}")  # Debug log
+        return jsonify({"error": str(e)}), 500
+
 if __name__ == '__main__':
     app.run(debug=True)
 
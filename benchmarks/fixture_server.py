@@ -0,0 +1,155 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import os
+import json
+import argparse
+import threading
+
+from time import sleep
+from zlib import crc32
+from typing import Dict, List
+
+from flask import Flask, abort, jsonify, render_template, request
+from werkzeug.serving import BaseWSGIServer, make_server
+
+
+fixtures_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Job search results are made from postings in `jobs.json`, with Job IDs unique per search term
+first_job_id = 4000000000
+render_first = 7            # Cards after these are occluded, like LinkedIn renders them only when scrolled into view
+already_applied_every = 10  # Every 10th card is shown as already applied, to replay skipped jobs too
+
+
+def load_fixtures(path: str = fixtures_path) -> dict:
+    '''
+    Function to load `jobs.json` of fixtures folder `path`
+    '''
+    with open(os.path.join(path, "jobs.json"), "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def make_jobs(fixtures: dict, keywords: str) -> List[dict]:
+    '''
+    Function to make all jobs of search results for `keywords`, cycling through postings of `fixtures`.
+    * Returns a `list` of postings with their `id` and `applied` status
+    '''
+    search, postings = fixtures["search"], fixtures["postings"]
+    offset = first_job_id + crc32(keywords.lower().encode()) % 100000 * 1000
+    return [
+        {**postings[index % len(postings)], "id": str(offset + index), "applied": index % already_applied_every == already_applied_every - 1}
+        for index in range(search["results_per_page"] * search["pages"])
+    ]
+
+
+def create_app(path: str = fixtures_path, latency: float = 0) -> Flask:
+    '''
+    Function to create the Flask app serving LinkedIn job search pages, job details and Easy Apply modals made from fixtures in `path`.
+    * `latency` is secs added to every response, to replay slower connections
+    * Submitted applications are counted in `app.config["SUBMITTED"]` as { job_id: times submitted }
+    '''
+    app = Flask(__name__, template_folder=path, static_folder=os.path.join(path, "static"), static_url_path="/fixtures/static")
+    fixtures = load_fixtures(path)
+    search = fixtures["search"]
+    jobs: Dict[str, dict] = {}
+    submitted: Dict[str, int] = {}
+    lock = threading.Lock()
+    app.config.update(FIXTURES=fixtures, SUBMITTED=submitted, REQUESTS=0)
+
+    def get_page(keywords: str, page: int) -> List[dict]:
+        all_jobs = make_jobs(fixtures, keywords)
+        with lock:
+            for job in all_jobs: jobs.setdefault(job["id"], job)
+        per_page = search["results_per_page"]
+        return [jobs[job["id"]] for job in all_jobs[(page - 1) * per_page : page * per_page]]
+
+    def render_results(template: str, keywords: str, page: int) -> str:
+        return render_template(template, keywords=keywords, jobs=get_page(keywords, page), page=page, pages=search["pages"],
+                               total=search["results_per_page"] * search["pages"], render_first=render_first)
+
+    def get_job(job_id: str) -> dict:
+        job = jobs.get(job_id)
+        if job is None: abort(404)
+        return job
+
+    @app.before_request
+    def before_request() -> None:
+        with lock: app.config["REQUESTS"] += 1
+        if latency > 0: sleep(latency)
+
+    @app.route("/jobs/search/")
+    def search_page() -> str:
+        return render_results("search.html", request.args.get("keywords", ""), 1)
+
+    @app.route("/fixtures/results")
+    def results() -> str:
+        return render_results("results.html", request.args.get("keywords", ""), max(1, min(int(request.args.get("page", 1)), search["pages"])))
+
+    @app.route("/fixtures/jobs/<job_id>")
+    def job_pane(job_id: str) -> str:
+        return render_template("job_pane.html", job=get_job(job_id))
+
+    @app.route("/fixtures/jobs/<job_id>/apply")
+    def easy_apply(job_id: str) -> str:
+        job = get_job(job_id)
+        return render_template("easy_apply.html", job=job, steps=[fixtures["contact_step"], *job["steps"]])
+
+    @app.route("/fixtures/jobs/<job_id>/submit", methods=["POST"])
+    def submit(job_id: str) -> str:
+        job = get_job(job_id)
+        with lock:
+            submitted[job_id] = submitted.get(job_id, 0) + 1
+            job["applied"] = True
+        return jsonify(ok=True)
+
+    @app.route("/fixtures/stats")
+    def stats() -> str:
+        return jsonify(requests=app.config["REQUESTS"], submitted=submitted)
+
+    return app
+
+
+def start_server(port: int, path: str = fixtures_path, latency: float = 0, ssl: bool = True) -> BaseWSGIServer:
+    '''
+    Function to start serving fixtures in `path` on localhost `port` in a background thread.
+    * Serves over HTTPS with a self-signed certificate if `ssl`, as Chrome is pointed to it for https://www.linkedin.com
+    * Returns the server, call `shutdown()` on it to stop
+    '''
+    server = make_server("127.0.0.1", port, create_app(path, latency), threaded=True, ssl_context="adhoc" if ssl else None)
+    threading.Thread(target=server.serve_forever, name="fixture_server", daemon=True).start()
+    return server
+
+
+def get_chrome_args(port: int) -> str:
+    '''
+    Function to get Chrome flags that send requests for www.linkedin.com to fixture server on `port`, for `CHROME_EXTRA_ARGS`
+    '''
+    return f'--host-resolver-rules="MAP www.linkedin.com 127.0.0.1:{port}" --ignore-certificate-errors'
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve LinkedIn job search fixtures for the replay benchmark")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--fixtures", default=fixtures_path, help="Folder with jobs.json and page templates")
+    parser.add_argument("--latency", type=float, default=0, help="Secs added to every response")
+    parser.add_argument("--no-ssl", action="store_true", help="Serve over HTTP, to look at the pages in a browser")
+    arguments = parser.parse_args()
+    server = start_server(arguments.port, arguments.fixtures, arguments.latency, not arguments.no_ssl)
+    print(f"Serving fixtures on {'http' if arguments.no_ssl else 'https'}://127.0.0.1:{arguments.port}/jobs/search/?keywords=Software%20Engineer")
+    print(f"Open Chrome with: {get_chrome_args(arguments.port)}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
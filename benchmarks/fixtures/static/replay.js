@@ -0,0 +1,119 @@
+// Mimics the client side behaviour of LinkedIn's job search page that the bot relies on:
+// job details load into the side pane without leaving the page, results pages are swapped in place,
+// cards far down the list only render once scrolled into view, and Easy Apply steps through a modal.
+(function() {
+    var main = document.querySelector("main[data-keywords]");
+    var keywords = main.getAttribute("data-keywords");
+    var results = document.getElementById("search-results");
+    var pane = document.getElementById("job-details-pane");
+
+    function fetchHtml(url, options) {
+        return fetch(url, options).then(function(response) { return response.text(); });
+    }
+
+    function remove(selector) {
+        document.querySelectorAll(selector).forEach(function(element) { element.remove(); });
+    }
+
+    // Occluded cards keep their markup in a <template> until they're scrolled into view
+    var occlusion = new IntersectionObserver(function(entries) {
+        entries.forEach(function(entry) {
+            var template = entry.isIntersecting && entry.target.querySelector("template");
+            if (!template) return;
+            entry.target.appendChild(template.content.cloneNode(true));
+            template.remove();
+            occlusion.unobserve(entry.target);
+        });
+    }, {root: results});
+
+    function watchCards() {
+        results.querySelectorAll("li[data-occludable-job-id]").forEach(function(card) {
+            if (card.querySelector("template")) occlusion.observe(card);
+        });
+    }
+
+    function loadResults(page) {
+        results.innerHTML = "";
+        pane.innerHTML = "";
+        return fetchHtml("/fixtures/results?keywords=" + encodeURIComponent(keywords) + "&page=" + page).then(function(html) {
+            results.innerHTML = html;
+            results.scrollTop = 0;
+            watchCards();
+        });
+    }
+
+    function loadJob(jobId) {
+        history.pushState({}, "", "/jobs/search/?currentJobId=" + jobId + "&keywords=" + encodeURIComponent(keywords));
+        return fetchHtml("/fixtures/jobs/" + jobId).then(function(html) { pane.innerHTML = html; });
+    }
+
+    function showStep(modal, step) {
+        var template = modal.querySelector('template[data-step="' + step + '"]');
+        var content = modal.querySelector(".jobs-easy-apply-content");
+        content.innerHTML = "";
+        content.appendChild(template.content.cloneNode(true));
+        modal.setAttribute("data-current-step", step);
+    }
+
+    function openEasyApply(jobId) {
+        return fetchHtml("/fixtures/jobs/" + jobId + "/apply").then(function(html) {
+            document.body.insertAdjacentHTML("beforeend", html);
+            showStep(document.querySelector(".jobs-easy-apply-modal"), 0);
+        });
+    }
+
+    function closeEasyApply() {
+        remove(".artdeco-modal-overlay");
+        remove(".jobs-easy-apply-modal");
+        remove("[data-discard-dialog]");
+    }
+
+    document.addEventListener("click", function(event) {
+        var target = event.target;
+        var link = target.closest("a[data-job-id]");
+        if (link) {
+            event.preventDefault();
+            return loadJob(link.getAttribute("data-job-id"));
+        }
+        if (target.closest(".search-reusables__all-filters-pill-button")) {
+            return document.body.appendChild(document.getElementById("filters-template").content.cloneNode(true));
+        }
+        if (target.closest(".search-reusables__secondary-filters-show-results-button")) {
+            remove(".search-reusables__side-panel");
+            remove(".artdeco-modal-overlay");
+            return loadResults(1);
+        }
+        var pageButton = target.closest("button[data-page]");
+        if (pageButton) return loadResults(pageButton.getAttribute("data-page"));
+
+        var applyButton = target.closest(".jobs-apply-button");
+        if (applyButton) return openEasyApply(applyButton.getAttribute("data-job-id"));
+
+        var modal = target.closest(".jobs-easy-apply-modal");
+        if (!modal) {
+            if (target.closest("[data-discard-dialog] button")) closeEasyApply();
+            return;
+        }
+        var step = modal.getAttribute("data-current-step");
+        if (target.closest("[data-easy-apply-next-button]")) return showStep(modal, Number(step) + 1);
+        if (target.closest("[data-easy-apply-review-button]")) return showStep(modal, "review");
+        if (target.closest("[data-live-test-easy-apply-submit-button]")) {
+            var follow = modal.querySelector("#follow-company-checkbox");
+            return fetch("/fixtures/jobs/" + modal.getAttribute("data-job-id") + "/submit", {
+                method: "POST",
+                headers: {"Content-Type": "application/json"},
+                body: JSON.stringify({follow: follow ? follow.checked : null})
+            }).then(function() { showStep(modal, "done"); });
+        }
+        if (target.closest("[data-easy-apply-done-button]")) return closeEasyApply();
+    });
+
+    document.addEventListener("keydown", function(event) {
+        if (event.key !== "Escape" || !document.querySelector(".jobs-easy-apply-modal") || document.querySelector("[data-discard-dialog]")) return;
+        document.body.insertAdjacentHTML("beforeend",
+            '<div class="artdeco-modal" role="alertdialog" data-discard-dialog><h2>Save this application?</h2>' +
+            '<button type="button"><span>Discard</span></button><button type="button"><span>Save</span></button></div>');
+    });
+
+    watchCards();
+})();
@@ -0,0 +1,235 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+# Mock LLM server: Answers OpenAI compatible (/v1/chat/completions, /v1/models) and Gemini REST (/v1beta/models/...:generateContent) requests
+# with canned answers from `benchmarks/fixtures/llm_responses.json`, after a configurable delay. Streams answers in chunks at a set cadence,
+# and can fail a share of requests with 429 (with Retry-After), 500 or by hanging, to see how the AI code paths behave. No tokens are spent.
+# Run from the project folder:  python -m benchmarks.mock_llm_server --port 8900 --latency 0.5 --rate-429 0.1
+# Then set LLM_API_URL=http://127.0.0.1:8900/v1/ to point the bot to it.
+
+import os
+import json
+import random
+import argparse
+import threading
+
+from time import sleep, time
+from zlib import crc32
+from typing import Iterator, Optional, Union
+
+from flask import Flask, Response, jsonify, request
+from werkzeug.serving import BaseWSGIServer, make_server
+
+
+fixtures_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+default_options = {
+    "latency": 0.3,             # Secs before the answer (or first streamed chunk) is sent
+    "jitter": 0.1,              # Up to these many secs are randomly added to `latency`
+    "chunk_interval": 0.02,     # Secs between streamed chunks
+    "chunk_words": 3,           # Words in every streamed chunk
+    "rate_429": 0.0,            # Share of requests (0 to 1) answered with 429 Too Many Requests
+    "rate_500": 0.0,            # Share of requests answered with 500 Internal Server Error
+    "rate_timeout": 0.0,        # Share of requests that hang for `hang_secs` before failing with 504
+    "retry_after": 1,           # Secs sent in Retry-After header of 429 responses
+    "hang_secs": 30,
+    "json_schema": True,        # False to reject `response_format` of type "json_schema", like many local servers
+    "json_object": True,        # False to reject `response_format` of type "json_object"
+    "temperature": True,        # False to reject requests with `temperature`, like reasoning models
+    "models": ["gpt-4o-mini", "gpt-3.5-turbo", "deepseek-chat", "gemini-1.5-flash"],
+    "seed": None,               # Seed for error injection and jitter, to repeat a run exactly
+}
+
+
+def load_responses(path: str = fixtures_path) -> dict:
+    '''
+    Function to load canned answers `llm_responses.json` of fixtures folder `path`
+    '''
+    with open(os.path.join(path, "llm_responses.json"), "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def get_question(prompt: str) -> str:
+    '''
+    Function to get the question asked in an answer question prompt (see `ai_answer_prompt` in modules/ai/prompts.py)
+    '''
+    _, found, question = prompt.partition("**QUESTION Strat from here:**")
+    if not found: return prompt
+    return next((line.strip() for line in question.splitlines() if line.strip()), "")
+
+
+def get_canned_answer(responses: dict, prompt: str) -> Union[dict, str]:
+    '''
+    Function to pick the canned answer for `prompt`, same prompt always gets the same answer.
+    * Returns skills `dict` for extract skills prompts, else text answer based on words in the question
+    '''
+    if '"tech_stack"' in prompt:
+        return responses["skills"][crc32(prompt.encode()) % len(responses["skills"])]
+    question = get_question(prompt).lower()
+    for words, answer in responses["answers"]:
+        if any(word in question for word in words): return answer
+    return responses["default_answer"]
+
+
+def create_app(options: Optional[dict] = None, path: str = fixtures_path) -> Flask:
+    '''
+    Function to create the Flask app of mock LLM server with `options` (see `default_options`).
+    * Counts of requests and injected errors are kept in `app.config["STATS"]`
+    '''
+    options = {**default_options, **(options or {})}
+    responses = load_responses(path)
+    randomizer = random.Random(options["seed"])
+    lock = threading.Lock()
+    stats = {"requests": 0, "completions": 0, "streamed": 0, "429": 0, "500": 0, "timeout": 0, "rejected": 0}
+    app = Flask(__name__)
+    app.config.update(OPTIONS=options, STATS=stats)
+
+    def count(name: str) -> None:
+        with lock: stats[name] += 1
+
+    def error(status: int, message: str, error_type: str, param: Optional[str] = None) -> Response:
+        response = jsonify(error={"message": message, "type": error_type, "param": param, "code": None})
+        response.status_code = status
+        return response
+
+    def inject_error() -> Optional[Response]:
+        with lock:
+            roll = randomizer.random()
+            delay = options["latency"] + randomizer.random() * options["jitter"]
+        if roll < options["rate_429"]:
+            count("429")
+            response = error(429, "Rate limit reached for requests. Please try again later.", "rate_limit_exceeded")
+            response.headers["Retry-After"] = str(options["retry_after"])
+            return response
+        roll -= options["rate_429"]
+        if roll < options["rate_500"]:
+            count("500")
+            return error(500, "The server had an error while processing your request.", "server_error")
+        roll -= options["rate_500"]
+        if roll < options["rate_timeout"]:
+            count("timeout")
+            sleep(options["hang_secs"])
+            return error(504, "Timed out while waiting for the model.", "timeout")
+        sleep(delay)
+        return None
+
+    def chunks(text: str) -> Iterator[str]:
+        words = text.split(" ")
+        for start in range(0, len(words), options["chunk_words"]):
+            yield " ".join(words[start : start + options["chunk_words"]]) + (" " if start + options["chunk_words"] < len(words) else "")
+
+    @app.before_request
+    def before_request() -> None:
+        count("requests")
+
+    @app.route("/v1/models")
+    def models() -> Response:
+        return jsonify(object="list", data=[{"id": model, "object": "model", "created": 0, "owned_by": "mock"} for model in options["models"]])
+
+    @app.route("/v1/chat/completions", methods=["POST"])
+    def chat_completions() -> Response:
+        body = request.get_json(force=True)
+        response_format = (body.get("response_format") or {}).get("type")
+        if response_format in ("json_schema", "json_object") and not options[response_format]:
+            count("rejected")
+            return error(400, f"Invalid parameter: 'response_format' of type '{response_format}' is not supported with this model.", "invalid_request_error", "response_format")
+        if "temperature" in body and not options["temperature"]:
+            count("rejected")
+            return error(400, "Unsupported parameter: 'temperature' is not supported with this model.", "invalid_request_error", "temperature")
+        failed = inject_error()
+        if failed: return failed
+        count("completions")
+        prompt = "\n".join(str(message.get("content", "")) for message in body.get("messages", []))
+        answer = get_canned_answer(responses, prompt)
+        content = json.dumps(answer) if isinstance(answer, dict) else answer
+        completion_id, created, model = f"chatcmpl-mock{crc32(prompt.encode())}", int(time()), body.get("model", "mock")
+        usage = {"prompt_tokens": len(prompt.split()), "completion_tokens": len(content.split()), "total_tokens": len(prompt.split()) + len(content.split())}
+        if not body.get("stream"):
+            return jsonify(id=completion_id, object="chat.completion", created=created, model=model, usage=usage,
+                           choices=[{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}])
+        count("streamed")
+        def stream() -> Iterator[str]:
+            for index, text in enumerate(chunks(content)):
+                if index: sleep(options["chunk_interval"])
+                delta = {"role": "assistant", "content": text} if index == 0 else {"content": text}
+                yield "data: " + json.dumps({"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                                             "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}) + "\n\n"
+            yield "data: " + json.dumps({"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                                         "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}) + "\n\n"
+            yield "data: [DONE]\n\n"
+        return Response(stream(), mimetype="text/event-stream")
+
+    @app.route("/v1beta/models")
+    def gemini_models() -> Response:
+        return jsonify(models=[{"name": f"models/{model}", "displayName": model, "supportedGenerationMethods": ["generateContent"]} for model in options["models"]])
+
+    @app.route("/v1beta/models/<path:model_method>", methods=["POST"])
+    def gemini_generate(model_method: str) -> Response:
+        if not model_method.endswith(":generateContent"): return error(404, f"Method {model_method} is not supported by mock server.", "not_found")
+        failed = inject_error()
+        if failed: return failed
+        count("completions")
+        body = request.get_json(force=True)
+        prompt = "\n".join(part.get("text", "") for content in body.get("contents", []) for part in content.get("parts", []))
+        answer = get_canned_answer(responses, prompt)
+        text = "```json\n" + json.dumps(answer) + "\n```" if isinstance(answer, dict) else answer     # Gemini wraps JSON in markdown
+        return jsonify(candidates=[{"content": {"parts": [{"text": text}], "role": "model"}, "finishReason": "STOP", "index": 0}],
+                       usageMetadata={"promptTokenCount": len(prompt.split()), "candidatesTokenCount": len(text.split())})
+
+    return app
+
+
+def start_server(port: int, options: Optional[dict] = None, path: str = fixtures_path) -> BaseWSGIServer:
+    '''
+    Function to start the mock LLM server on localhost `port` in a background thread.
+    * Returns the server, call `shutdown()` on it to stop
+    '''
+    server = make_server("127.0.0.1", port, create_app(options, path), threaded=True)
+    threading.Thread(target=server.serve_forever, name="mock_llm_server", daemon=True).start()
+    return server
+
+
+def add_option_arguments(parser: argparse.ArgumentParser) -> None:
+    '''
+    Function to add command line arguments for every option of `default_options` to `parser`
+    '''
+    for name, default in default_options.items():
+        flag = "--" + name.replace("_", "-")
+        if isinstance(default, bool):
+            parser.add_argument(f"--no-{name.replace('_', '-')}", dest=name, action="store_false", help=f"Reject requests using {name}")
+        elif isinstance(default, list):
+            parser.add_argument(flag, nargs="+", default=default)
+        else:
+            parser.add_argument(flag, type=float if isinstance(default, float) else int, default=default)
+
+
+def get_options(arguments: argparse.Namespace) -> dict:
+    '''
+    Function to get server options from parsed command line `arguments`
+    '''
+    return {name: getattr(arguments, name) for name in default_options}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mock OpenAI compatible and Gemini LLM server for benchmarks")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--fixtures", default=fixtures_path, help="Folder with llm_responses.json")
+    add_option_arguments(parser)
+    arguments = parser.parse_args()
+    server = start_server(arguments.port, get_options(arguments), arguments.fixtures)
+    print(f"Mock LLM server running on http://127.0.0.1:{arguments.port}/v1/ (OpenAI compatible) and http://127.0.0.1:{arguments.port}/v1beta/ (Gemini)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,203 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+# AI benchmark: Runs extract skills and answer question of each AI provider (openai, deepseek, gemini) over job descriptions of
+# `benchmarks/fixtures/jobs.json` and labels of `label_corpus` in modules/answer_rules.py, at different concurrency levels,
+# against `benchmarks/mock_llm_server.py`. Reports latency and throughput of every provider code path, without spending tokens.
+# Run from the project folder:  python -m benchmarks.run_ai_bench --providers openai gemini --concurrency 1 4 16 --latency 0.5 --rate-429 0.05
+
+import os
+import json
+import logging
+import argparse
+import tempfile
+
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.fixture_server import load_fixtures
+from benchmarks.mock_llm_server import add_option_arguments, get_options, start_server
+from benchmarks.run_replay import percentile
+
+
+providers = ["openai", "deepseek", "gemini"]
+tasks = ["extract_skills", "answer_question"]
+
+
+def configure(work_dir: str, port: int, model: str, stream: bool, max_concurrency: int, requests_per_minute: int, max_retries: int) -> None:
+    '''
+    Function to point AI config to the mock LLM server on `port`, before modules/ai is imported.
+    * Cache is turned off so every call reaches the server, logs are saved in `work_dir` and only critical ones
+    * `max_concurrency`, `requests_per_minute` and `max_retries` are used by the shared AI request loop (See modules/ai/client.py)
+    '''
+    import config.settings as settings, config.secrets as secrets
+    overrides = {
+        settings: {
+            "logs_folder_path": os.path.join(work_dir, "logs/"), "llm_cache_enabled": False, "llm_cache_path": os.path.join(work_dir, "llm_cache.db"),
+            "llm_capabilities_path": os.path.join(work_dir, "llm_capabilities.json"),
+            "showAiErrorAlerts": False, "log_level": "CRITICAL", "llm_max_concurrency": max_concurrency,
+            "llm_requests_per_minute": requests_per_minute, "llm_max_retries": max_retries, "llm_retry_base_delay": 0,
+        },
+        secrets: {
+            "use_AI": True, "llm_api_url": f"http://127.0.0.1:{port}/v1/", "llm_api_key": "mock-key", "llm_model": model,
+            "llm_spec": "openai", "stream_output": stream,
+        },
+    }
+    for module, values in overrides.items():
+        for name, value in values.items(): setattr(module, name, value)
+
+
+def get_corpus(calls: int) -> List[Tuple[str, str]]:
+    '''
+    Function to get `calls` pairs of (job description, question) from fixtures.
+    * Every description gets a unique reference, so no two calls send the same prompt
+    '''
+    descriptions = [posting["description"] for posting in load_fixtures()["postings"]]
+    from modules.answer_rules import label_corpus
+    return [(f"{descriptions[index % len(descriptions)]}\n\nJob reference: {index}", label_corpus[index % len(label_corpus)][1]) for index in range(calls)]
+
+
+def get_task_functions(provider: str, port: int, stream: bool, timeout: float) -> Dict[str, Callable[[str, str], Any]]:
+    '''
+    Function to create a client of `provider` for the mock server on `port`.
+    * Returns { task: function taking (job description, question) } calling the provider's code path
+    '''
+    from config.secrets import llm_api_key, llm_model
+    if provider == "openai":
+        from modules.ai.openaiConnections import ai_answer_question, ai_create_openai_client, ai_extract_skills
+        client = ai_create_openai_client().with_options(timeout=timeout)
+        return {
+            "extract_skills": lambda description, question: ai_extract_skills(client, description, stream=stream),
+            "answer_question": lambda description, question: ai_answer_question(client, question, job_description=description, stream=stream),
+        }
+    if provider == "deepseek":
+        from modules.ai.deepseekConnections import deepseek_answer_question, deepseek_create_client, deepseek_extract_skills
+        client = deepseek_create_client().with_options(timeout=timeout)
+        return {
+            "extract_skills": lambda description, question: deepseek_extract_skills(client, description, stream=stream),
+            "answer_question": lambda description, question: deepseek_answer_question(client, question, job_description=description, stream=stream),
+        }
+    import google.generativeai as genai
+    from modules.ai.geminiConnections import gemini_answer_question, gemini_extract_skills
+    # `gemini_create_client()` always talks to Google, so the model is configured here for the mock server's REST endpoint
+    genai.configure(api_key=llm_api_key, transport="rest", client_options={"api_endpoint": f"http://127.0.0.1:{port}"})
+    model = genai.GenerativeModel(llm_model)
+    return {
+        "extract_skills": lambda description, question: gemini_extract_skills(model, description),
+        "answer_question": lambda description, question: gemini_answer_question(model, question, job_description=description),
+    }
+
+
+def is_error(result: Any) -> bool:
+    '''
+    Function to check if `result` of a provider function is a failure, they return `None` or `{"error": ...}` when a call fails
+    '''
+    return result is None or (isinstance(result, dict) and "error" in result)
+
+
+def run_level(function: Callable[[str, str], Any], corpus: List[Tuple[str, str]], concurrency: int) -> dict:
+    '''
+    Function to call `function` for every item of `corpus` with `concurrency` calls at a time.
+    * Returns a `dict` of calls, errors, latency percentiles and throughput
+    '''
+    def call(item: Tuple[str, str]) -> Tuple[float, bool]:
+        started = perf_counter()
+        try:
+            failed = is_error(function(*item))
+        except Exception:
+            failed = True
+        return perf_counter() - started, failed
+
+    started = perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ai_bench") as executor:
+        results = list(executor.map(call, corpus))
+    elapsed = perf_counter() - started
+    latencies = [latency for latency, _ in results]
+    return {
+        "concurrency": concurrency,
+        "calls": len(results),
+        "errors": sum(failed for _, failed in results),
+        "p50_secs": percentile(latencies, 50),
+        "p95_secs": percentile(latencies, 95),
+        "max_secs": max(latencies, default=0.0),
+        "calls_per_sec": len(results) / elapsed if elapsed else 0.0,
+        "elapsed_secs": elapsed,
+    }
+
+
+def run_bench(selected_providers: List[str], concurrency_levels: List[int], calls: int, port: int = 8900, server_options: dict = None,
+              model: str = "gpt-4o-mini", stream: bool = False, timeout: float = 60, requests_per_minute: int = 0, max_retries: int = 3) -> dict:
+    '''
+    Function to benchmark `selected_providers` with `calls` calls of every task at each of `concurrency_levels`.
+    * `server_options` are options of the mock LLM server (see `default_options` in benchmarks/mock_llm_server.py)
+    * AI requests in flight are limited to the highest concurrency level, so every level runs as many calls at a time as asked
+    * Returns a `dict` of results, see `print_results()`
+    '''
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)     # No line per request
+    server = start_server(port, server_options)
+    work_dir = tempfile.mkdtemp(prefix="ai_bench_")
+    configure(work_dir, port, model, stream, max(concurrency_levels), requests_per_minute, max_retries)
+    corpus = get_corpus(calls)
+    results = []
+    try:
+        for provider in selected_providers:
+            functions = get_task_functions(provider, port, stream, timeout)
+            for task in tasks:
+                for concurrency in concurrency_levels:
+                    results.append({"provider": provider, "task": task, **run_level(functions[task], corpus, concurrency)})
+    finally:
+        server.shutdown()
+    from modules.ai.client import client_stats
+    return {"model": model, "stream": stream, "requests_per_minute": requests_per_minute, "client_stats": client_stats, "server_options": server.app.config["OPTIONS"], "server_stats": server.app.config["STATS"],
+            "results": results, "work_dir": work_dir}
+
+
+def print_results(results: dict) -> None:
+    '''
+    Function to print `results` of `run_bench()` as a table
+    '''
+    options = results["server_options"]
+    print(f'\nModel "{results["model"]}", {"streamed" if results["stream"] else "not streamed"}, mock server latency {options["latency"]*1000:.0f} ms '
+          f'(+{options["jitter"]*1000:.0f} ms jitter), {options["rate_429"]:.0%} 429s, {options["rate_500"]:.0%} 500s, {options["rate_timeout"]:.0%} timeouts\n')
+    print(f'{"Provider":<10}{"Task":<17}{"Conc.":>6}{"Calls":>7}{"Errors":>8}{"p50 (s)":>10}{"p95 (s)":>10}{"Max (s)":>10}{"Calls/s":>10}{"Wall (s)":>10}')
+    for row in results["results"]:
+        print(f'{row["provider"]:<10}{row["task"]:<17}{row["concurrency"]:>6}{row["calls"]:>7}{row["errors"]:>8}{row["p50_secs"]:>10.3f}'
+              f'{row["p95_secs"]:>10.3f}{row["max_secs"]:>10.3f}{row["calls_per_sec"]:>10.2f}{row["elapsed_secs"]:>10.2f}')
+    print(f'\nAI request loop ({results["requests_per_minute"] or "no"} requests per minute limit): {", ".join(f"{count} {name}" for name, count in results["client_stats"].items())}')
+    print(f'Mock server: {", ".join(f"{count} {name}" for name, count in results["server_stats"].items())}')
+    print(f'Logs of this run are in "{results["work_dir"]}"')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark AI provider code paths against the mock LLM server")
+    parser.add_argument("--providers", nargs="+", choices=providers, default=providers)
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 2, 4, 8], help="Calls in flight at a time, one run for each")
+    parser.add_argument("--calls", type=int, default=16, help="Calls of every task at each concurrency level")
+    parser.add_argument("--port", type=int, default=8900, help="Port for the mock LLM server")
+    parser.add_argument("--model", default="gpt-4o-mini", help="Model name sent, decides json_schema and temperature use of openai path")
+    parser.add_argument("--stream", action="store_true", help="Stream completions of openai and deepseek paths")
+    parser.add_argument("--timeout", type=float, default=60, help="Secs before a call to the mock server times out")
+    parser.add_argument("--requests-per-minute", type=int, default=0, help="llm_requests_per_minute for the run, 0 for no limit")
+    parser.add_argument("--max-retries", type=int, default=3, help="llm_max_retries for the run")
+    parser.add_argument("--output", help="Also save results as JSON to this file, to compare runs")
+    add_option_arguments(parser)
+    arguments = parser.parse_args()
+    results = run_bench(arguments.providers, arguments.concurrency, arguments.calls, arguments.port, get_options(arguments),
+                        arguments.model, arguments.stream, arguments.timeout, arguments.requests_per_minute, arguments.max_retries)
+    print_results(results)
+    if arguments.output:
+        os.makedirs(os.path.dirname(arguments.output) or ".", exist_ok=True)
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
@@ -0,0 +1,205 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+# Replay benchmark: Runs `apply_to_jobs()` of runAiBot.py end-to-end in headless Chrome against recorded LinkedIn pages
+# served by `benchmarks/fixture_server.py`, and reports jobs applied per minute, WebDriver calls per job and time taken per phase.
+# Run from the project folder:  python -m benchmarks.run_replay --searches "Software Engineer" "Python Developer" --output logs/replay.json
+# Nothing is sent to LinkedIn, Chrome is pointed to the local fixture server for https://www.linkedin.com
+
+import os
+import json
+import argparse
+import tempfile
+
+from math import ceil
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from benchmarks.fixture_server import fixtures_path, get_chrome_args, load_fixtures, start_server
+
+
+phase_functions = {     # { phase: function of runAiBot.py timed for it }
+    "filters": "apply_filters",
+    "read_cards": "get_job_cards",
+    "open_job": "get_job_main_details",
+    "apply": "apply_to_job",
+    "questions": "answer_questions",
+    "save": "submitted_jobs",
+}
+
+phase_times: Dict[str, List[float]] = {}        # { phase: [secs taken by each call] }
+phase_commands: Dict[str, List[int]] = {}      # { phase: [WebDriver commands sent by each call] }
+commands_sent = 0
+
+
+def configure(work_dir: str, search_terms: List[str], switch_number: int) -> None:
+    '''
+    Function to override config for a repeatable replay, before runAiBot.py is imported.
+    * History, logs and other files are saved in `work_dir`, so real history isn't changed and every job is new
+    * Human like pauses, AI, prefetching over HTTP (which would reach real LinkedIn) and filters that depend on your profile are turned off
+    '''
+    import config.settings as settings, config.search as search, config.questions as questions, config.secrets as secrets
+    in_work_dir = lambda path: os.path.join(work_dir, path)
+    overrides = {
+        settings: {
+            "file_name": in_work_dir("all_applied_applications_history.csv"), "failed_file_name": in_work_dir("all_failed_applications_history.csv"),
+            "logs_folder_path": in_work_dir("logs/"), "history_db_path": in_work_dir("applications_history.db"), "write_history_csv": False,
+            "locator_stats_path": in_work_dir("locator_stats.json"), "generated_resume_path": in_work_dir("resumes/"),
+            "llm_cache_path": in_work_dir("llm_cache.db"), "cookie_jar_path": in_work_dir("cookies.json"), "save_login_cookies": False,
+            "run_in_background": True, "stealth_mode": False, "safe_mode": True, "keep_browser_open": False, "disable_extensions": True,
+            "lean_browsing": False, "log_page_stats": False, "parallel_workers": 0, "prefetch_jobs": 0, "run_non_stop": False,
+            "click_gap": 0, "humanize_jitter": {"default": 0}, "showAiErrorAlerts": False,
+        },
+        search: {
+            "search_terms": search_terms, "search_location": "", "switch_number": switch_number, "randomize_search_order": False,
+            "sort_by": "Most recent", "date_posted": "Past 24 hours", "salary": "", "easy_apply_only": True, "pause_after_filters": False,
+            "experience_level": [], "job_type": [], "on_site": [], "companies": [], "location": [], "industry": [], "job_function": [],
+            "job_titles": [], "benefits": [], "commitments": [], "under_10_applicants": False, "in_your_network": False, "fair_chance_employer": False,
+            "about_company_bad_words": [], "about_company_good_words": [], "bad_words": [], "security_clearance": True, "current_experience": -1,
+        },
+        questions: {
+            "default_resume_path": in_work_dir("resumes/default/resume.pdf"), "answer_memory_path": in_work_dir("answer_memory.json"),
+            "pause_before_submit": False, "pause_at_failed_question": False,
+        },
+        secrets: {"use_AI": False},
+    }
+    for module, values in overrides.items():
+        for name, value in values.items(): setattr(module, name, value)
+
+
+def count_commands(driver) -> None:
+    '''
+    Function to count every WebDriver command sent by `driver` and it's elements in `commands_sent`
+    '''
+    execute = driver.execute
+    def counted_execute(*args, **kwargs):
+        global commands_sent
+        commands_sent += 1
+        return execute(*args, **kwargs)
+    driver.execute = counted_execute    # Elements send their commands through their driver's `execute()`
+
+
+def time_phase(module, phase: str, function_name: str) -> None:
+    '''
+    Function to replace `function_name` of `module` with one that saves time taken and WebDriver commands sent by every call in `phase`
+    '''
+    function: Callable = getattr(module, function_name)
+    def timed(*args, **kwargs):
+        started, commands = perf_counter(), commands_sent
+        try:
+            return function(*args, **kwargs)
+        finally:
+            phase_times.setdefault(phase, []).append(perf_counter() - started)
+            phase_commands.setdefault(phase, []).append(commands_sent - commands)
+    setattr(module, function_name, timed)
+
+
+def percentile(values: List[float], percent: float) -> float:
+    '''
+    Function to get `percent` percentile of `values` by nearest rank
+    '''
+    ordered = sorted(values)
+    return ordered[max(ceil(percent / 100 * len(ordered)) - 1, 0)] if ordered else 0.0
+
+
+def run_replay(search_terms: List[str], port: int = 8443, latency: float = 0, path: str = fixtures_path) -> dict:
+    '''
+    Function to replay applying to all jobs of fixtures in `path` for `search_terms`.
+    * `latency` is secs the fixture server adds to every response
+    * Returns a `dict` of results, see `print_results()`
+    '''
+    search = load_fixtures(path)["search"]
+    server = start_server(port, path, latency)
+    work_dir = tempfile.mkdtemp(prefix="replay_")
+    os.environ["DEBUG_MODE"] = "False"      # No confirmation dialogs
+    os.environ["CHROME_EXTRA_ARGS"] = get_chrome_args(port)
+    configure(work_dir, search_terms, search["results_per_page"] * search["pages"])
+
+    started = perf_counter()
+    import runAiBot as bot      # Opens Chrome
+    browser_time = perf_counter() - started
+    count_commands(bot.driver)
+    for phase, function_name in phase_functions.items(): time_phase(bot, phase, function_name)
+
+    error = None
+    started = perf_counter()
+    try:
+        bot.apply_to_jobs(search_terms)
+    except Exception as e:
+        error = repr(e)
+    finally:
+        elapsed = perf_counter() - started
+        bot.stop_skills_extraction()
+        try: bot.driver.quit()
+        except Exception: pass
+        server.shutdown()
+
+    applied = bot.easy_applied_count
+    return {
+        "search_terms": search_terms,
+        "latency": latency,
+        "browser_start_secs": browser_time,
+        "elapsed_secs": elapsed,
+        "jobs_applied": applied,
+        "applications_received": sum(server.app.config["SUBMITTED"].values()),
+        "jobs_failed": bot.failed_count,
+        "jobs_skipped": bot.skip_count,
+        "jobs_per_minute": applied / elapsed * 60 if elapsed else 0.0,
+        "webdriver_calls": commands_sent,
+        "webdriver_calls_per_job": commands_sent / applied if applied else None,
+        "phases": {
+            phase: {
+                "calls": len(times),
+                "p50_secs": percentile(times, 50),
+                "p95_secs": percentile(times, 95),
+                "total_secs": sum(times),
+                "webdriver_calls_per_call": sum(phase_commands[phase]) / len(times),
+            } for phase, times in phase_times.items()
+        },
+        "work_dir": work_dir,
+        "error": error,
+    }
+
+
+def print_results(results: dict) -> None:
+    '''
+    Function to print `results` of `run_replay()` as a table
+    '''
+    print(f'\nReplayed searches {results["search_terms"]} with {results["latency"]*1000:.0f} ms latency per response')
+    print(f'Browser started in {results["browser_start_secs"]:.1f} secs, applied to {results["jobs_applied"]} jobs in {results["elapsed_secs"]:.1f} secs '
+          f'({results["applications_received"]} received by fixture server, {results["jobs_failed"]} failed, {results["jobs_skipped"]} skipped)')
+    calls_per_job = results["webdriver_calls_per_job"]
+    print(f'Jobs per minute: {results["jobs_per_minute"]:.2f}    WebDriver calls: {results["webdriver_calls"]} '
+          f'({"n/a" if calls_per_job is None else f"{calls_per_job:.1f}"} per job)\n')
+    print(f'{"Phase":<12}{"Calls":>8}{"p50 (s)":>10}{"p95 (s)":>10}{"Total (s)":>11}{"WebDriver calls/call":>22}')
+    for phase, stats in results["phases"].items():
+        print(f'{phase:<12}{stats["calls"]:>8}{stats["p50_secs"]:>10.3f}{stats["p95_secs"]:>10.3f}{stats["total_secs"]:>11.2f}{stats["webdriver_calls_per_call"]:>22.1f}')
+    if results["error"]: print(f'\nReplay stopped early: {results["error"]}')
+    print(f'\nHistory and logs of this replay are in "{results["work_dir"]}"')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay LinkedIn fixtures through apply_to_jobs() and report performance")
+    parser.add_argument("--searches", nargs="+", default=["Software Engineer"], help="Search terms to replay")
+    parser.add_argument("--port", type=int, default=8443, help="Port for the fixture server")
+    parser.add_argument("--latency", type=float, default=0, help="Secs added to every response of fixture server")
+    parser.add_argument("--fixtures", default=fixtures_path, help="Folder with jobs.json and page templates")
+    parser.add_argument("--output", help="Also save results as JSON to this file, to compare runs")
+    arguments = parser.parse_args()
+    results = run_replay(arguments.searches, arguments.port, arguments.latency, arguments.fixtures)
+    print_results(results)
+    if arguments.output:
+        os.makedirs(os.path.dirname(arguments.output) or ".", exist_ok=True)
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
@@ -147,6 +147,12 @@ Note: Will be treated as False if `run_in_background = True`
 # Do you want to overwrite previous answers?
 overwrite_previous_answers = False # True or False, Note: True or False are case-sensitive
 
+# Remember answers of submitted applications and reuse them for the same questions, before asking AI or answering randomly?
+# Only select and radio answers, and text answers that are a number or yes/no are remembered, others are written for one job
+use_answer_memory = True           # True or False, Note: True or False are case-sensitive
+answer_memory_path = "all excels/answer_memory.json"   # You can edit answers in this file to correct them
+answer_memory_match = 0.9          # How similar (0 to 1) a question must be to a remembered one to reuse it's answer. 1 for exact matches only
+
 
 
 
@@ -91,6 +91,9 @@ about_company_good_words = []      # (dynamic multiple search) or leave empty as
 # Avoid applying to these companies if they have these bad words in their 'Job Description' section...  (In development)
 bad_words = ["US Citizen","USA Citizen","No C2C", "No Corp2Corp", ".NET", "Embedded Programming", "PHP", "Ruby", "CNC"]                     # (dynamic multiple search) or leave empty as []. Case Insensitive. Ex: ["word_1", "phrase 1", "word word", "polygraph", "US Citizenship", "Security Clearance"]
 
+# Match the above bad and good words only as whole words? (Eg: True won't match "PHP" in "PHPUnit" or "Ruby" in "RubyMine")
+match_whole_words = False          # True or False, Note: True or False are case-sensitive
+
 # Do you have an active Security Clearance? (True for Yes and False for No)
 security_clearance = False         # True or False, Note: True or False are case-sensitive
 
@@ -62,12 +62,79 @@ file_name = "all excels/all_applied_applications_history.csv"
 failed_file_name = "all excels/all_failed_applications_history.csv"
 logs_folder_path = "logs/"
 
+# Which messages should be printed and saved to logs? Messages below this level are skipped (Eg: "INFO" skips page sources dumped for debugging at "DEBUG")
+log_level = "DEBUG"                 # "DEBUG", "INFO", "WARNING", "ERROR" or "CRITICAL"
+
+# Save logs as plain text or as JSON lines (one {"time", "level", "message"} object per line, easier to search and parse)
+log_format = "text"                 # "text" or "json"
+
+# Maximum size of log.txt in MB, after which it's renamed to log.1.txt and a new log.txt is started. 0 to never rotate (Parallel apply workers write their own log_worker_1.txt, log_worker_2.txt, ...)
+log_max_size = 10                   # Only Non Negative Integers Eg: 0, 5, 10,....
+log_backup_count = 3                # How many old logs (log.1.txt, log.2.txt, ...) to keep. Only Non Negative Integers Eg: 0, 1, 2, 3,....
+
+# Database where history of applied and failed jobs is saved. Existing history in the above CSV files is imported into it on first run.
+history_db_path = "all excels/applications_history.db"
+
+# Also keep writing history to the above CSV files? (Slower with huge history. You can always export them by running `python -m modules.history_db`)
+write_history_csv = False           # True or False, Note: True or False are case-sensitive
+
+# Where stats of which locators found LinkedIn's elements are saved, so locators that keep failing are tried last (See modules/locators.py)
+locator_stats_path = "logs/locator_stats.json"
+
+# Time every phase of applying (reading job cards, loading details, AI calls, Easy Apply steps, submitting, saving history) and every WebDriver command?
+# A summary is printed after every cycle, and timings are saved as a trace you can open in https://ui.perfetto.dev or chrome://tracing to see where time goes
+performance_trace = False           # True or False, Note: True or False are case-sensitive
+performance_trace_path = "logs/performance_trace.json"      # New timings are added to the end, delete it to start fresh
+
 # Set the maximum amount of time allowed to wait between each click in secs
 click_gap = 0                       # Enter max allowed secs to wait approximately. (Only Non Negative Integers Eg: 0,1,2,3,....)
 
+# Maximum amount of time in secs to wait for a page to be ready (results loaded, suggestions shown, etc.). Waits end as soon as the page is ready.
+max_wait_time = 10                  # Only numbers greater than 0... Don't put in quotes
+
+# Maximum random pause in secs added on top of waits to act more human like, per site. "default" is used for sites not listed.
+humanize_jitter = {"linkedin.com": 0.5, "default": 0}   # Eg: {"linkedin.com": 1.5, "default": 0.5}, Set all to 0 to disable
+
+# How long to rest in secs between search cycles when `run_non_stop = True`
+run_cycle_cooldown = 600            # Only Non Negative Integers Eg: 0, 300, 600,....
+
+# How many Chrome browsers should apply to jobs in parallel? 0 or 1 runs the usual single browser (Beta)
+parallel_workers = 0                # Only Non Negative Integers Eg: 0, 1, 2, 3,.... Each worker opens it's own Chrome, so keep it below your number of CPU cores
+'''
+Note: If `parallel_workers > 1`, one browser collects jobs from search results, and the workers apply to them using their own Chrome profiles saved in `worker_profiles_path`. 
+Workers don't pause before submit or at failed questions. Set DEBUG_MODE=False in .env to skip confirmation dialogs from every worker.
+'''
+
+# Folder where Chrome profiles of parallel workers are saved (each worker logs in once and stays logged in)
+worker_profiles_path = "browser profiles/"
+
+# Keep Chrome open after the bot stops, and attach to it on next start? Restarts then take seconds, without opening a new browser and logging in again (Beta)
+keep_browser_open = False           # True or False, Note: True or False are case-sensitive
+browser_debug_port = 9222           # Port the kept open Chrome listens on for the bot to attach. Only Integers greater than 1023 Eg: 9222
+'''
+Note: If `keep_browser_open = True`, Chrome uses it's own profile saved in `worker_profiles_path` + "daemon" (login once and it stays logged in). 
+Close that Chrome window to start fresh. `run_in_background` and `disable_extensions` only apply when it's started, not when attaching to it.
+In `stealth_mode`, the patched chromedriver is saved in `worker_profiles_path` + "drivers" and reused, instead of downloading it on every start.
+'''
+
+# Save LinkedIn login cookies after logging in, and restore them on next start to skip the login page?
+save_login_cookies = True           # True or False, Note: True or False are case-sensitive
+cookie_jar_path = "browser profiles/linkedin_cookies.json"      # Anyone with this file can use your LinkedIn account, don't share it!
+
+# How many upcoming jobs of search results should have their descriptions fetched in background, while applying to the current one?
+# Jobs rejected by bad_words, security clearance or experience filters are then skipped without opening them
+prefetch_jobs = 3                   # Only Non Negative Integers Eg: 0, 1, 2, 3,.... 0 to disable
+
 # If you want to see Chrome running then set run_in_background as False (May reduce performance). 
 run_in_background = False           # True or False, Note: True or False are case-sensitive ,   If True, this will make pause_at_failed_question, pause_before_submit and run_in_background as False
 
+# Lean browsing: Don't download images, videos, fonts, analytics and ads. They aren't needed to read jobs or fill forms, so pages load faster (Beta)
+lean_browsing = False               # True or False, Note: True or False are case-sensitive
+lean_allowed_urls = []              # Never block resources matching these, Eg: ["media.licdn.com"] to still see company logos and profile pictures, ["*.svg"] for icons
+
+# Print KB downloaded and time taken for every search results page, and their averages at the end? (Compare runs with lean_browsing True and False to see what's saved)
+log_page_stats = False              # True or False, Note: True or False are case-sensitive
+
 # If you want to disable extensions then set disable_extensions as True (Better for performance)
 disable_extensions = False          # True or False, Note: True or False are case-sensitive
 
@@ -87,6 +154,29 @@ stealth_mode = True                # True or False, Note: True or False are case
 # Do you want to get alerts on errors related to AI API connection?
 showAiErrorAlerts = True            # True or False, Note: True or False are case-sensitive
 
+# Skills are extracted by AI in background while the bot applies. How many job descriptions can wait for AI? More are saved without skills, so a slow AI never blocks applying
+skills_extraction_pending = 3       # Only Integers greater than 0 Eg: 1, 2, 3,....
+skills_extraction_timeout = 60      # Max secs to wait for skills of a job before saving it without skills. Only Non Negative Integers Eg: 0, 30, 60,....
+
+# Save AI responses on disk and reuse them for identical requests (same job description or question), saves time and tokens
+llm_cache_enabled = True            # True or False, Note: True or False are case-sensitive
+llm_cache_path = "all excels/llm_cache.db"
+llm_cache_ttl = 30                  # Days after which a saved response is asked again. 0 to never expire. Only Non Negative Integers Eg: 0, 7, 30,....
+llm_cache_max_entries = 10000       # Least recently used responses are removed above this. 0 for no limit. Only Non Negative Integers Eg: 0, 1000, 10000,....
+
+# How many AI requests can run at a time? Skills extraction and answering questions share them, extra requests wait their turn
+llm_max_concurrency = 2             # Only Integers greater than 0 Eg: 1, 2, 3,....
+# Max AI requests per minute, to stay under your AI provider's rate limit. Requests above it wait, instead of failing with "429 Too Many Requests"
+llm_requests_per_minute = 0         # Only Non Negative Integers Eg: 0, 60, 500,.... 0 for no limit
+# How many times to retry an AI request that failed due to rate limit, server error, timeout or connection error?
+# Waits as long as the AI server asks (Retry-After), else `llm_retry_base_delay` secs doubled on every retry
+llm_max_retries = 3                 # Only Non Negative Integers Eg: 0, 1, 2, 3,....
+llm_retry_base_delay = 1            # Only Non Negative Integers Eg: 0, 1, 2, 5,....
+
+# Where structured output (json_schema, json_object) and temperature support of your AI model is saved. It's checked once per API URL and model
+# with a few tiny requests, so every later request uses what works without failing first. Delete it to check again (Eg: after updating your local LLM)
+llm_capabilities_path = "all excels/llm_capabilities.json"
+
 # Use ChatGPT for resume building (Experimental Feature can break the application. Recommended to leave it as False) 
 # use_resume_generator = False       # True or False, Note: True or False are case-sensitive ,   This feature may only work with 'stealth_mode = True'. As ChatGPT website is hosted by CloudFlare which is protected by Anti-bot protections!
 
@@ -0,0 +1,126 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+
+from time import time
+from typing import Any, Optional
+
+from config.secrets import llm_api_url
+from config.settings import llm_cache_enabled, llm_cache_path, llm_cache_ttl, llm_cache_max_entries
+from modules.helpers import print_lg
+
+schema = """
+CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, provider TEXT, model TEXT, response TEXT, created REAL, last_used REAL);
+CREATE INDEX IF NOT EXISTS llm_cache_last_used ON llm_cache (last_used);
+"""
+
+__local = threading.local()
+__stats_lock = threading.Lock()
+cache_stats = {"hits": 0, "misses": 0, "saved": 0, "evicted": 0}
+
+
+def get_connection() -> sqlite3.Connection:
+    '''
+    Function to get the AI response cache database connection of current thread
+    '''
+    connection = getattr(__local, "connection", None)
+    if connection is None:
+        directory = os.path.dirname(llm_cache_path)
+        if directory: os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(llm_cache_path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(schema)
+        __local.connection = connection
+    return connection
+
+
+def count_stat(name: str, amount: int = 1) -> None:
+    '''
+    Function to add `amount` to `name` in `cache_stats`
+    '''
+    with __stats_lock:
+        cache_stats[name] += amount
+
+
+def get_cache_key(provider: str, model: str, prompt: Any, response_format: Any = None, temperature: Optional[float] = None) -> str:
+    '''
+    Function to get the cache key of an AI request.
+    * Takes in `prompt` as messages `list[dict]` or prompt `str`, `response_format` as `dict`, `bool` or `None`
+    * `llm_api_url` is part of the key, as different servers can serve different models with the same name (Eg: a local and a hosted "llama3")
+    * Returns a SHA-256 hash of all inputs
+    '''
+    api_url = "" if provider == "gemini" else (llm_api_url or "").rstrip("/")     # Gemini always uses Google's API
+    request = json.dumps([provider, api_url, model, prompt, response_format, temperature], sort_keys=True, default=str)
+    return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+
+def get_cached_response(key: str) -> Optional[Any]:
+    '''
+    Function to get a cached AI response for `key`.
+    * Returns `None` on a miss, if the cached response is older than `llm_cache_ttl` days or if caching is disabled
+    '''
+    if not llm_cache_enabled: return None
+    try:
+        connection = get_connection()
+        row = connection.execute("SELECT response, created FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        now = time()
+        if row is None or (llm_cache_ttl > 0 and now - row[1] > llm_cache_ttl * 86400):
+            count_stat("misses")
+            return None
+        with connection:
+            connection.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (now, key))
+        count_stat("hits")
+        print_lg("-- USING CACHED AI RESPONSE")
+        return json.loads(row[0])
+    except Exception as e:
+        print_lg("Failed to read AI response cache!", e)
+        return None
+
+
+def save_cached_response(key: str, provider: str, model: str, response: Any) -> None:
+    '''
+    Function to save an AI `response` for `key`, and evict least recently used responses over `llm_cache_max_entries`.
+    * Responses with errors are not saved
+    '''
+    if not llm_cache_enabled or response is None: return
+    if isinstance(response, dict) and "error" in response: return
+    try:
+        connection = get_connection()
+        now = time()
+        with connection:
+            connection.execute("INSERT OR REPLACE INTO llm_cache (key, provider, model, response, created, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                               (key, provider, model, json.dumps(response, default=str), now, now))
+            extra = connection.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] - llm_cache_max_entries
+            if llm_cache_max_entries > 0 and extra > 0:
+                connection.execute("DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY last_used LIMIT ?)", (extra,))
+                count_stat("evicted", extra)
+        count_stat("saved")
+    except Exception as e:
+        print_lg("Failed to save AI response to cache!", e)
+
+
+def print_cache_stats() -> None:
+    '''
+    Function to print AI response cache hit/miss stats of this run
+    '''
+    if not llm_cache_enabled: return
+    lookups = cache_stats["hits"] + cache_stats["misses"]
+    hit_rate = f"{cache_stats['hits'] / lookups:.0%}" if lookups else "N/A"
+    print_lg("AI Cache Hits / Misses:         {} / {} (Hit rate: {})".format(cache_stats["hits"], cache_stats["misses"], hit_rate))
@@ -0,0 +1,84 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import os
+import json
+import threading
+
+from datetime import datetime
+from typing import Any, Dict, Literal, Optional
+
+from config.settings import llm_capabilities_path
+from modules.helpers import make_directories, print_lg
+
+
+Capabilities = Dict[str, Any]   # {"structured_output": "json_schema", "json_object" or "text", "temperature": bool, "checked": "2024-12-29 12:30:00"}
+
+# What each AI API and model supports, found once by small test requests and saved in `llm_capabilities_path`
+# as { "<api url>|<model>": Capabilities }, so later runs and calls go straight to what works.
+# "structured_output" is the best `response_format` the model accepts, "text" if it accepts none
+__capabilities: Dict[str, Capabilities] = {}
+__loaded = False
+__lock = threading.Lock()
+
+
+def get_key(api_url: str, model: str) -> str:
+    '''
+    Function to get the key capabilities of `model` at `api_url` are saved with
+    '''
+    return f"{(api_url or '').rstrip('/')}|{model}"
+
+
+def load_capabilities() -> None:
+    '''
+    Function to load capabilities saved in `llm_capabilities_path` by previous runs
+    '''
+    global __capabilities, __loaded
+    __loaded = True
+    if not os.path.exists(llm_capabilities_path): return
+    try:
+        with open(llm_capabilities_path, "r", encoding="utf-8") as file:
+            __capabilities = json.load(file)
+    except Exception as e:
+        print_lg("Failed to load AI model capabilities, they will be checked again!", e)
+
+
+def get_capabilities(api_url: str, model: str) -> Optional[Capabilities]:
+    '''
+    Function to get saved capabilities of `model` at `api_url`.
+    * Returns `None` if they were never checked
+    '''
+    with __lock:
+        if not __loaded: load_capabilities()
+        return __capabilities.get(get_key(api_url, model))
+
+
+def save_capabilities(api_url: str, model: str, structured_output: Literal["json_schema", "json_object", "text"], temperature: bool) -> Capabilities:
+    '''
+    Function to save capabilities of `model` at `api_url` to `llm_capabilities_path`.
+    * Returns the saved capabilities
+    '''
+    capabilities = {"structured_output": structured_output, "temperature": temperature, "checked": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+    with __lock:
+        if not __loaded: load_capabilities()
+        __capabilities[get_key(api_url, model)] = capabilities
+        try:
+            make_directories([llm_capabilities_path])
+            temp_path = llm_capabilities_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(__capabilities, file, indent=1)
+            os.replace(temp_path, llm_capabilities_path)
+        except Exception as e:
+            print_lg("Failed to save AI model capabilities!", e)
+    return capabilities
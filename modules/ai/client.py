@@ -0,0 +1,206 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import asyncio
+import threading
+
+from time import monotonic, time
+from email.utils import parsedate_to_datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config.settings import llm_max_concurrency, llm_requests_per_minute, llm_max_retries, llm_retry_base_delay
+from modules.helpers import print_lg
+from openai import APIConnectionError
+
+
+# All AI requests of openai, deepseek and gemini connectors go through one asyncio event loop running in a background thread.
+# The loop lets at most `llm_max_concurrency` requests run at a time, spaces them to `llm_requests_per_minute`,
+# retries rate limited and failed ones with backoff, and sends identical requests that are in flight only once.
+retry_status_codes = {408, 409, 429, 500, 502, 503, 504}
+max_retry_delay = 60        # Secs, longest wait between retries, unless the server asks for longer
+
+client_stats = {"requests": 0, "coalesced": 0, "retries": 0, "rate_limited": 0, "throttled": 0}
+
+__loop: Optional[asyncio.AbstractEventLoop] = None
+__loop_lock = threading.Lock()
+__semaphore: Optional[asyncio.Semaphore] = None
+__bucket_lock: Optional[asyncio.Lock] = None
+__tokens = float(max(llm_max_concurrency, 1))
+__tokens_updated = monotonic()
+__paused_until = 0.0        # monotonic() time till which no request is sent, after server asked to retry later
+__in_flight: Dict[str, asyncio.Future] = {}
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    '''
+    Function to get the event loop of AI requests, starts it in a background thread if not running
+    '''
+    global __loop, __semaphore, __bucket_lock
+    with __loop_lock:
+        if __loop is None or __loop.is_closed():
+            loop = asyncio.new_event_loop()
+            loop.set_default_executor(ThreadPoolExecutor(max_workers=max(llm_max_concurrency, 1), thread_name_prefix="llm_request"))
+            async def create_primitives() -> None:
+                global __semaphore, __bucket_lock
+                __semaphore = asyncio.Semaphore(max(llm_max_concurrency, 1))
+                __bucket_lock = asyncio.Lock()
+            threading.Thread(target=loop.run_forever, name="llm_client", daemon=True).start()
+            asyncio.run_coroutine_threadsafe(create_primitives(), loop).result()
+            __loop = loop
+        return __loop
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    '''
+    Function to get secs the server asked to wait before retrying, from "Retry-After" or "retry-after-ms" header of `error`'s response.
+    * Returns `None` if the server didn't say
+    '''
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers: return None
+    try:
+        if headers.get("retry-after-ms"): return float(headers["retry-after-ms"]) / 1000
+        retry_after = headers.get("retry-after")
+        if not retry_after: return None
+        if retry_after.strip().replace(".", "", 1).isdigit(): return float(retry_after)
+        return max(parsedate_to_datetime(retry_after).timestamp() - time(), 0.0)      # HTTP date
+    except Exception:
+        return None
+
+
+def is_retryable(error: Exception) -> bool:
+    '''
+    Function to check if a request that failed with `error` may succeed if sent again (rate limit, server error, timeout or connection error)
+    '''
+    if isinstance(error, (APIConnectionError, TimeoutError, ConnectionError)): return True     # APITimeoutError is an APIConnectionError
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)      # OpenAI errors have `status_code`, Google API errors have `code`
+    return isinstance(status, int) and status in retry_status_codes
+
+
+async def take_token() -> None:
+    '''
+    Function to wait for a free slot under `llm_requests_per_minute` (token bucket holding up to `llm_max_concurrency` requests),
+    and till the time a rate limited server asked to wait is over
+    '''
+    global __tokens, __tokens_updated
+    async with __bucket_lock:       # Waiting requests are let through in order
+        throttled = False
+        while True:
+            now = monotonic()
+            if __paused_until > now:
+                throttled = True
+                await asyncio.sleep(__paused_until - now)
+                continue
+            if llm_requests_per_minute <= 0: break
+            rate = llm_requests_per_minute / 60
+            __tokens = min(float(max(llm_max_concurrency, 1)), __tokens + (now - __tokens_updated) * rate)
+            __tokens_updated = now
+            if __tokens >= 1:
+                __tokens -= 1
+                break
+            throttled = True
+            await asyncio.sleep((1 - __tokens) / rate)
+        if throttled: client_stats["throttled"] += 1
+
+
+async def send(call: Callable[[], Any]) -> Any:
+    '''
+    Function to run blocking request `call` in the request thread pool, within `llm_max_concurrency` and `llm_requests_per_minute`.
+    * Retries up to `llm_max_retries` times if it fails with a retryable error, waiting as long as the server asked or doubling waits from `llm_retry_base_delay` secs
+    '''
+    global __paused_until
+    attempt = 0
+    while True:
+        try:
+            async with __semaphore:
+                await take_token()
+                return await asyncio.to_thread(call)
+        except Exception as e:
+            if attempt >= llm_max_retries or not is_retryable(e): raise
+            retry_after = get_retry_after(e)
+            if retry_after is not None:
+                client_stats["rate_limited"] += 1
+                __paused_until = max(__paused_until, monotonic() + retry_after)    # Hold back all requests, not just this one
+                delay = retry_after
+            else:
+                delay = min(llm_retry_base_delay * 2 ** attempt, max_retry_delay)
+            attempt += 1
+            client_stats["retries"] += 1
+            print_lg(f"AI request failed ({e.__class__.__name__}), retrying in {delay:.1f} secs... (Retry {attempt}/{llm_max_retries})")
+            await asyncio.sleep(delay)
+
+
+async def request(key: Optional[str], call: Callable[[], Any]) -> Any:
+    '''
+    Function to send request `call`, or wait for the result of an identical request with same `key` already in flight.
+    * `key` is the cache key of the request (See `get_cache_key()` in modules/ai/cache.py), `None` to never share the result
+    '''
+    client_stats["requests"] += 1
+    if key is not None and key in __in_flight:
+        client_stats["coalesced"] += 1
+        return await asyncio.shield(__in_flight[key])
+    shared = asyncio.get_running_loop().create_future()
+    if key is not None: __in_flight[key] = shared
+    try:
+        value = await send(call)
+    except Exception as e:
+        shared.set_exception(e)
+        shared.exception()      # Marks it as seen, so asyncio doesn't warn when no identical request waited for it
+        raise
+    finally:
+        if key is not None: __in_flight.pop(key, None)
+    shared.set_result(value)
+    return value
+
+
+def submit_llm_request(key: Optional[str], call: Callable[[], Any]) -> Future:
+    '''
+    Function to send blocking AI request `call` through the shared AI request loop without waiting for it.
+    * Returns a `Future` of the result of `call`
+    '''
+    return asyncio.run_coroutine_threadsafe(request(key, call), get_loop())
+
+
+def llm_request(key: Optional[str], call: Callable[[], Any]) -> Any:
+    '''
+    Function to send blocking AI request `call` through the shared AI request loop and wait for it's result.
+    * `call` makes one request to the AI provider and returns it's result, raising the provider's error if it fails
+    * Raises the error of the last attempt if all retries fail
+    '''
+    return submit_llm_request(key, call).result()
+
+
+def llm_request_batch(requests: List[Tuple[Optional[str], Callable[[], Any]]]) -> List[Any]:
+    '''
+    Function to send many AI `requests` of (key, call) at once, they run together within `llm_max_concurrency`.
+    * Returns results in the same order, with the `Exception` in place of the result of a failed request
+    '''
+    futures = [submit_llm_request(key, call) for key, call in requests]
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def print_client_stats() -> None:
+    '''
+    Function to print AI request stats of this run
+    '''
+    if not client_stats["requests"]: return
+    print_lg("AI Requests / Coalesced:        {} / {}".format(client_stats["requests"], client_stats["coalesced"]))
+    print_lg("AI Retries / Rate limited:      {} / {} (Throttled by requests per minute: {})".format(
+        client_stats["retries"], client_stats["rate_limited"], client_stats["throttled"]))
@@ -3,6 +3,9 @@ from config.secrets import *
 from config.settings import showAiErrorAlerts
 from modules.helpers import print_lg, critical_error_log, convert_to_json, cross_platform_confirm
 from modules.ai.prompts import *
+from modules.ai.cache import get_cache_key, get_cached_response, save_cached_response
+from modules.ai.client import llm_request
+from modules.profiler import timed
 from openai import OpenAI
 from openai.types.model import Model
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
@@ -26,7 +29,7 @@ def deepseek_create_client() -> Optional[OpenAI]:
             base_url = base_url[:-1]
         
         # Create client with DeepSeek endpoint
-        client = OpenAI(base_url=base_url, api_key=llm_api_key)
+        client = OpenAI(base_url=base_url, api_key=llm_api_key, max_retries=0)     # Retries are done by modules/ai/client.py
         
         print_lg("---- SUCCESSFULLY CREATED DEEPSEEK CLIENT! ----")
         print_lg(f"Using API URL: {base_url}")
@@ -53,6 +56,7 @@ def deepseek_model_supports_temperature(model_name: str) -> bool:
     deepseek_models = ["deepseek-chat", "deepseek-reasoner"]
     return model_name in deepseek_models
 
+@timed("deepseek_completion", "ai")
 def deepseek_completion(client: OpenAI, messages: List[dict], response_format: Optional[dict] = None, temperature: float = 0, stream: bool = stream_output) -> Union[dict, ValueError]:
     '''
     Completes a chat using DeepSeek API and formats the results.
@@ -62,9 +66,14 @@ def deepseek_completion(client: OpenAI, messages: List[dict], response_format: O
     * Takes in `temperature` of type `float` for randomness control (default 0)
     * Takes in `stream` of type `bool` for streaming output (optional)
     * Returns the response as text or JSON
+    * Returns cached response for identical requests, see `llm_cache_enabled` in settings
+    * Request is sent through the shared AI request loop, which retries rate limited requests, see `llm_max_retries` in settings
     '''
     if not client: 
         raise ValueError("DeepSeek client is not available!")
+    cache_key = get_cache_key("deepseek", llm_model, messages, response_format, temperature)
+    cached = get_cached_response(cache_key)
+    if cached is not None: return cached
     ##> ------ Tim L : tulxoro - Improvement ------
     # Set up parameters for the API call
     params = {
@@ -89,29 +98,33 @@ def deepseek_completion(client: OpenAI, messages: List[dict], response_format: O
         print_lg(f"Calling DeepSeek API for completion...")
         print_lg(f"Using model: {llm_model}")
         print_lg(f"Message count: {len(messages)}")
-        completion = client.chat.completions.create(**params)
+        def send() -> str:
+            completion = client.chat.completions.create(**params)
     ##<
-        result = ""
-        
-        # Process the response
-        if stream:
-            print_lg("--STREAMING STARTED")
-            for chunk in completion:
+            result = ""
+            
+            # Process the response
+            if stream:
+                print_lg("--STREAMING STARTED")
+                for chunk in completion:
+                    # Check for errors
+                    if chunk.model_extra and chunk.model_extra.get("error"):
+                        raise ValueError(f'Error occurred with DeepSeek API: "{chunk.model_extra.get("error")}"')
+                    
+                    chunk_message = chunk.choices[0].delta.content
+                    if chunk_message is not None:
+                        result += chunk_message
+                    print_lg(chunk_message, end="", flush=True)
+                print_lg("\n--STREAMING COMPLETE")
+            else:
                 # Check for errors
-                if chunk.model_extra and chunk.model_extra.get("error"):
-                    raise ValueError(f'Error occurred with DeepSeek API: "{chunk.model_extra.get("error")}"')
+                if completion.model_extra and completion.model_extra.get("error"):
+                    raise ValueError(f'Error occurred with DeepSeek API: "{completion.model_extra.get("error")}"')
                 
-                chunk_message = chunk.choices[0].delta.content
-                if chunk_message is not None:
-                    result += chunk_message
-                print_lg(chunk_message, end="", flush=True)
-            print_lg("\n--STREAMING COMPLETE")
-        else:
-            # Check for errors
-            if completion.model_extra and completion.model_extra.get("error"):
-                raise ValueError(f'Error occurred with DeepSeek API: "{completion.model_extra.get("error")}"')
-            
-            result = completion.choices[0].message.content
+                result = completion.choices[0].message.content
+            return result
+
+        result = llm_request(cache_key, send)
         
         # Convert to JSON if needed
         if response_format:
@@ -119,6 +132,7 @@ def deepseek_completion(client: OpenAI, messages: List[dict], response_format: O
         
         print_lg("\nDeepSeek Answer:\n")
         print_lg(result, pretty=response_format is not None)
+        save_cached_response(cache_key, "deepseek", llm_model, result)
         return result
     except Exception as e:
         error_message = f"DeepSeek API error: {str(e)}"
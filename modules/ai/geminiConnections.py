@@ -3,6 +3,9 @@ from config.secrets import llm_model, llm_api_key
 from config.settings import showAiErrorAlerts
 from modules.helpers import print_lg, critical_error_log, convert_to_json, cross_platform_confirm
 from modules.ai.prompts import *
+from modules.ai.cache import get_cache_key, get_cached_response, save_cached_response
+from modules.ai.client import llm_request
+from modules.profiler import timed
 from typing import Literal, Optional, Union, List
 
 def gemini_get_models_list():
@@ -54,6 +57,7 @@ def gemini_create_client():
                 showAiErrorAlerts = False
         return None
 
+@timed("gemini_completion", "ai")
 def gemini_completion(model, prompt: str, is_json: bool = False) -> Union[dict, str]:
     """
     Generates content using the Gemini model.
@@ -61,10 +65,16 @@ def gemini_completion(model, prompt: str, is_json: bool = False) -> Union[dict,
     * Takes in `prompt` of type `str` - The prompt to send to the model.
     * Takes in `is_json` of type `bool` - Whether to expect a JSON response.
     * Returns the response as a string or a dictionary.
+    * Returns cached response for identical requests, see `llm_cache_enabled` in settings.
+    * Request is sent through the shared AI request loop, see `llm_max_concurrency` in settings.
     """
     if not model:
         raise ValueError("Gemini client is not available!")
 
+    cache_key = get_cache_key("gemini", llm_model, prompt, is_json)
+    cached = get_cached_response(cache_key)
+    if cached is not None: return cached
+
     try:
         # The Gemini API has a 'safety_settings' parameter to control content filtering.
         # For a job application helper, it's generally safe to set these to a less restrictive level
@@ -89,13 +99,16 @@ def gemini_completion(model, prompt: str, is_json: bool = False) -> Union[dict,
         ]
 
         print_lg(f"Calling Gemini API for completion...")
-        response = model.generate_content(prompt, safety_settings=safety_settings)
-        
-        # The response might be blocked. Check for that.
-        if not response.parts:
-             raise ValueError("The response from the Gemini API was empty. This might be due to the safety filters blocking the prompt or the response. The prompt was:\n" + prompt)
+        def send() -> str:
+            response = model.generate_content(prompt, safety_settings=safety_settings)
+            
+            # The response might be blocked. Check for that.
+            if not response.parts:
+                 raise ValueError("The response from the Gemini API was empty. This might be due to the safety filters blocking the prompt or the response. The prompt was:\n" + prompt)
+
+            return response.text
 
-        result = response.text
+        result = llm_request(cache_key, send)
 
         if is_json:
             # Clean the response to remove Markdown formatting
@@ -104,8 +117,9 @@ def gemini_completion(model, prompt: str, is_json: bool = False) -> Union[dict,
             if result.endswith("```"):
                 result = result[:-3]
             
-            return convert_to_json(result)
+            result = convert_to_json(result)
         
+        save_cached_response(cache_key, "gemini", llm_model, result)
         return result
     except Exception as e:
         critical_error_log(f"Error occurred while getting Gemini completion!", e)
@@ -21,6 +21,10 @@ from config.search import security_clearance, did_masters
 
 from modules.helpers import print_lg, critical_error_log, convert_to_json, cross_platform_confirm
 from modules.ai.prompts import *
+from modules.ai.cache import get_cache_key, get_cached_response, save_cached_response
+from modules.ai.client import llm_request
+from modules.ai.capabilities import Capabilities, get_capabilities, save_capabilities
+from modules.profiler import timed
 from openai import OpenAI
 from openai.types.model import Model
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
@@ -38,6 +42,20 @@ Open `secret.py` in `/config` folder to configure your AI API connections.
 ERROR:
 """
 
+# Response formats tried for JSON answers, best first
+structured_output_modes = ["json_schema", "json_object", "text"]
+
+# Tiny request sent to check what the model supports, see `ai_probe_capabilities()`
+capability_check_messages = [{"role": "user", "content": 'Reply with only this JSON object: {"ok": true}'}]
+capability_check_schema = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "Capability_Check",
+        "strict": True,
+        "schema": {"type": "object", "properties": {"ok": {"type": "boolean"}}, "required": ["ok"], "additionalProperties": False},
+    },
+}
+
 # Function to show an AI error alert
 def ai_error_alert(message: str, stackTrace: str, title: str = "AI Connection Error") -> None:
     """
@@ -78,7 +96,7 @@ def ai_create_openai_client() -> OpenAI:
         if not use_AI:
             raise ValueError("AI is not enabled! Please enable it by setting `use_AI = True` in `secrets.py` in `config` folder.")
         
-        client = OpenAI(base_url=llm_api_url, api_key=llm_api_key)
+        client = OpenAI(base_url=llm_api_url, api_key=llm_api_key, max_retries=0)     # Retries are done by modules/ai/client.py
 
         # Try to get models list - some OpenAI-compatible APIs may not support this endpoint
         models = ai_get_models_list(client)
@@ -97,6 +115,8 @@ def ai_create_openai_client() -> OpenAI:
                 print_lg(f"Available models: {model_ids}")
                 print_lg(f"Will attempt to use model '{llm_model}' anyway (this may work with OpenAI-compatible APIs).")
         
+        ai_probe_capabilities(client)
+
         print_lg("---- SUCCESSFULLY CREATED OPENAI CLIENT! ----")
         print_lg(f"Using API URL: {llm_api_url}")
         print_lg(f"Using Model: {llm_model}")
@@ -188,7 +208,62 @@ def model_supports_json_schema(model_name: str) -> bool:
     
     return False
 
+def is_unsupported_error(error: Exception) -> bool:
+    """
+    Function to check if `error` means the model rejected a parameter of the request (HTTP 400 or 422),
+    and not that the API couldn't be reached or failed.
+    """
+    return getattr(error, "status_code", None) in (400, 422)
+
+def ai_probe_capabilities(client: OpenAI) -> Optional[Capabilities]:
+    """
+    Function to find out if `llm_model` at `llm_api_url` supports json_schema or json_object response format and temperature,
+    by sending tiny requests. It's done once per API URL and model, the result is saved in `llm_capabilities_path`.
+    * Takes in `client` of type `OpenAI`
+    * Returns saved capabilities if already checked
+    * Returns `None` if it couldn't be checked (Eg: API not reachable), then the model name decides what's used
+    """
+    capabilities = get_capabilities(llm_api_url, llm_model)
+    if capabilities: return capabilities
+    print_lg(f"Checking what `{llm_model}` supports, this is done only once...")
+    def accepts(**params) -> bool:
+        try:
+            llm_request(None, lambda: client.chat.completions.create(model=llm_model, messages=capability_check_messages, **params))
+            return True
+        except Exception as e:
+            if is_unsupported_error(e): return False
+            raise
+    try:
+        temperature = accepts(temperature=0)
+        params = {"temperature": 0} if temperature else {}
+        if llm_spec not in ["openai", "openai-like"]: structured_output = "text"     # `response_format` isn't sent for these, see `ai_completion()`
+        elif accepts(response_format=capability_check_schema, **params): structured_output = "json_schema"
+        elif accepts(response_format={"type": "json_object"}, **params): structured_output = "json_object"
+        else: structured_output = "text"
+    except Exception as e:
+        critical_error_log("Could not check what the AI model supports, will decide by model name.", e)
+        return None
+    capabilities = save_capabilities(llm_api_url, llm_model, structured_output, temperature)
+    print_lg(f"`{llm_model}` supports structured output: {structured_output}, temperature: {temperature}")
+    return capabilities
+
+def supports_temperature() -> bool:
+    """
+    Function to check if `llm_model` supports temperature, as found by `ai_probe_capabilities()` or else by it's name.
+    """
+    capabilities = get_capabilities(llm_api_url, llm_model)
+    return capabilities["temperature"] if capabilities else model_supports_temperature(llm_model)
+
+def get_structured_output() -> Literal["json_schema", "json_object", "text"]:
+    """
+    Function to get the best response format `llm_model` supports for JSON answers, as found by `ai_probe_capabilities()` or else by it's name.
+    """
+    capabilities = get_capabilities(llm_api_url, llm_model)
+    if capabilities: return capabilities["structured_output"]
+    return "json_schema" if model_supports_json_schema(llm_model) else "json_object"
+
 # Function to get chat completion from OpenAI API
+@timed("ai_completion", "ai")
 def ai_completion(client: OpenAI, messages: List[dict], response_format: Optional[dict] = None, temperature: float = 0, stream: bool = stream_output) -> Union[dict, ValueError]:
     """
     Function that completes a chat and prints and formats the results of the OpenAI API calls.
@@ -198,12 +273,18 @@ def ai_completion(client: OpenAI, messages: List[dict], response_format: Optiona
     * Takes in `temperature` of type `float` for temperature, default is `0`
     * Takes in `stream` of type `bool` to indicate if it's a streaming call or not
     * Returns a `dict` object representing JSON response, will try to convert to JSON if `response_format` is given
+    * Returns cached response for identical requests, see `llm_cache_enabled` in settings
+    * Request is sent through the shared AI request loop, see `llm_max_concurrency` in settings
     """
     if not client: raise ValueError("Client is not available!")
 
+    cache_key = get_cache_key("openai", llm_model, messages, response_format, temperature)
+    cached = get_cached_response(cache_key)
+    if cached is not None: return cached
+
     params = {"model": llm_model, "messages": messages, "stream": stream}
 
-    if model_supports_temperature(llm_model):
+    if supports_temperature():
         params["temperature"] = temperature
     if response_format and llm_spec in ["openai", "openai-like"]:
         # Only add response_format if it's a simple dict (not json_schema which may not be supported)
@@ -211,38 +292,43 @@ def ai_completion(client: OpenAI, messages: List[dict], response_format: Optiona
         if isinstance(response_format, dict):
             params["response_format"] = response_format
 
-    completion = client.chat.completions.create(**params)
+    def send() -> str:
+        completion = client.chat.completions.create(**params)
 
-    result = ""
-    
-    # Log response
-    if stream:
-        print_lg("--STREAMING STARTED")
-        for chunk in completion:
-            ai_check_error(chunk)
-            # Handle cases where delta might not have content attribute
-            if hasattr(chunk, 'choices') and len(chunk.choices) > 0:
-                chunkMessage = chunk.choices[0].delta.content if hasattr(chunk.choices[0].delta, 'content') else None
-                if chunkMessage != None:
-                    result += chunkMessage
-                print_lg(chunkMessage or "", end="", flush=True)
-        print_lg("\n--STREAMING COMPLETE")
-    else:
-        ai_check_error(completion)
-        # Handle response extraction - works with both OpenAI and OpenAI-compatible APIs
-        if hasattr(completion, 'choices') and len(completion.choices) > 0:
-            if hasattr(completion.choices[0], 'message') and hasattr(completion.choices[0].message, 'content'):
-                result = completion.choices[0].message.content
-            else:
-                raise ValueError("Unexpected response format from API. The response does not contain the expected structure.")
+        result = ""
+        
+        # Log response
+        if stream:
+            print_lg("--STREAMING STARTED")
+            for chunk in completion:
+                ai_check_error(chunk)
+                # Handle cases where delta might not have content attribute
+                if hasattr(chunk, 'choices') and len(chunk.choices) > 0:
+                    chunkMessage = chunk.choices[0].delta.content if hasattr(chunk.choices[0].delta, 'content') else None
+                    if chunkMessage != None:
+                        result += chunkMessage
+                    print_lg(chunkMessage or "", end="", flush=True)
+            print_lg("\n--STREAMING COMPLETE")
         else:
-            raise ValueError("Unexpected response format from API. No choices found in response.")
+            ai_check_error(completion)
+            # Handle response extraction - works with both OpenAI and OpenAI-compatible APIs
+            if hasattr(completion, 'choices') and len(completion.choices) > 0:
+                if hasattr(completion.choices[0], 'message') and hasattr(completion.choices[0].message, 'content'):
+                    result = completion.choices[0].message.content
+                else:
+                    raise ValueError("Unexpected response format from API. The response does not contain the expected structure.")
+            else:
+                raise ValueError("Unexpected response format from API. No choices found in response.")
+        return result
+
+    result = llm_request(cache_key, send)
     
     if response_format:
         result = convert_to_json(result)
     
     print_lg("\nAI Answer to Question:\n")
     print_lg(result, pretty=response_format)
+    save_cached_response(cache_key, "openai", llm_model, result)
     return result
 
 
@@ -253,87 +339,25 @@ def ai_extract_skills(client: OpenAI, job_description: str, stream: bool = strea
     * Takes in `job_description` of type `str`
     * Takes in `stream` of type `bool` to indicate if it's a streaming call
     * Returns a `dict` object representing JSON response
-    * Handles models that don't support json_schema by falling back to json_object or text mode
-    * GPT-3.5-turbo uses json_object directly (doesn't support json_schema)
+    * Uses the best structured output the model supports (see `ai_probe_capabilities()`), falls back to the next one only if the model rejects it
     """
     print_lg("-- EXTRACTING SKILLS FROM JOB DESCRIPTION")
     try:        
         prompt = extract_skills_prompt.format(job_description)
-        messages = [{"role": "user", "content": prompt}]
-        
-        # Check if model supports json_schema (GPT-4o, GPT-4 Turbo) or only json_object (GPT-3.5-turbo)
-        if model_supports_json_schema(llm_model):
-            # Try json_schema first (supported by GPT-4o, GPT-4 Turbo, etc.)
+        modes = structured_output_modes[structured_output_modes.index(get_structured_output()):]
+        for index, mode in enumerate(modes):
             try:
-                return ai_completion(client, messages, response_format=extract_skills_response_format, stream=stream)
-            except Exception as json_schema_error:
-                error_str = str(json_schema_error).lower()
-                # Check if it's the json_schema not supported error (common with GPT-OSS and local models)
-                is_json_schema_error = (
-                    "json_schema" in error_str or 
-                    "response_format" in error_str or 
-                    "400" in error_str or
-                    "not supported" in error_str or
-                    "invalid parameter" in error_str
-                )
-                
-                if is_json_schema_error:
-                    print_lg("Warning: Model doesn't support json_schema format. Falling back to json_object format...")
-                    # Fall back to json_object format (more widely supported)
-                    try:
-                        json_object_format = {"type": "json_object"}
-                        return ai_completion(client, messages, response_format=json_object_format, stream=stream)
-                    except Exception as json_object_error:
-                        error_str_obj = str(json_object_error).lower()
-                        is_json_object_error = (
-                            "json_object" in error_str_obj or 
-                            "response_format" in error_str_obj or 
-                            "400" in error_str_obj or
-                            "not supported" in error_str_obj
-                        )
-                        if is_json_object_error:
-                            print_lg("Warning: Model doesn't support json_object format. Falling back to text mode...")
-                            # Final fallback: use text mode and parse JSON from response
-                            prompt_with_json_instruction = prompt + "\n\nIMPORTANT: Respond with ONLY a valid JSON object in the exact format specified above. Do not include any markdown formatting, explanations, or additional text."
-                            messages_fallback = [{"role": "user", "content": prompt_with_json_instruction}]
-                            result = ai_completion(client, messages_fallback, response_format=None, stream=stream)
-                            # Try to parse as JSON
-                            if isinstance(result, str):
-                                return convert_to_json(result)
-                            return result
-                        else:
-                            # Different error, re-raise
-                            raise json_object_error
-                else:
-                    # Re-raise if it's a different error
-                    raise json_schema_error
-        else:
-            # GPT-3.5-turbo and models that don't support json_schema - use json_object directly
-            print_lg(f"Using json_object format for {llm_model} (json_schema not supported)...")
-            try:
-                json_object_format = {"type": "json_object"}
-                return ai_completion(client, messages, response_format=json_object_format, stream=stream)
-            except Exception as json_object_error:
-                error_str_obj = str(json_object_error).lower()
-                is_json_object_error = (
-                    "json_object" in error_str_obj or 
-                    "response_format" in error_str_obj or 
-                    "400" in error_str_obj or
-                    "not supported" in error_str_obj
-                )
-                if is_json_object_error:
-                    print_lg("Warning: Model doesn't support json_object format. Falling back to text mode...")
-                    # Final fallback: use text mode and parse JSON from response
+                if mode == "text":
+                    # Use text mode and parse JSON from response
                     prompt_with_json_instruction = prompt + "\n\nIMPORTANT: Respond with ONLY a valid JSON object in the exact format specified above. Do not include any markdown formatting, explanations, or additional text."
-                    messages_fallback = [{"role": "user", "content": prompt_with_json_instruction}]
-                    result = ai_completion(client, messages_fallback, response_format=None, stream=stream)
-                    # Try to parse as JSON
-                    if isinstance(result, str):
-                        return convert_to_json(result)
-                    return result
-                else:
-                    # Different error, re-raise
-                    raise json_object_error
+                    result = ai_completion(client, [{"role": "user", "content": prompt_with_json_instruction}], response_format=None, stream=stream)
+                    return convert_to_json(result) if isinstance(result, str) else result
+                response_format = extract_skills_response_format if mode == "json_schema" else {"type": "json_object"}
+                return ai_completion(client, [{"role": "user", "content": prompt}], response_format=response_format, stream=stream)
+            except Exception as e:
+                if mode == "text" or not is_unsupported_error(e): raise
+                print_lg(f"Warning: Model doesn't support {mode} format. Falling back to {modes[index + 1]} format...")
+                save_capabilities(llm_api_url, llm_model, modes[index + 1], supports_temperature())     # Later calls go straight to it
     except Exception as e:
         ai_error_alert(f"Error occurred while extracting skills from job description. {apiCheckInstructions}", e)
 
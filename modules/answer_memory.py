@@ -0,0 +1,213 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import os
+import re
+import ast
+import json
+
+from datetime import datetime
+from typing import Iterable, List, Literal, Optional, Tuple
+
+from config.questions import use_answer_memory, answer_memory_path, answer_memory_match
+from modules.helpers import file_lock, print_lg
+from modules.history_db import get_applied_jobs
+
+# Answers of submitted applications are remembered in `answer_memory_path` (a JSON file you can edit to fix answers),
+# keyed by normalized question label and set of options, and reused for the same or very similar questions.
+# Only select and radio answers, and text answers that are a number or yes/no are remembered. Other text and textarea answers
+# (Eg: "Why do you want to work at X?") are written for one job or company, so they are asked fresh every time.
+short_text_answer = re.compile(r"^(?:yes|no|\d+(?:[.,]\d+)?)$", re.IGNORECASE)
+__memory = None     # { key: {"question", "kind", "options", "answer", "count", "updated"} }
+__index = {}        # { (kind, options key): [(label tokens, key), ...] } for fuzzy lookup
+
+
+def normalize(text: str) -> str:
+    '''
+    Function to normalize a question label or option for matching (lower case, only letters, digits and single spaces)
+    '''
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", str(text).lower()).split())
+
+
+def get_options_key(options: Optional[Iterable[str]]) -> str:
+    '''
+    Function to get an order independent key of a question's `options`
+    '''
+    options = {normalize(option) for option in options or []}
+    return "|".join(sorted(options - {"", "select an option"}))
+
+
+def get_key(label: str, kind: str, options: Optional[Iterable[str]] = None) -> str:
+    '''
+    Function to get the key of a question in memory
+    '''
+    return f"{kind}::{normalize(label)}::{get_options_key(options)}"
+
+
+def is_rememberable(kind: str, answer: str) -> bool:
+    '''
+    Function to check if `answer` of a `kind` question can be reused for other jobs
+    '''
+    if kind in ("select", "radio"): return True
+    return kind == "text" and bool(short_text_answer.match(str(answer).strip()))
+
+
+def index_entry(key: str, entry: dict) -> None:
+    '''
+    Function to add a remembered question to the fuzzy lookup index
+    '''
+    group = __index.setdefault((entry["kind"], get_options_key(entry["options"])), [])
+    group.append((set(normalize(entry["question"]).split()), key))
+
+
+def load_memory() -> dict:
+    '''
+    Function to load remembered answers, imports answers of past applications from history on first use
+    '''
+    global __memory
+    if __memory is not None: return __memory
+    __memory = {}
+    try:
+        if os.path.exists(answer_memory_path):
+            with open(answer_memory_path, 'r', encoding='utf-8') as file:
+                __memory = json.load(file)
+            for key, entry in __memory.items(): index_entry(key, entry)
+        else:
+            import_history_answers()
+    except Exception as e:
+        print_lg(f'Failed to load remembered answers from "{answer_memory_path}"!', e)
+    return __memory
+
+
+def save_memory() -> None:
+    '''
+    Function to save remembered answers, merging answers saved meanwhile by other runs or workers.
+    * The file is locked while it's read, merged and rewritten, so parallel workers don't overwrite each other's answers
+    '''
+    try:
+        with file_lock(answer_memory_path):
+            saved = {}
+            if os.path.exists(answer_memory_path):
+                with open(answer_memory_path, 'r', encoding='utf-8') as file:
+                    saved = json.load(file)
+            for key, entry in saved.items():
+                if key not in __memory: index_entry(key, entry)
+                if key not in __memory or entry.get("updated", "") > __memory[key].get("updated", ""): __memory[key] = entry
+            temp_path = f"{answer_memory_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(__memory, file, indent=2, ensure_ascii=False)
+            os.replace(temp_path, answer_memory_path)
+    except Exception as e:
+        print_lg(f'Failed to save remembered answers to "{answer_memory_path}"!', e)
+
+
+def remember_answer(label: str, kind: str, options: Optional[List[str]], answer: str, count: int = 1) -> None:
+    '''
+    Function to remember `answer` of a question, call `save_memory()` to save it
+    '''
+    if not label or normalize(label) in ("", "unknown") or answer is None or not is_rememberable(kind, answer): return
+    memory = load_memory()
+    key = get_key(label, kind, options)
+    entry = memory.get(key)
+    if entry and entry["answer"] == answer: entry["count"] += count
+    else:
+        entry = {"question": label, "kind": kind, "options": list(options or []), "answer": answer, "count": count}
+        if key not in memory: index_entry(key, entry)
+        memory[key] = entry
+    entry["updated"] = datetime.now().isoformat()
+
+
+def recall_answer(label: str, kind: Literal["select", "radio", "text"], options: Optional[List[str]] = None) -> Optional[str]:
+    '''
+    Function to get a remembered answer of a question.
+    * Looks for the exact question first, then for the most similar question (by shared words) with the same options
+    * Answers that can't be reused for other jobs (see `is_rememberable()`), Eg: added to the file by hand or older runs, are ignored
+    * Returns `None` if nothing similar enough to `answer_memory_match` is remembered or memory is disabled
+    '''
+    if not use_answer_memory or not label: return None
+    memory = load_memory()
+    entry = memory.get(get_key(label, kind, options))
+    if entry is None and answer_memory_match < 1:
+        tokens = set(normalize(label).split())
+        best_score = answer_memory_match
+        for entry_tokens, key in __index.get((kind, get_options_key(options)), []):
+            if not tokens or not entry_tokens: continue
+            score = 2 * len(tokens & entry_tokens) / (len(tokens) + len(entry_tokens))
+            if score >= best_score: best_score, entry = score, memory[key]
+    if entry is None or not is_rememberable(kind, entry["answer"]): return None
+    print_lg(f'Using remembered answer "{entry["answer"]}" for question "{label}"')
+    return entry["answer"]
+
+
+def parse_question(question: tuple) -> Optional[Tuple[str, str, List[str], str]]:
+    '''
+    Function to parse a question saved in `questions_list` by `answer_questions()`.
+    * Returns (label, kind, options, answer) or `None` if it can't be remembered
+    '''
+    label, answer, kind = question[0], question[1], question[2]
+    if kind not in ("select", "radio", "text") or not isinstance(answer, str): return None
+    if kind == "text" and not is_rememberable(kind, answer): return None
+    options = []
+    if kind in ("select", "radio"):
+        match = re.match(r"^(.*?) \[ (.*) \]$", label, re.DOTALL)
+        if not match: return None
+        label, options_text = match.groups()
+        if kind == "select":
+            if options_text == '"List of phone country codes"': return None
+            options = re.findall(r'"([^"]*)"', options_text)
+        else:
+            options = re.findall(r'"([^"]*)"<', options_text)
+            answer_match = re.search(r'"([^"]*)"<', answer)
+            if answer_match: answer = answer_match.group(1)
+            else:   # Answers matching an option exactly are saved as the plain option text (Eg: "Yes")
+                answer = next((option for option in options if " ".join(option.split()) == " ".join(answer.split())), None)
+                if answer is None: return None
+    return label, kind, options, answer
+
+
+def learn_answers(questions_list: Optional[set], randomly_answered_questions: set) -> None:
+    '''
+    Function to remember answers of a submitted application, skipping randomly answered questions
+    '''
+    if not use_answer_memory or not questions_list: return
+    random_questions = {(str(question).lower(), kind) for question, kind in randomly_answered_questions}
+    for question in questions_list:
+        if (str(question[0]).lower(), question[2]) in random_questions: continue
+        parsed = parse_question(question)
+        if parsed:
+            label, kind, options, answer = parsed
+            remember_answer(label, kind, options, answer)
+    save_memory()
+
+
+def import_history_answers() -> None:
+    '''
+    Function to remember answers found in past applications history.
+    * Past random answers can't be told apart, so only answers given the same way in at least 2 applications are remembered
+    '''
+    counts = {}
+    for row in get_applied_jobs(["questions_found"]):
+        try: questions = ast.literal_eval(row["questions_found"] or "None")
+        except Exception: continue
+        if not isinstance(questions, (set, list, tuple)): continue
+        for question in questions:
+            parsed = parse_question(question) if isinstance(question, tuple) and len(question) >= 3 else None
+            if parsed:
+                label, kind, options, answer = parsed
+                counts[(label, kind, tuple(options), answer)] = counts.get((label, kind, tuple(options), answer), 0) + 1
+    for (label, kind, options, answer), count in sorted(counts.items(), key=lambda item: item[1]):
+        if count >= 2: remember_answer(label, kind, list(options), answer, count)
+    if __memory:
+        print_lg(f"Remembered {len(__memory)} answers from past applications.")
+        save_memory()
@@ -0,0 +1,179 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import re
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+
+Rule = Tuple[str, List[List[str]], List[str]]   # (answer key, groups of words, excluded words)
+
+salary_words = ["salary", "compensation", "ctc", "pay"]
+location_words = ["city", "location", "address"]
+
+# Rules to pick an answer for a question by words in it's label, for each question type. The first rule that matches wins.
+# A rule matches if the label contains at least one word from each group, and none of the excluded words. Words match anywhere in the label (Eg: "pay" matches "payment").
+# Answer keys are names of variables in config (Eg: "years_of_experience"), except "location", "previous_answer", "proficiency" and "hear_about_job" which are decided in runAiBot.py
+answer_rules: Dict[str, List[Rule]] = {
+    "select": [
+        ("previous_answer",     [["email", "phone"]], []),
+        ("gender",              [["gender", "sex"]], []),
+        ("disability_status",   [["disability"]], []),
+        ("proficiency",         [["proficiency"]], []),
+        ("country",             [["country"]], []),
+        ("state",               [["state"]], []),
+        ("location",            [["city", "location"]], []),
+    ],
+    "radio": [
+        ("us_citizenship",      [["citizenship", "employment eligibility"]], []),
+        ("veteran_status",      [["veteran", "protected"]], []),
+        ("disability_status",   [["disability", "handicapped"]], []),
+    ],
+    "text": [
+        ("years_of_experience", [["experience", "years"]], []),
+        ("phone_number",        [["phone", "mobile"]], []),
+        ("street",              [["street"]], []),
+        ("location",            [location_words], []),
+        ("full_name",           [["signature"]], []),   # What if question is 'name of the city or university you attend, name of referral etc?'
+        ("full_name",           [["name"], ["full"]], []),
+        ("first_name",          [["name"], ["first"]], ["last"]),
+        ("middle_name",         [["name"], ["middle"]], ["last"]),
+        ("last_name",           [["name"], ["last"]], ["first"]),
+        ("recent_employer",     [["name"], ["employer"]], []),
+        ("full_name",           [["name"]], []),
+        ("notice_period_months",[["notice"], ["month"]], []),
+        ("notice_period_weeks", [["notice"], ["week"]], []),
+        ("notice_period",       [["notice"]], []),
+        ("current_ctc_monthly", [salary_words, ["current", "present"], ["month"]], []),
+        ("current_ctc_lakhs",   [salary_words, ["current", "present"], ["lakh"]], []),
+        ("current_ctc",         [salary_words, ["current", "present"]], []),
+        ("desired_salary_monthly", [salary_words, ["month"]], []),
+        ("desired_salary_lakhs",[salary_words, ["lakh"]], []),
+        ("desired_salary",      [salary_words], []),
+        ("linkedIn",            [["linkedin"]], []),
+        ("website",             [["website", "blog", "portfolio", "link"]], []),
+        ("confidence_level",    [["scale of 1-10"]], []),
+        ("linkedin_headline",   [["headline"]], []),
+        ("hear_about_job",      [["hear", "come across"], ["this"], ["job", "position"]], []),
+        ("state",               [["state", "province"]], []),
+        ("zipcode",             [["zip", "postal", "code"]], []),
+        ("country",             [["country"]], []),
+    ],
+    "textarea": [
+        ("linkedin_summary",    [["summary"]], []),
+        ("cover_letter",        [["cover"]], []),
+    ],
+    "range": [
+        ("years_of_experience", [["experience", "years"]], []),
+        ("confidence_level",    [["scale", "1-10", "confidence"]], []),
+    ],
+}
+
+
+def compile_rules(rules: List[Rule]) -> Tuple[re.Pattern, Dict[str, Set[str]]]:
+    '''
+    Function to compile all words of `rules` into one regex that finds every word in a label in a single pass.
+    * Returns the regex, and for each word the words contained in it (Eg: "linkedin" contains "link"), as a match hides words inside it
+    '''
+    words = sorted({word for _, groups, excluded in rules for word in [*excluded, *(word for group in groups for word in group)]}, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(word) for word in words) + "))")     # Lookahead, so overlapping words are all found
+    return pattern, {word: {other for other in words if other in word} for word in words}
+
+
+compiled_rules = {question_type: compile_rules(rules) for question_type, rules in answer_rules.items()}
+
+
+def find_words(question_type: str, label: str) -> Set[str]:
+    '''
+    Function to find all words of rules for `question_type` that are in `label`
+    '''
+    pattern, contained = compiled_rules[question_type]
+    found = set()
+    for match in pattern.finditer(label.lower()): found |= contained[match.group(1)]
+    return found
+
+
+@lru_cache(maxsize=1024)
+def get_answer_key(question_type: str, label: str) -> Optional[str]:
+    '''
+    Function to get the answer key of the first rule of `question_type` ("select", "radio", "text", "textarea" or "range") matching `label`.
+    * Returns `None` if no rule matches, or there are no rules for `question_type`
+    '''
+    if question_type not in compiled_rules: return None
+    found = find_words(question_type, label)
+    if not found: return None
+    for answer_key, groups, excluded in answer_rules[question_type]:
+        if all(not found.isdisjoint(group) for group in groups) and found.isdisjoint(excluded): return answer_key
+    return None
+
+
+# Real labels seen in Easy Apply forms with the answer key they should get. Run `python -m pytest tests/test_answer_rules.py` after changing rules to check them.
+label_corpus: List[Tuple[str, str, Optional[str]]] = [
+    ("select", "Email address", "previous_answer"),
+    ("select", "Phone country code", "previous_answer"),
+    ("select", "Gender", "gender"),
+    ("select", "What is your sex?", "gender"),
+    ("select", "Do you have a disability?", "disability_status"),
+    ("select", "What is your level of proficiency in English?", "proficiency"),
+    ("select", "Country of residence", "country"),
+    ("select", "Which state do you live in?", "state"),
+    ("select", "Preferred work location", "location"),
+    ("select", "Are you legally authorized to work here?", None),
+    ("radio", "Are you a U.S. citizen? Citizenship status", "us_citizenship"),
+    ("radio", "Do you have employment eligibility in this country?", "us_citizenship"),
+    ("radio", "Are you a protected veteran?", "veteran_status"),
+    ("radio", "Are you handicapped?", "disability_status"),
+    ("radio", "Will you now or in the future require sponsorship?", None),
+    ("text", "How many years of work experience do you have with Python?", "years_of_experience"),
+    ("text", "Mobile phone number", "phone_number"),
+    ("text", "Street address line 1", "street"),
+    ("text", "City", "location"),
+    ("text", "Location (city)", "location"),
+    ("text", "Electronic signature", "full_name"),
+    ("text", "Full name", "full_name"),
+    ("text", "First name", "first_name"),
+    ("text", "Middle name", "middle_name"),
+    ("text", "Last name", "last_name"),
+    ("text", "First and last name", "full_name"),
+    ("text", "Most recent employer name", "recent_employer"),
+    ("text", "Notice period in months", "notice_period_months"),
+    ("text", "Notice period (weeks)", "notice_period_weeks"),
+    ("text", "What is your notice period?", "notice_period"),
+    ("text", "Current CTC per month", "current_ctc_monthly"),
+    ("text", "Present salary in lakhs", "current_ctc_lakhs"),
+    ("text", "What is your current compensation?", "current_ctc"),
+    ("text", "Expected monthly salary", "desired_salary_monthly"),
+    ("text", "Expected CTC in lakhs", "desired_salary_lakhs"),
+    ("text", "What are your salary expectations?", "desired_salary"),
+    ("text", "Desired pay", "desired_salary"),
+    ("text", "LinkedIn Profile", "linkedIn"),
+    ("text", "Portfolio website", "website"),
+    ("text", "GitHub link", "website"),
+    ("text", "On a scale of 1-10, how would you rate your SQL?", "confidence_level"),
+    ("text", "Headline", "linkedin_headline"),
+    ("text", "How did you hear about this job?", "hear_about_job"),
+    ("text", "Where did you come across this position?", "hear_about_job"),
+    ("text", "State or Province", "state"),
+    ("text", "ZIP / Postal code", "zipcode"),
+    ("text", "Country", "country"),
+    ("text", "What is your favourite programming paradigm?", None),
+    ("textarea", "Professional summary", "linkedin_summary"),
+    ("textarea", "Cover letter", "cover_letter"),
+    ("textarea", "Why do you want to work here?", None),
+    ("range", "Years of experience with React", "years_of_experience"),
+    ("range", "Rate your confidence in public speaking", "confidence_level"),
+    ("range", "How much do you enjoy travel?", None),
+]
+
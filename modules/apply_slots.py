@@ -0,0 +1,42 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+from config.search import switch_number
+
+# Parallel apply workers share, through a `multiprocessing.Manager`, a `dict` of:
+# "lock", "applied_jobs" { job_id: True }, "term_counts" { search term: jobs applied } and "in_progress" { search term: jobs being applied }
+# A worker reserves a slot before applying, so together they never apply to more than `switch_number` jobs of a search term.
+
+
+def reserve_apply_slot(shared: dict, job_id: str, search_term: str) -> bool:
+    '''
+    Function to reserve one of the `switch_number` applications of `search_term` across all workers.
+    * Returns `False` if job is already applied or `switch_number` of `search_term` is reached, else `True`
+    '''
+    with shared["lock"]:
+        if job_id in shared["applied_jobs"]: return False
+        if shared["term_counts"].get(search_term, 0) + shared["in_progress"].get(search_term, 0) >= switch_number: return False
+        shared["in_progress"][search_term] = shared["in_progress"].get(search_term, 0) + 1
+        return True
+
+
+def release_apply_slot(shared: dict, job_id: str, search_term: str, applied: bool) -> None:
+    '''
+    Function to release slot reserved by `reserve_apply_slot()` and count it if `applied`
+    '''
+    with shared["lock"]:
+        shared["in_progress"][search_term] -= 1
+        if applied:
+            shared["applied_jobs"][job_id] = True
+            shared["term_counts"][search_term] = shared["term_counts"].get(search_term, 0) + 1
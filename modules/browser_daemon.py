@@ -0,0 +1,131 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import os
+import shutil
+import socket
+import subprocess
+
+from time import sleep, perf_counter
+from typing import List, Optional
+
+from modules.helpers import make_directories, print_lg
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+patched_driver_name = "undetected_chromedriver.exe" if os.name == "nt" else "undetected_chromedriver"
+
+
+def is_browser_running(port: int) -> bool:
+    '''
+    Function to check if a browser is listening for remote debugging on `port` of this PC
+    '''
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+def find_chrome_binary() -> Optional[str]:
+    '''
+    Function to find Chrome or Chromium installed in this PC.
+    * Returns path of the browser, or `None` if not found
+    '''
+    chrome_path = shutil.which('chromium-browser') or shutil.which('chromium')
+    if chrome_path: return chrome_path
+    try:
+        from undetected_chromedriver import find_chrome_executable
+        chrome_path = find_chrome_executable()
+    except ImportError:
+        chrome_path = None
+    return chrome_path or shutil.which('google-chrome') or shutil.which('chrome')
+
+
+def get_patched_driver(cache_dir: str, refresh: bool = False) -> Optional[str]:
+    '''
+    Function to get chromedriver patched by undetected-chromedriver from `cache_dir`, so it's not downloaded and patched again on every start.
+    * Takes in `refresh` as `True` to download and patch it again (Eg: After Chrome updated)
+    * Returns path of the patched chromedriver, or `None` if it couldn't be cached
+    '''
+    import undetected_chromedriver as uc
+    cached_path = os.path.abspath(os.path.join(cache_dir, patched_driver_name))
+    if not refresh and uc.Patcher(executable_path=cached_path).is_binary_patched(): return cached_path
+    try:
+        make_directories([cache_dir])
+        patcher = uc.Patcher()
+        patcher.auto()
+        shutil.copy2(patcher.executable_path, cached_path)
+        print_lg(f'Saved patched chromedriver at "{cached_path}"')
+        return cached_path
+    except Exception as e:
+        print_lg("Failed to cache patched chromedriver! It will be downloaded on every start.", e)
+        return None
+
+
+def launch_browser(chrome_path: str, arguments: List[str], port: int, timeout: float = 30) -> None:
+    '''
+    Function to start Chrome as it's own process listening for remote debugging on `port`, so it stays open after this program stops.
+    * Waits at most `timeout` seconds for it to be ready
+    '''
+    # Chrome must not be a child process, else it's closed along with this program
+    detach = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP} if os.name == "nt" else {"start_new_session": True}
+    subprocess.Popen([chrome_path, f"--remote-debugging-port={port}", "--no-first-run", "--no-default-browser-check", *arguments],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **detach)
+    started = perf_counter()
+    while not is_browser_running(port):
+        if perf_counter() - started > timeout: raise TimeoutError(f"Chrome didn't start listening on port {port} in {timeout} seconds!")
+        sleep(0.25)
+
+
+def attach_browser(port: int, driver_path: Optional[str] = None) -> WebDriver:
+    '''
+    Function to control the browser already listening for remote debugging on `port`, using chromedriver at `driver_path` (Default chromedriver if `None`)
+    '''
+    options = Options()
+    options.debugger_address = f"127.0.0.1:{port}"
+    return webdriver.Chrome(options=options, service=Service(executable_path=driver_path) if driver_path else Service())
+
+
+def open_browser_daemon(arguments: List[str], port: int, driver_cache_dir: Optional[str] = None) -> WebDriver:
+    '''
+    Function to attach to the browser kept open by previous runs on `port`, or start one with Chrome `arguments` if none is running.
+    * Takes in `driver_cache_dir` to use patched chromedriver of stealth mode cached there
+    * Returns the `driver` controlling it
+    '''
+    if is_browser_running(port):
+        print_lg(f"Attaching to browser already running on port {port}...")
+    else:
+        chrome_path = find_chrome_binary()
+        if not chrome_path: raise FileNotFoundError("Couldn't find Chrome or Chromium to start the browser!")
+        print_lg(f"Starting browser at {chrome_path} on port {port}, it stays open for next runs...")
+        launch_browser(chrome_path, arguments, port)
+    driver_path = get_patched_driver(driver_cache_dir) if driver_cache_dir else None
+    try:
+        return attach_browser(port, driver_path)
+    except SessionNotCreatedException as e:
+        if not driver_path: raise e
+        print_lg("Cached chromedriver doesn't support this Chrome version, patching a new one...", e)
+        return attach_browser(port, get_patched_driver(driver_cache_dir, refresh=True))
+
+
+def detach_browser(driver: WebDriver) -> None:
+    '''
+    Function to stop controlling the browser, leaving it open with it's tabs and login for next runs
+    '''
+    driver.service.stop()
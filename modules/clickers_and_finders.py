@@ -14,6 +14,9 @@ version:    24.12.29.12.30
 
 from config.settings import click_gap, smooth_scroll
 from modules.helpers import buffer, print_lg, sleep
+from modules.waits import wait_until, wait_for_suggestions, humanize
+from modules.locators import register_locator, locate
+from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -138,10 +141,13 @@ def try_linkText(driver: WebDriver, linkText: str) -> Union[WebElement, bool]:
     except:  return False
 
 def try_find_by_classes(driver: WebDriver, classes: List[str]) -> Union[WebElement, ValueError]:
-    for cla in classes:
-        try:    return driver.find_element(By.CLASS_NAME, cla)
-        except: pass
-    raise ValueError("Failed to find an element with given classes")
+    '''
+    Finds element with any of the `classes`, trying the class that worked most often first (See modules/locators.py).
+    '''
+    name = "classes:" + ",".join(classes)
+    register_locator(name, [(By.CLASS_NAME, cla) for cla in classes])
+    try:    return locate(driver, name)
+    except NoSuchElementException: raise ValueError("Failed to find an element with given classes")
 
 def company_search_click(driver: WebDriver, actions: ActionChains, companyName: str) -> None:
     '''
@@ -151,18 +157,20 @@ def company_search_click(driver: WebDriver, actions: ActionChains, companyName:
     search = driver.find_element(By.XPATH,"(.//input[@placeholder='Add a company'])[1]")
     search.send_keys(Keys.CONTROL + "a")
     search.send_keys(companyName)
-    buffer(3)
+    wait_for_suggestions(driver)
+    humanize()
     actions.send_keys(Keys.DOWN).perform()
     actions.send_keys(Keys.ENTER).perform()
     print_lg(f'Tried searching and adding "{companyName}"')
 
 def text_input(actions: ActionChains, textInputEle: Union[WebElement, bool], value: str, textFieldName: str = "Text") -> Union[None, Exception]:
     if textInputEle:
-        sleep(1)
+        wait_until(textInputEle.parent, EC.element_to_be_clickable(textInputEle))
         # actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
         textInputEle.clear()
         textInputEle.send_keys(value.strip())
-        sleep(2)
+        wait_for_suggestions(textInputEle.parent)
+        humanize()
         actions.send_keys(Keys.ENTER).perform()
     else:
         print_lg(f'{textFieldName} input was not given!')
\ No newline at end of file
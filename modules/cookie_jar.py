@@ -0,0 +1,102 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import os
+import json
+
+from time import time
+
+from config.settings import cookie_jar_path
+from modules.helpers import make_directories, print_lg
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+login_cookie = "li_at"  # LinkedIn's session cookie, only present when logged in
+linkedin_url = "https://www.linkedin.com"
+
+# Fields of `Network.getAllCookies` accepted by `Network.setCookies`
+cookie_fields = ("name", "value", "domain", "path", "expires", "httpOnly", "secure", "sameSite", "priority", "sourceScheme", "sourcePort")
+
+
+def is_linkedin_cookie(cookie: dict) -> bool:
+    '''
+    Function to check if `cookie` belongs to LinkedIn or any of it's subdomains
+    '''
+    return cookie.get("domain", "").lstrip(".").endswith("linkedin.com")
+
+
+def is_expired(cookie: dict) -> bool:
+    '''
+    Function to check if `cookie` has expired. Session cookies never expire here, they're kept till the browser drops them
+    '''
+    expires = cookie.get("expires", -1)
+    return expires is not None and 0 < expires < time()     # Session cookies have `expires` as -1
+
+
+def save_cookies(driver: WebDriver) -> bool:
+    '''
+    Function to save LinkedIn cookies of `driver` to `cookie_jar_path`, to restore login on next start.
+    * Returns `True` if saved, else `False`
+    '''
+    try:
+        cookies = [
+            {field: cookie[field] for field in cookie_fields if field in cookie}
+            for cookie in driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+            if is_linkedin_cookie(cookie)
+        ]
+        if not any(cookie["name"] == login_cookie for cookie in cookies): return False
+        make_directories([cookie_jar_path])
+        temp_path = cookie_jar_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(cookies, file)
+        if os.name != "nt": os.chmod(temp_path, 0o600)     # Cookies log into your account, keep them private
+        os.replace(temp_path, cookie_jar_path)
+        print_lg(f'Saved login cookies to "{cookie_jar_path}"')
+        return True
+    except Exception as e:
+        print_lg("Failed to save login cookies!", e)
+        return False
+
+
+def restore_cookies(driver: WebDriver) -> bool:
+    '''
+    Function to load saved LinkedIn cookies from `cookie_jar_path` into `driver`, before it opens LinkedIn.
+    * Returns `True` if an unexpired login cookie was restored, else `False`
+    '''
+    if not os.path.exists(cookie_jar_path): return False
+    try:
+        with open(cookie_jar_path, "r", encoding="utf-8") as file:
+            cookies = [cookie for cookie in json.load(file) if not is_expired(cookie)]
+        if not any(cookie["name"] == login_cookie for cookie in cookies):
+            print_lg("Saved login cookies have expired!")
+            return False
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+        print_lg("Restored saved login cookies.")
+        return True
+    except Exception as e:
+        print_lg("Failed to restore saved login cookies!", e)
+        return False
+
+
+def has_login_cookie(driver: WebDriver) -> bool:
+    '''
+    Function to check if `driver` has an unexpired LinkedIn session cookie, without opening any page.
+    * Returns `False` if user is surely not logged-in. `True` doesn't guarantee LinkedIn still accepts the session
+    '''
+    try:
+        cookies = driver.execute_cdp_cmd("Network.getCookies", {"urls": [linkedin_url]})["cookies"]
+        return any(cookie["name"] == login_cookie and not is_expired(cookie) for cookie in cookies)
+    except Exception as e:
+        print_lg("Failed to read browser cookies, checking login from page instead.", e)
+        return True
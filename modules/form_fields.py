@@ -0,0 +1,178 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+from typing import Dict, List, Union
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+
+# Describes every question of an Easy Apply step in one call. Questions are checked for select, radio, text, textarea, range and checkbox in that order.
+# Each question gets a `data-easy-apply-field` handle that stays the same while it's on the page.
+form_fields_script = """
+function text(element) { return element ? (element.innerText || element.textContent || "").trim() : null; }
+function hiddenOr(element) { return element && element.querySelector(".visually-hidden") || element; }
+window.__easyApplyFields = window.__easyApplyFields || 0;
+return Array.from(arguments[0], function(question) {
+    var handle = question.getAttribute("data-easy-apply-field");
+    if (!handle) {
+        handle = String(++window.__easyApplyFields);
+        question.setAttribute("data-easy-apply-field", handle);
+    }
+    var field = {handle: handle, kind: null, label: null, element: null};
+
+    var select = question.querySelector("select");
+    if (select) {
+        var selected = select.options[select.selectedIndex];
+        field.kind = "select";
+        field.element = select;
+        field.label = text(question.querySelector("label span"));
+        field.options = Array.from(select.options, text);
+        field.value = selected ? text(selected) : null;
+        return field;
+    }
+
+    var radio = question.querySelector('fieldset[data-test-form-builder-radio-button-form-component="true"]');
+    if (radio) {
+        field.kind = "radio";
+        field.element = radio;
+        field.label = text(hiddenOr(radio.querySelector("span[data-test-form-builder-radio-button-form-component__title]")));
+        field.inputs = Array.from(radio.querySelectorAll("input"));
+        field.options = field.inputs.map(function(input) {
+            var label = input.id ? radio.querySelector('label[for="' + CSS.escape(input.id) + '"]') : null;
+            return {label: label ? text(label) : "Unknown", value: input.value, checked: input.checked, element: label || input};
+        });
+        return field;
+    }
+
+    var input = question.querySelector('input[type="text"]');
+    if (input) {
+        field.kind = "text";
+        field.element = input;
+        field.label = text(hiddenOr(question.querySelector("label[for]")));
+        field.value = input.value;
+        field.autocomplete = input.getAttribute("role") === "combobox" || input.hasAttribute("aria-autocomplete");
+        return field;
+    }
+
+    var textarea = question.querySelector("textarea");
+    if (textarea) {
+        field.kind = "textarea";
+        field.element = textarea;
+        field.label = text(question.querySelector("label[for]"));
+        field.value = textarea.value;
+        return field;
+    }
+
+    var range = question.querySelector('input[type="range"]');
+    var slider = range ? null : question.querySelector("div[class*='slider'], div[role*='slider'], div[class*='range']");
+    if (range || slider) {
+        if (slider) range = slider.querySelector('input[type="range"]') || slider.querySelector('input[type="hidden"]');
+        field.kind = "range";
+        field.element = range;
+        field.slider = slider;
+        field.thumb = slider ? slider.querySelector("div[class*='thumb'], div[class*='handle']") : null;
+        field.track = slider ? slider.querySelector("div[class*='track'], div[class*='rail']") : null;
+        field.label = text(hiddenOr(question.querySelector("label[for]")));
+        field.value = range ? range.value : null;
+        field.min = range ? range.getAttribute("min") : null;
+        field.max = range ? range.getAttribute("max") : null;
+        field.step = range ? range.getAttribute("step") : null;
+        return field;
+    }
+
+    var checkbox = question.querySelector('input[type="checkbox"]');
+    if (checkbox) {
+        field.kind = "checkbox";
+        field.element = checkbox;
+        field.label = text(question.querySelector("span.visually-hidden"));
+        field.option = text(question.querySelector("label[for]"));
+        field.value = checkbox.checked;
+        return field;
+    }
+    return field;
+});
+"""
+
+
+# Writes answers of many questions in one call, using native value setters and `input`/`change` events like a user typing would fire.
+# Takes { handle: value }, value is the option text for select, option index for radio, `true`/`false` for checkbox and text for others.
+write_fields_script = """
+function text(element) { return element ? (element.innerText || element.textContent || "").trim() : null; }
+function setValue(element, value) {
+    Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), "value").set.call(element, value);
+    element.dispatchEvent(new Event("input", {bubbles: true}));
+    element.dispatchEvent(new Event("change", {bubbles: true}));
+}
+var values = arguments[0];
+var results = {};
+Object.keys(values).forEach(function(handle) {
+    var question = document.querySelector('[data-easy-apply-field="' + handle + '"]');
+    var value = values[handle];
+    if (!question) return;
+    try {
+        var select = question.querySelector("select");
+        if (select) {
+            var option = Array.from(select.options).find(function(option) { return text(option) === value; });
+            if (option) setValue(select, option.value);
+            results[handle] = text(select.options[select.selectedIndex]);
+            return;
+        }
+        var radio = question.querySelector('fieldset[data-test-form-builder-radio-button-form-component="true"]');
+        if (radio) {
+            var input = radio.querySelectorAll("input")[value];
+            if (input && !input.checked) input.click();
+            results[handle] = !!input && input.checked;
+            return;
+        }
+        var field = question.querySelector('input[type="text"]') || question.querySelector("textarea") || question.querySelector('input[type="range"]');
+        if (field) {
+            setValue(field, String(value));
+            results[handle] = field.value;
+            return;
+        }
+        var checkbox = question.querySelector('input[type="checkbox"]');
+        if (checkbox) {
+            if (checkbox.checked !== value) checkbox.click();
+            results[handle] = checkbox.checked;
+        }
+    } catch (error) {}
+});
+return results;
+"""
+
+
+def read_form_fields(driver: WebDriver, questions: List[WebElement]) -> List[dict]:
+    '''
+    Function to describe all `questions` of an Easy Apply step in one script call.
+    * Returns a `list` of fields, each a `dict` with `handle`, `kind` ("select", "radio", "text", "textarea", "range", "checkbox" or `None`),
+      `label` (`None` if not found), `element` (the input) and it's current `value`.
+    * "select" and "radio" fields also have `options`, radio options are `dict`s of `label`, `value`, `checked` and `element` to click.
+    * "range" fields also have `min`, `max`, `step` and `slider`, `thumb`, `track` elements of custom sliders.
+    * "text" fields also have `autocomplete`, `True` if the input suggests values as you type.
+    * "checkbox" fields also have `option`, the text next to the checkbox.
+    '''
+    if not questions: return []
+    return driver.execute_script(form_fields_script, questions)
+
+
+def write_form_fields(driver: WebDriver, values: Dict[str, Union[str, int, bool]]) -> Dict[str, Union[str, bool]]:
+    '''
+    Function to answer many fields described by `read_form_fields()` in one script call, without typing.
+    * Takes in `values` as { handle: value }, value being the option text for "select", option index for "radio", `bool` for "checkbox" and text for others
+    * Returns { handle: value after writing } of fields that were found, "radio" and "checkbox" give if they're checked
+    * Fields that suggest values as you type (`autocomplete`) should be typed instead, else suggestions aren't shown
+    '''
+    if not values: return {}
+    return driver.execute_script(write_fields_script, values)
@@ -17,14 +17,18 @@ version:    24.12.29.12.30
 
 import os
 import json
+import atexit
+import threading
 
 from time import sleep
+from queue import Queue
 from random import randint
 from datetime import datetime, timedelta
-from pprint import pprint
-from typing import Optional, Union, List
+from pprint import pformat
+from contextlib import contextmanager
+from typing import Iterator, Literal, Optional, Union, List
 
-from config.settings import logs_folder_path
+from config.settings import logs_folder_path, log_level, log_format, log_max_size, log_backup_count
 
 
 
@@ -53,6 +57,34 @@ def make_directories(paths: List[str]) -> None:
             print(f'Error while creating directory "{path}": ', e)
 
 
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    '''
+    Context manager to hold a lock on `path` across processes, so parallel workers reading and rewriting the same file don't undo each other's changes.
+    * Locks a separate `path`.lock file, so `path` itself can be replaced while locked
+    '''
+    make_directories([path])
+    with open(path + ".lock", "a+") as lock_file:
+        if os.name == "nt":
+            import msvcrt
+            while True:
+                try:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)   # Gives up after 10 secs, so keep trying
+                    break
+                except OSError: sleep(0.1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else: fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
 def find_default_profile_directory() -> Optional[str]:
     '''
     Function to search for Chrome Profiles within default locations
@@ -75,15 +107,16 @@ def critical_error_log(possible_reason: str, stack_trace: Exception) -> None:
     '''
     Function to log and print critical errors along with datetime stamp
     '''
-    print_lg(possible_reason, stack_trace, datetime.now(), from_critical=True)
+    print_lg(possible_reason, stack_trace, datetime.now(), level="ERROR")
 
 
 def get_log_path():
     '''
-    Function to replace '//' with '/' for logs path
+    Function to replace '//' with '/' for logs path.
+    * Parallel apply workers get their own log file, set in `WORKER_LOG_NAME` (Eg: "log_worker_1.txt"), so each file is written and rotated by one process
     '''
     try:
-        path = logs_folder_path+"/log.txt"
+        path = logs_folder_path+"/"+os.getenv("WORKER_LOG_NAME", "log.txt")
         return path.replace("//","/")
     except Exception as e:
         critical_error_log("Failed getting log path! So assigning default logs path: './logs/log.txt'", e)
@@ -91,22 +124,119 @@ def get_log_path():
 
 
 __logs_file_path = get_log_path()
+__log_levels = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+__log_queue = Queue()
+__log_thread = None
+__log_thread_lock = threading.Lock()
+__log_writer_stopped = False     # Messages are then written directly, Eg: by `atexit` handlers that run after the writer is stopped
 
 
-def print_lg(*msgs: Union[str, dict], end: str = "\n", pretty: bool = False, flush: bool = False, from_critical: bool = False) -> None:
+def rotate_logs(file_path: str) -> None:
     '''
-    Function to log and print. **Note that, `end` and `flush` parameters are ignored if `pretty = True`**
+    Function to rotate `file_path` log.txt -> log.1.txt -> log.2.txt ..., keeps `log_backup_count` old logs
+    '''
+    base, extension = os.path.splitext(file_path)
+    for index in range(log_backup_count - 1, 0, -1):
+        if os.path.exists(f"{base}.{index}{extension}"):
+            os.replace(f"{base}.{index}{extension}", f"{base}.{index + 1}{extension}")
+    if log_backup_count > 0: os.replace(file_path, f"{base}.1{extension}")
+    else: os.remove(file_path)
+
+
+def log_writer() -> None:
+    '''
+    Function run by the log writer thread. Keeps log.txt open and writes queued messages in batches, rotating it by `log_max_size`.
+    '''
+    file = None
+    failed = False
+    while True:
+        batch = [__log_queue.get()]
+        while not __log_queue.empty(): batch.append(__log_queue.get_nowait())
+        try:
+            if file is None:
+                make_directories([__logs_file_path])
+                file = open(__logs_file_path, 'a', encoding="utf-8")
+            file.write("".join(text for text in batch if text is not None))
+            file.flush()
+            if log_max_size > 0 and file.tell() > log_max_size * 1024 * 1024:
+                file.close()
+                file = None
+                rotate_logs(__logs_file_path)
+            failed = False
+        except Exception as e:
+            if file: file.close()
+            file = None
+            if not failed: print(f"log.txt in {logs_folder_path} is open or is occupied by another program! Skipped saving some messages to log.txt!", e)
+            failed = True
+        for _ in batch: __log_queue.task_done()
+        if None in batch:
+            if file: file.close()
+            return
+
+
+def flush_logs() -> None:
+    '''
+    Function to wait till all queued messages are saved to log.txt
+    '''
+    if __log_thread and __log_thread.is_alive(): __log_queue.join()
+
+
+def write_log_now(text: str) -> None:
+    '''
+    Function to save `text` to log.txt right away, used once the log writer thread is stopped
     '''
     try:
-        for message in msgs:
-            pprint(message) if pretty else print(message, end=end, flush=flush)
-            with open(__logs_file_path, 'a+', encoding="utf-8") as file:
-                file.write(str(message) + end)
+        with __log_thread_lock:
+            make_directories([__logs_file_path])
+            with open(__logs_file_path, 'a', encoding="utf-8") as file: file.write(text)
     except Exception as e:
-        trail = f'Skipped saving this message: "{message}" to log.txt!' if from_critical else "We'll try one more time to log..."
-        print_lg(f"log.txt in {logs_folder_path} is open or is occupied by another program! {trail}")
-        if not from_critical:
-            critical_error_log("Log.txt is open or is occupied by another program!", e)
+        print(f"log.txt in {logs_folder_path} is open or is occupied by another program! Skipped saving this message to log.txt!", e)
+
+
+def stop_log_writer() -> None:
+    '''
+    Function to save all queued messages and stop the log writer thread. Called automatically at exit.
+    * Messages printed after this are saved to log.txt directly
+    '''
+    global __log_writer_stopped
+    with __log_thread_lock:
+        __log_writer_stopped = True
+        thread = __log_thread
+    if thread and thread.is_alive():
+        __log_queue.put(None)
+        thread.join()
+
+
+def start_log_writer() -> None:
+    '''
+    Function to start the log writer thread, if not started already
+    '''
+    global __log_thread
+    with __log_thread_lock:
+        if not __log_writer_stopped and (__log_thread is None or not __log_thread.is_alive()):
+            __log_thread = threading.Thread(target=log_writer, name="log_writer", daemon=True)
+            __log_thread.start()
+
+
+atexit.register(stop_log_writer)
+
+
+def print_lg(*msgs: Union[str, dict], end: str = "\n", pretty: bool = False, flush: bool = False,
+             level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO") -> None:
+    '''
+    Function to log and print. **Note that, `end` and `flush` parameters are ignored if `pretty = True`**
+    * Messages below `log_level` in settings are neither printed nor saved
+    * Messages are saved to log.txt by a background thread, use `flush_logs()` to wait till they are saved
+    '''
+    if __log_levels.get(level, 20) < __log_levels.get(log_level, 10): return
+    if not __log_writer_stopped and (__log_thread is None or not __log_thread.is_alive()): start_log_writer()
+    for message in msgs:
+        text = pformat(message) + "\n" if pretty else str(message) + end
+        print(text, end="", flush=flush)
+        if log_format == "json":
+            text = json.dumps({"time": datetime.now().isoformat(), "level": level, "message": text.rstrip("\n")}, default=str) + "\n"
+        if __log_writer_stopped: write_log_now(text)
+        else: __log_queue.put(text)
 #>
 
 
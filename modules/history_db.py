@@ -0,0 +1,235 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import os
+import csv
+import sqlite3
+import threading
+
+from typing import Iterable, List, Literal, Optional, Tuple
+
+from config.settings import file_name, failed_file_name, history_db_path
+from modules.helpers import print_lg, truncate_for_csv
+
+# CSV history fields can be as big as 1MB (Job descriptions, Questions found, Stack traces, etc.)
+csv.field_size_limit(1000000)
+
+
+# Column names of tables, mapped to the headers used in CSV history files
+applied_columns = {
+    "job_id": "Job ID", "title": "Title", "company": "Company", "work_location": "Work Location", "work_style": "Work Style",
+    "about_job": "About Job", "experience_required": "Experience required", "skills_required": "Skills required",
+    "hr_name": "HR Name", "hr_link": "HR Link", "resume": "Resume", "reposted": "Re-posted", "date_posted": "Date Posted",
+    "date_applied": "Date Applied", "job_link": "Job Link", "external_job_link": "External Job link",
+    "questions_found": "Questions Found", "connect_request": "Connect Request",
+}
+failed_columns = {
+    "job_id": "Job ID", "job_link": "Job Link", "resume_tried": "Resume Tried", "date_listed": "Date listed", "date_tried": "Date Tried",
+    "assumed_reason": "Assumed Reason", "stack_trace": "Stack Trace", "external_job_link": "External Job link", "screenshot_name": "Screenshot Name",
+}
+tables = {"applied_jobs": (applied_columns, file_name), "failed_jobs": (failed_columns, failed_file_name)}
+
+schema = f"""
+CREATE TABLE IF NOT EXISTS applied_jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, {", ".join(f"{column} TEXT" for column in applied_columns)});
+CREATE INDEX IF NOT EXISTS applied_jobs_job_id ON applied_jobs (job_id);
+CREATE INDEX IF NOT EXISTS applied_jobs_company ON applied_jobs (company);
+CREATE INDEX IF NOT EXISTS applied_jobs_date_applied ON applied_jobs (date_applied);
+CREATE TABLE IF NOT EXISTS failed_jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, {", ".join(f"{column} TEXT" for column in failed_columns)});
+CREATE INDEX IF NOT EXISTS failed_jobs_job_id ON failed_jobs (job_id);
+"""
+
+__local = threading.local()
+__init_lock = threading.Lock()
+__initialized = False
+
+
+def get_connection() -> sqlite3.Connection:
+    '''
+    Function to get the history database connection of current thread. Creates the database and imports CSV history on first use.
+    '''
+    global __initialized
+    connection = getattr(__local, "connection", None)
+    if connection is None:
+        directory = os.path.dirname(history_db_path)
+        if directory: os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(history_db_path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")   # Readers (app.py) don't block the writer (runAiBot.py) and vice versa
+        connection.execute("PRAGMA synchronous=NORMAL")
+        __local.connection = connection
+    with __init_lock:
+        if not __initialized:
+            connection.executescript(schema)
+            for table, (columns, csv_path) in tables.items():
+                if connection.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone() is None and os.path.exists(csv_path):
+                    import_csv_history(csv_path, table, connection)
+            __initialized = True
+    return connection
+
+
+def import_csv_history(csv_path: str, table: str = "applied_jobs", connection: Optional[sqlite3.Connection] = None) -> int:
+    '''
+    Function to import a CSV history file into `table` ("applied_jobs" or "failed_jobs").
+    * Columns missing in the CSV file are saved as empty
+    * Returns number of rows imported
+    '''
+    connection = connection or get_connection()
+    columns = tables[table][0]
+    with open(csv_path, 'r', encoding='utf-8', newline='') as file:
+        reader = csv.DictReader(file)
+        rows = [tuple(row.get(header) or "" for header in columns.values()) for row in reader]
+    with connection:
+        connection.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows)
+    print_lg(f'Imported {len(rows)} rows from "{csv_path}" into applications history database.')
+    return len(rows)
+
+
+def export_csv_history(csv_path: str, table: str = "applied_jobs") -> int:
+    '''
+    Function to export `table` ("applied_jobs" or "failed_jobs") into a CSV file with the same headers as the old CSV history files.
+    * Returns number of rows exported
+    '''
+    columns = tables[table][0]
+    cursor = get_connection().execute(f"SELECT {', '.join(columns)} FROM {table} ORDER BY id")
+    count = 0
+    with open(csv_path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(columns.values())
+        for row in cursor:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def add_job(table: str, row: dict) -> None:
+    '''
+    Function to save a job in `table` ("applied_jobs" or "failed_jobs").
+    * Takes in `row` of type `dict` with CSV headers as keys, values are saved as text
+    '''
+    columns = tables[table][0]
+    values = [None if row.get(header) is None else str(row.get(header)) for header in columns.values()]
+    connection = get_connection()
+    with connection:
+        connection.execute(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", values)
+
+
+def append_csv_history(table: str, row: dict) -> None:
+    '''
+    Function to append a job of `table` ("applied_jobs" or "failed_jobs") to it's CSV history file, used when `write_history_csv = True`.
+    * Takes in `row` of type `dict` with CSV headers as keys
+    '''
+    columns, csv_path = tables[table]
+    with open(csv_path, 'a', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=list(columns.values()))
+        if file.tell() == 0: writer.writeheader()
+        writer.writerow({header: truncate_for_csv(row.get(header)) for header in columns.values()})
+
+
+def get_applied_job_ids() -> set:
+    '''
+    Function to get a `set` of Job IDs of all applied jobs
+    '''
+    return {row[0] for row in get_connection().execute("SELECT DISTINCT job_id FROM applied_jobs")}
+
+
+def get_applied_jobs(columns: Iterable[str] = applied_columns) -> List[dict]:
+    '''
+    Function to get all applied jobs as a `list` of `dict`s with given table `columns`, in order of saving
+    '''
+    return [dict(row) for row in get_connection().execute(f"SELECT {', '.join(columns)} FROM applied_jobs ORDER BY id")]
+
+
+def query_applied_jobs(columns: Iterable[str] = applied_columns, company: Optional[str] = None, date_from: Optional[str] = None, date_to: Optional[str] = None, 
+                       application_type: Optional[Literal["easy", "external"]] = None, sort_by: str = "id", descending: bool = False, 
+                       limit: Optional[int] = None, offset: int = 0) -> Tuple[List[dict], int]:
+    '''
+    Function to get a window of applied jobs, filtered and sorted in the database.
+    * Takes in `company` to match part of company name (case-insensitive)
+    * Takes in `date_from` and `date_to` (Eg: "2024-12-31", both inclusive) to filter by date applied, jobs with 'Pending' date applied are left out
+    * Takes in `application_type` "easy" for Easy Applied jobs or "external" for jobs with external application links
+    * Takes in `sort_by` as one of the table columns, `limit` as `None` to get all rows from `offset`
+    * Returns (rows as `list` of `dict`s with given table `columns`, total number of rows matching the filters)
+    '''
+    if sort_by not in applied_columns and sort_by != "id": raise ValueError(f'Can not sort by "{sort_by}"!')
+    conditions, params = [], []
+    if company:
+        conditions.append("company LIKE ?")
+        params.append(f"%{company}%")
+    if date_from or date_to:
+        conditions.append("date_applied GLOB '[0-9]*'")
+    if date_from:
+        conditions.append("date_applied >= ?")
+        params.append(date_from)
+    if date_to:
+        conditions.append("date_applied <= ?")
+        params.append(date_to + "~")   # "~" sorts after any time on `date_to`
+    if application_type == "easy":
+        conditions.append("external_job_link = 'Easy Applied'")
+    elif application_type == "external":
+        conditions.append("external_job_link != 'Easy Applied'")
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    connection = get_connection()
+    total = connection.execute(f"SELECT COUNT(*) FROM applied_jobs {where}", params).fetchone()[0]
+    query = f"SELECT {', '.join(columns)} FROM applied_jobs {where} ORDER BY {sort_by} {'DESC' if descending else 'ASC'}, id LIMIT ? OFFSET ?"
+    rows = [dict(row) for row in connection.execute(query, params + [-1 if limit is None else limit, offset])]
+    return rows, total
+
+
+def get_history_version() -> Tuple[int, ...]:
+    '''
+    Function to get a version of the history database, which changes whenever anything is saved in it (uses modified times of database files)
+    '''
+    version = []
+    for path in (history_db_path, history_db_path + "-wal"):
+        try:
+            stat = os.stat(path)
+            version += [stat.st_mtime_ns, stat.st_size]
+        except FileNotFoundError:
+            version += [0, 0]
+    return tuple(version)
+
+
+def update_date_applied(job_id: str, date_applied: str) -> int:
+    '''
+    Function to update 'Date Applied' of applied job with `job_id`, uses the Job ID index so only matching rows are touched.
+    * Returns number of rows updated
+    '''
+    return len(update_dates_applied([job_id], date_applied))
+
+
+def update_dates_applied(job_ids: Iterable[str], date_applied: str) -> List[str]:
+    '''
+    Function to update 'Date Applied' of many applied jobs in one atomic transaction.
+    * The database write lock is taken before updating, so concurrent updates (Eg: from app.py and runAiBot.py) don't overwrite each other
+    * Returns `list` of Job IDs that were found and updated
+    '''
+    connection = get_connection()
+    updated = []
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        for job_id in dict.fromkeys(job_ids):
+            if connection.execute("UPDATE applied_jobs SET date_applied = ? WHERE job_id = ?", (date_applied, job_id)).rowcount:
+                updated.append(job_id)
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    return updated
+
+
+
+if __name__ == "__main__":
+    # Export history database to CSV files. Run from project folder as `python -m modules.history_db`
+    for table, (columns, csv_path) in tables.items():
+        print(f'Exported {export_csv_history(csv_path, table)} rows of {table} to "{csv_path}"')
@@ -0,0 +1,136 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import json
+
+from typing import List, Optional
+
+from config.settings import lean_allowed_urls
+from modules.helpers import print_lg
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+# Resources not needed to read job cards or fill forms. LinkedIn's scripts and styles (static.licdn.com) are never blocked.
+blocked_url_patterns = [
+    # Images, videos and fonts
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*media.licdn.com*", "*media-exp*.licdn.com*",
+    # Analytics, tracking beacons and ads
+    "*linkedin.com/li/track*", "*linkedin.com/realtime/realtimeFrontendClientConnectivityTracking*",
+    "*px.ads.linkedin.com*", "*snap.licdn.com*", "*ads.linkedin.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*", "*googleadservices.com*",
+    "*facebook.net*", "*facebook.com/tr*", "*bat.bing.com*", "*clarity.ms*", "*hotjar.com*", "*scorecardresearch.com*", "*omtrdc.net*", "*demdex.net*",
+]
+
+# Fallback when Chrome's network events can't be read (Eg: attached to a kept open browser). Counts bytes of resource timings,
+# which miss cross-origin resources without Timing-Allow-Origin header, so it undercounts
+start_page_stats_script = """
+performance.setResourceTimingBufferSize(10000);
+performance.clearResourceTimings();
+"""
+page_stats_script = """
+var navigation = performance.getEntriesByType('navigation')[0];
+var resources = performance.getEntriesByType('resource');
+var bytes = 0;
+if (navigation && !window.__pageStatsCounted) {
+    bytes += navigation.transferSize || 0;
+    window.__pageStatsCounted = true;
+}
+resources.forEach(function(resource) { bytes += resource.transferSize || 0; });
+performance.clearResourceTimings();
+return {bytes: bytes, resources: resources.length};
+"""
+
+page_totals = {"pages": 0, "bytes": 0, "resources": 0, "seconds": 0.0}
+
+
+def get_blocked_urls() -> List[str]:
+    '''
+    Function to get URL patterns blocked in lean browsing, leaving out patterns matching anything in `lean_allowed_urls`
+    '''
+    return [pattern for pattern in blocked_url_patterns if not any(allowed.lower() in pattern.lower() for allowed in lean_allowed_urls)]
+
+
+def enable_lean_browsing(driver: WebDriver) -> bool:
+    '''
+    Function to block images, videos, fonts, analytics and ads in `driver` using Chrome DevTools Protocol.
+    * Returns `True` if enabled, else `False`
+    '''
+    try:
+        blocked_urls = get_blocked_urls()
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
+        print_lg(f"Lean browsing enabled, blocking {len(blocked_urls)} kinds of resources.")
+        return True
+    except Exception as e:
+        print_lg("Failed to enable lean browsing! Continuing with normal browsing.", e)
+        return False
+
+
+def read_network_bytes(driver: WebDriver) -> Optional[dict]:
+    '''
+    Function to sum bytes downloaded (`encodedDataLength` of "Network.loadingFinished" events) from Chrome's performance log since it was last read.
+    * Returns `None` if the performance log isn't available, see `get_chrome_options()` in modules/open_chrome.py
+    '''
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return None
+    stats = {"bytes": 0, "resources": 0}
+    for entry in entries:
+        message = json.loads(entry["message"])["message"]
+        if message["method"] != "Network.loadingFinished": continue
+        stats["bytes"] += message["params"].get("encodedDataLength", 0)
+        stats["resources"] += 1
+    return stats
+
+
+def start_page_stats(driver: WebDriver) -> None:
+    '''
+    Function to start counting bytes of a new page, discarding what was downloaded before (Eg: while applying to jobs of the previous page)
+    '''
+    if read_network_bytes(driver) is not None: return
+    try:
+        driver.execute_script(start_page_stats_script)
+    except Exception as e:
+        print_lg("Failed to reset page stats!", e)
+
+
+def report_page_stats(driver: WebDriver, seconds: float) -> None:
+    '''
+    Function to print bytes downloaded since `start_page_stats()` for current page and the `seconds` it took to be ready, and add them to totals of this run
+    '''
+    try:
+        stats = read_network_bytes(driver) or driver.execute_script(page_stats_script)
+        stats["url"] = driver.current_url
+    except Exception as e:
+        print_lg("Failed to get page stats!", e)
+        return
+    page_totals["pages"] += 1
+    page_totals["bytes"] += stats["bytes"]
+    page_totals["resources"] += stats["resources"]
+    page_totals["seconds"] += seconds
+    print_lg(f'Page stats: {stats["bytes"] / 1024:.0f} KB in {stats["resources"]} resources, ready in {seconds:.2f} secs ({stats["url"]})')
+
+
+def print_page_stats_summary(lean_browsing: bool) -> None:
+    '''
+    Function to print average bytes and time per page of this run. Compare runs with and without `lean_browsing` to see what's saved.
+    '''
+    pages = page_totals["pages"]
+    if not pages: return
+    print_lg("Average page size / ready time: {:.0f} KB / {:.2f} secs over {} pages (Lean browsing: {})".format(
+        page_totals["bytes"] / pages / 1024, page_totals["seconds"] / pages, pages, "On" if lean_browsing else "Off"))
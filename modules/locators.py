@@ -0,0 +1,235 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import os
+import json
+import atexit
+import threading
+
+from typing import Dict, List, Optional, Tuple, Union
+
+from config.settings import locator_stats_path
+from modules.helpers import file_lock, make_directories, print_lg
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+Locator = Tuple[str, str]   # (By, value) as taken by `find_element()`
+
+# Every element the bot looks for, with candidate locators in order of preference. When LinkedIn changes it's pages, update them here.
+# Candidates that keep failing are tried last, based on stats saved in `locator_stats_path`.
+locators: Dict[str, List[Locator]] = {
+    # Login
+    "login_submit": [(By.XPATH, '//button[@type="submit" and contains(text(), "Sign in")]'), (By.CSS_SELECTOR, 'form.login__form button[type="submit"]')],
+    "saved_profile_button": [(By.CLASS_NAME, "profile__details")],
+
+    # Search results
+    "show_results_button": [(By.XPATH, '//button[contains(@aria-label, "Apply current filters to show")]'), (By.CSS_SELECTOR, "button.search-reusables__secondary-filters-show-results-button")],
+    "pagination": [(By.CLASS_NAME, "jobs-search-pagination__pages"), (By.CLASS_NAME, "artdeco-pagination"), (By.CLASS_NAME, "artdeco-pagination__pages")],
+    "active_page_button": [(By.XPATH, "//button[contains(@class, 'active')]"), (By.CSS_SELECTOR, "button[aria-current='true']")],
+
+    # Job details
+    "job_description": [(By.CLASS_NAME, "jobs-box__html-content"), (By.CLASS_NAME, "jobs-description__content"), (By.ID, "job-details")],
+    "about_company": [(By.CLASS_NAME, "jobs-company__box"), (By.CSS_SELECTOR, "section.jobs-company")],
+    "easy_apply_button": [(By.XPATH, ".//button[contains(@class,'jobs-apply-button') and contains(@class, 'artdeco-button--3') and contains(@aria-label, 'Easy')]"), (By.XPATH, ".//button[contains(@class,'jobs-apply-button') and contains(normalize-space(.), 'Easy Apply')]")],
+    "apply_button": [(By.XPATH, ".//button[contains(@class,'jobs-apply-button') and contains(@class, 'artdeco-button--3')]"), (By.XPATH, ".//button[contains(@class,'jobs-apply-button') and not(contains(@aria-label, 'Easy'))]")],
+    "inline_feedback_message": [(By.CLASS_NAME, "artdeco-inline-feedback__message")],
+
+    # Easy Apply modal
+    "easy_apply_modal": [(By.CLASS_NAME, "jobs-easy-apply-modal"), (By.CSS_SELECTOR, "div[role='dialog'][data-test-modal]")],
+    "form_questions": [(By.XPATH, ".//div[@data-test-form-element]"), (By.CLASS_NAME, "jobs-easy-apply-form-element")],
+    "resume_upload": [(By.NAME, "file"), (By.XPATH, ".//input[@type='file']")],
+    "review_button": [(By.XPATH, './/span[normalize-space(.)="Review"]'), (By.XPATH, './/footer//button[contains(@class, "artdeco-button--primary") and normalize-space(.)="Review"]')],
+    "next_button": [(By.XPATH, './/button[contains(span, "Next")]'), (By.XPATH, ".//button[@data-easy-apply-next-button]")],
+    "submit_application": [(By.XPATH, './/span[normalize-space(.)="Submit application"]'), (By.XPATH, ".//button[@data-live-test-easy-apply-submit-button]")],
+    "follow_company_checkbox": [(By.XPATH, ".//input[@id='follow-company-checkbox' and @type='checkbox']")],
+    "follow_company_label": [(By.XPATH, ".//label[@for='follow-company-checkbox']")],
+}
+
+__stats: Dict[str, Dict[str, List[int]]] = {}   # { name: { "by=value": [hits, misses] } }
+__unsaved: Dict[str, Dict[str, List[int]]] = {}  # Hits and misses since last save, added to the saved ones so parallel workers don't discard each other's
+__stats_loaded = False
+__lock = threading.Lock()
+
+
+def get_key(locator: Locator) -> str:
+    '''
+    Function to get the key `locator` is saved with in stats
+    '''
+    return "=".join(locator)
+
+
+def load_locator_stats() -> None:
+    '''
+    Function to load stats of locators saved in `locator_stats_path` by previous runs
+    '''
+    global __stats, __stats_loaded
+    __stats_loaded = True
+    if not os.path.exists(locator_stats_path): return
+    try:
+        with open(locator_stats_path, "r", encoding="utf-8") as file:
+            __stats = json.load(file)
+    except Exception as e:
+        print_lg("Failed to load locator stats, starting fresh!", e)
+
+
+def save_locator_stats() -> None:
+    '''
+    Function to add hits and misses of locators since last save to stats in `locator_stats_path`, if anything changed.
+    * The file is locked while it's read and rewritten, so stats saved meanwhile by parallel workers are kept
+    '''
+    global __stats, __unsaved
+    with __lock:
+        if not __unsaved: return
+        try:
+            with file_lock(locator_stats_path):
+                saved = {}
+                if os.path.exists(locator_stats_path):
+                    with open(locator_stats_path, "r", encoding="utf-8") as file:
+                        saved = json.load(file)
+                for name, stats in __unsaved.items():
+                    saved_stats = saved.setdefault(name, {})
+                    for key, (hits, misses) in stats.items():
+                        counts = saved_stats.setdefault(key, [0, 0])
+                        counts[0] += hits
+                        counts[1] += misses
+                temp_path = f"{locator_stats_path}.{os.getpid()}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as file:
+                    json.dump(saved, file, indent=1)
+                os.replace(temp_path, locator_stats_path)
+            __stats, __unsaved = saved, {}
+        except Exception as e:
+            print_lg("Failed to save locator stats!", e)
+
+
+def register_locator(name: str, candidates: List[Locator]) -> None:
+    '''
+    Function to add a logical element `name` with it's `candidates` to the registry, if not already present
+    '''
+    locators.setdefault(name, candidates)
+
+
+def get_ranked_locators(name: str) -> List[Locator]:
+    '''
+    Function to get candidate locators of `name`, the ones that succeeded most often first.
+    * Untried candidates rank between always failing and always succeeding ones, ties keep their order in `locators`
+    '''
+    with __lock:
+        if not __stats_loaded: load_locator_stats()
+        stats = __stats.get(name, {})
+        def score(locator: Locator) -> float:
+            hits, misses = stats.get(get_key(locator), (0, 0))
+            return (hits + 1) / (hits + misses + 2)
+        return sorted(locators[name], key=score, reverse=True)     # `sorted()` is stable
+
+
+def record_result(name: str, missed: List[Locator], found: Union[Locator, None]) -> None:
+    '''
+    Function to record that `missed` candidates of `name` failed and `found` candidate succeeded
+    '''
+    with __lock:
+        stats, unsaved = __stats.setdefault(name, {}), __unsaved.setdefault(name, {})
+        for locator in missed:
+            stats.setdefault(get_key(locator), [0, 0])[1] += 1
+            unsaved.setdefault(get_key(locator), [0, 0])[1] += 1
+        if found:
+            counts = stats.setdefault(get_key(found), [0, 0])
+            if counts[0] == 0 and found != locators[name][0]: print_lg(f'Locator "{name}" found with fallback {found}. Consider updating `locators` in modules/locators.py')
+            counts[0] += 1
+            unsaved.setdefault(get_key(found), [0, 0])[0] += 1
+
+
+def locate(parent: Union[WebDriver, WebElement], name: str) -> WebElement:
+    '''
+    Function to find element `name` of the registry in `parent`, trying it's candidates from the most successful.
+    * Raises `NoSuchElementException` if none of them is found
+    '''
+    missed = []
+    for locator in get_ranked_locators(name):
+        elements = parent.find_elements(*locator)
+        if elements:
+            record_result(name, missed, locator)
+            return elements[0]
+        missed.append(locator)
+    record_result(name, missed, None)
+    raise NoSuchElementException(f'Couldn\'t find "{name}" with any of {missed}')
+
+
+def probe(parent: Union[WebDriver, WebElement], name: str) -> Optional[WebElement]:
+    '''
+    Function to check if optional element `name` of the registry (Eg: Review button, only on the last step) is in `parent`.
+    * Only the most successful candidate is tried and only hits are recorded, as the element is often missing on purpose
+    * Returns `WebElement` if found, else `None`
+    '''
+    locator = get_ranked_locators(name)[0]
+    elements = parent.find_elements(*locator)
+    if not elements: return None
+    record_result(name, [], locator)
+    return elements[0]
+
+
+def locate_all(parent: Union[WebDriver, WebElement], name: str) -> List[WebElement]:
+    '''
+    Function to find all elements `name` of the registry in `parent`, with the first candidate that finds any.
+    * Returns an empty `list` if none are found
+    '''
+    missed = []
+    for locator in get_ranked_locators(name):
+        elements = parent.find_elements(*locator)
+        if elements:
+            record_result(name, missed, locator)
+            return elements
+        missed.append(locator)
+    record_result(name, missed, None)
+    return []
+
+
+def try_locate(parent: Union[WebDriver, WebElement], name: str, click: bool = False) -> Union[WebElement, bool]:
+    '''
+    Function to find element `name` of the registry in `parent` without raising, like `try_xp()`.
+    * Returns `WebElement` if found (`True` if `click` is `True` and it was clicked), else `False`
+    '''
+    try:
+        element = locate(parent, name)
+        if not click: return element
+        element.click()
+        return True
+    except Exception:
+        return False
+
+
+def wait_locate(parent: Union[WebDriver, WebElement], name: str, time: float = 5.0, clickable: bool = False) -> WebElement:
+    '''
+    Function to wait for a max of `time` seconds for any candidate of `name` to be found in `parent` (and be clickable if `clickable`).
+    * Raises `TimeoutException` if not found
+    '''
+    ranked = get_ranked_locators(name)
+    def find_any(_) -> Union[WebElement, bool]:
+        for index, locator in enumerate(ranked):
+            elements = parent.find_elements(*locator)
+            if elements and (not clickable or (elements[0].is_displayed() and elements[0].is_enabled())):
+                record_result(name, ranked[:index], locator)
+                return elements[0]
+        return False
+    try:
+        return WebDriverWait(parent, time).until(find_any)
+    except TimeoutException:
+        record_result(name, ranked, None)
+        raise TimeoutException(f'Couldn\'t find "{name}" with any of {ranked} in {time} seconds')
+
+
+atexit.register(save_locator_stats)
@@ -0,0 +1,49 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import re
+
+from typing import Iterable, List, Optional, Tuple
+
+
+def compile_matcher(words: Iterable[str], whole_words: bool = False) -> Optional[re.Pattern]:
+    '''
+    Function to compile a list of words or phrases into one case-insensitive regex, so a text is scanned once for all of them.
+    * Takes in `whole_words` as `True` to match only whole words (Eg: "PHP" won't match "PHPUnit")
+    * Returns `None` if `words` is empty
+    '''
+    words = sorted({word.strip() for word in words if word and word.strip()}, key=len, reverse=True)    # Longer phrases first, so they win over their prefixes
+    if not words: return None
+    pattern = "|".join(re.escape(word) for word in words)
+    if whole_words: pattern = rf"(?<!\w)(?:{pattern})(?!\w)"
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def find_all(matcher: Optional[re.Pattern], text: str) -> List[Tuple[str, int]]:
+    '''
+    Function to find every word of `matcher` in `text` in one pass.
+    * Returns a `list` of (matched text, position) in order of position
+    '''
+    if matcher is None or not text: return []
+    return [(match.group(), match.start()) for match in matcher.finditer(text)]
+
+
+def find_first(matcher: Optional[re.Pattern], text: str) -> Optional[str]:
+    '''
+    Function to find the first word of `matcher` in `text`.
+    * Returns the matched text, or `None` if nothing matched
+    '''
+    if matcher is None or not text: return None
+    match = matcher.search(text)
+    return match.group() if match else None
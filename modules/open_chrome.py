@@ -12,8 +12,11 @@ GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
 version:    24.12.29.12.30
 '''
 
+import os
+import shlex
+
 from modules.helpers import make_directories
-from config.settings import run_in_background, stealth_mode, disable_extensions, safe_mode, file_name, failed_file_name, logs_folder_path, generated_resume_path
+from config.settings import run_in_background, stealth_mode, disable_extensions, safe_mode, file_name, failed_file_name, logs_folder_path, generated_resume_path, max_wait_time, lean_browsing, log_page_stats, performance_trace, keep_browser_open, browser_debug_port, worker_profiles_path
 from config.questions import default_resume_path
 if stealth_mode:
     import undetected_chromedriver as uc
@@ -23,23 +26,61 @@ else:
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from modules.helpers import find_default_profile_directory, critical_error_log, print_lg
+from modules.lean_browsing import enable_lean_browsing
+from modules.profiler import instrument_driver
+from modules.browser_daemon import open_browser_daemon, get_patched_driver
+from selenium.common.exceptions import SessionNotCreatedException
 
-try:
-    make_directories([file_name,failed_file_name,logs_folder_path+"/screenshots",default_resume_path,generated_resume_path+"/temp"])
-
-    # Set up WebDriver with Chrome Profile
+def get_chrome_options() -> "Options":
+    '''
+    Function to get options to open Chrome with, as set in `config/settings.py`
+    '''
     options = uc.ChromeOptions() if stealth_mode else Options()
     if run_in_background:   options.add_argument("--headless")
     if disable_extensions:  options.add_argument("--disable-extensions")
 
-    if safe_mode: 
+    # Chrome's network events are read to count bytes downloaded per page (See `report_page_stats()` in modules/lean_browsing.py)
+    if log_page_stats:      options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    # Extra Chrome flags from environment, Eg: the replay benchmark in benchmarks/ points LinkedIn to it's local fixture server
+    for argument in shlex.split(os.getenv("CHROME_EXTRA_ARGS", "")): options.add_argument(argument)
+
+    # Parallel apply workers get their own Chrome profile (set by `run_parallel()` in runAiBot.py)
+    if worker_profile_dir:
+        make_directories([worker_profile_dir])
+        options.add_argument(f"--user-data-dir={os.path.abspath(worker_profile_dir)}")
+    elif keep_browser_open:
+        # Chrome doesn't allow remote debugging of it's default profile, the kept open browser gets it's own
+        make_directories([daemon_profile_dir])
+        options.add_argument(f"--user-data-dir={os.path.abspath(daemon_profile_dir)}")
+    elif safe_mode: 
         pass  # Safe mode enabled
     else:
         profile_dir = find_default_profile_directory()
         if profile_dir: options.add_argument(f"--user-data-dir={profile_dir}")
-    if stealth_mode:
-        driver = uc.Chrome(options=options)
+    return options
+
+
+try:
+    make_directories([file_name,failed_file_name,logs_folder_path+"/screenshots",default_resume_path,generated_resume_path+"/temp"])
+
+    worker_profile_dir = os.getenv("WORKER_PROFILE_DIR")
+    daemon_profile_dir = os.path.join(worker_profiles_path, "daemon")
+    driver_cache_dir = os.path.join(worker_profiles_path, "drivers") if stealth_mode else None
+
+    # Set up WebDriver with Chrome Profile
+    if keep_browser_open and not worker_profile_dir:
+        driver = open_browser_daemon(get_chrome_options().arguments, browser_debug_port, driver_cache_dir)
+    elif stealth_mode:
+        driver_path = get_patched_driver(driver_cache_dir)
+        try:
+            driver = uc.Chrome(options=get_chrome_options(), driver_executable_path=driver_path)
+        except SessionNotCreatedException as e:
+            if not driver_path: raise e
+            print_lg("Cached chromedriver doesn't support this Chrome version, patching a new one...", e)
+            driver = uc.Chrome(options=get_chrome_options(), driver_executable_path=get_patched_driver(driver_cache_dir, refresh=True))
     else: 
+        options = get_chrome_options()
         # Try to use chromium-browser if available (for Linux/WSL)
         import shutil
         chromium_path = shutil.which('chromium-browser') or shutil.which('chromium')
@@ -48,6 +89,9 @@ try:
             print_lg(f"Using Chromium browser at: {chromium_path}")
         driver = webdriver.Chrome(options=options) #, service=Service(executable_path="C:\\Program Files\\Google\\Chrome\\chromedriver-win64\\chromedriver.exe"))
     driver.maximize_window()
+    driver.set_script_timeout(max_wait_time + 5)
+    if lean_browsing: enable_lean_browsing(driver)
+    if performance_trace: instrument_driver(driver)
     wait = WebDriverWait(driver, 5)
     actions = ActionChains(driver)
 except Exception as e:
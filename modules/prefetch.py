@@ -0,0 +1,134 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import requests
+
+from html.parser import HTMLParser
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Iterable, Optional
+
+from modules.helpers import print_lg
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+job_posting_url = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{}"
+
+__session = None
+__executor = None
+__futures = {}      # { job_id: Future of description }
+
+
+class DescriptionParser(HTMLParser):
+    '''
+    Collects text of the job description markup in a LinkedIn job posting page
+    '''
+    block_tags = {"p", "br", "li", "ul", "ol", "div", "h1", "h2", "h3", "h4"}
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.depth = 0
+        self.parts = []
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if self.depth:
+            if tag != "br": self.depth += 1
+            if tag in self.block_tags: self.parts.append("\n")
+        elif tag == "div" and "show-more-less-html__markup" in (dict(attrs).get("class") or ""):
+            self.depth = 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if self.depth and tag != "br":
+            self.depth -= 1
+            if tag in self.block_tags: self.parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if self.depth: self.parts.append(data)
+
+    def get_text(self) -> str:
+        lines = [" ".join(line.split()) for line in "".join(self.parts).split("\n")]
+        return "\n".join(line for line in lines if line)
+
+
+def start_prefetch(driver: WebDriver, workers: int = 2) -> None:
+    '''
+    Function to start fetching job descriptions in background, using cookies and user agent of `driver`
+    '''
+    global __session, __executor
+    if __executor is not None: return
+    __session = requests.Session()
+    try:
+        __session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+        for cookie in driver.get_cookies():
+            __session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+    except Exception as e:
+        print_lg("Failed to copy browser session for prefetching job descriptions!", e)
+    __executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="description_prefetch")
+
+
+def stop_prefetch() -> None:
+    '''
+    Function to stop fetching job descriptions in background
+    '''
+    global __session, __executor
+    if __executor is not None: __executor.shutdown(wait=False, cancel_futures=True)
+    if __session is not None: __session.close()
+    __executor, __session = None, None
+    __futures.clear()
+
+
+def fetch_job_description(job_id: str) -> Optional[str]:
+    '''
+    Function to fetch description of job with `job_id` over HTTP, without opening it in the browser.
+    * Returns `None` if the description could not be fetched
+    '''
+    response = __session.get(job_posting_url.format(job_id), timeout=10)
+    if response.status_code != 200: return None
+    parser = DescriptionParser()
+    parser.feed(response.text)
+    return parser.get_text() or None
+
+
+def prefetch_descriptions(job_ids: Iterable[str]) -> None:
+    '''
+    Function to start fetching descriptions of `job_ids` in background, if not already started with `start_prefetch()`
+    '''
+    if __executor is None: return
+    for job_id in job_ids:
+        if job_id not in __futures: __futures[job_id] = __executor.submit(fetch_job_description, job_id)
+
+
+def get_prefetched_description(job_id: str, time: float = 0) -> Optional[str]:
+    '''
+    Function to get a prefetched job description, waits at most `time` seconds for it.
+    * A description still being fetched is kept, so it can be asked for again later
+    * Returns `None` if it's not prefetched, still being fetched or failed
+    '''
+    future: Optional[Future] = __futures.get(job_id)
+    if future is None: return None
+    try:
+        description = future.result(timeout=time)
+    except FutureTimeoutError:
+        return None
+    except Exception:
+        description = None
+    __futures.pop(job_id, None)
+    return description
+
+
+def discard_prefetched(job_id: str) -> None:
+    '''
+    Function to forget prefetched description of a job that won't be asked for (Eg: skipped or opened in browser), cancels it if not started
+    '''
+    future: Optional[Future] = __futures.pop(job_id, None)
+    if future is not None: future.cancel()
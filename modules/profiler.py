@@ -0,0 +1,156 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import os
+import json
+import atexit
+import threading
+
+from functools import wraps
+from contextlib import contextmanager
+from time import perf_counter, time_ns
+from typing import Any, Callable, Dict, Iterator, List, TextIO, Union
+
+from config.settings import performance_trace, performance_trace_path
+from modules.helpers import make_directories, print_lg
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+__span_stats: Dict[str, List[float]] = {}       # { span name: [calls, total secs, max secs] } since last summary
+__command_stats: Dict[str, List[float]] = {}    # { WebDriver command: [calls, total secs, max secs] } since last summary
+__trace_file: Union[TextIO, None] = None
+__named_threads = set()
+__lock = threading.Lock()
+
+
+def get_trace_file() -> Union[TextIO, None]:
+    '''
+    Function to open `performance_trace_path` to add events to, if not already open.
+    * Returns `None` if it couldn't be opened
+    '''
+    global __trace_file
+    if __trace_file is None:
+        try:
+            make_directories([performance_trace_path])
+            __trace_file = open(performance_trace_path, "a", encoding="utf-8", buffering=1)     # Line buffered, so every event is one write
+            if __trace_file.tell() == 0: __trace_file.write("[\n")     # Trace viewers don't need the closing "]"
+        except Exception as e:
+            print_lg(f'Failed to open performance trace "{performance_trace_path}"!', e)
+            __trace_file = False
+    return __trace_file or None
+
+
+def record(name: str, category: str, started: int, duration: float, args: Dict[str, Any]) -> None:
+    '''
+    Function to add a timing to stats of current cycle and to the trace file.
+    * `started` is wall clock time in microseconds, `duration` is in seconds
+    * Events are saved one per line in Chrome's trace event format, that https://ui.perfetto.dev, chrome://tracing and speedscope open as flame graphs
+    '''
+    thread = threading.current_thread()
+    with __lock:
+        stats = __command_stats if category == "webdriver" else __span_stats
+        counts = stats.setdefault(name, [0, 0.0, 0.0])
+        counts[0] += 1
+        counts[1] += duration
+        counts[2] = max(counts[2], duration)
+        file = get_trace_file()
+        if not file: return
+        lines = []
+        if thread.ident not in __named_threads:
+            __named_threads.add(thread.ident)
+            lines.append(json.dumps({"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": thread.ident, "args": {"name": thread.name}}))
+        lines.append(json.dumps({"name": name, "cat": category, "ph": "X", "ts": started, "dur": round(duration * 1000000),
+                                 "pid": os.getpid(), "tid": thread.ident, "args": args}, default=str))
+        file.write(",\n".join(lines) + ",\n")
+
+
+@contextmanager
+def span(name: str, category: str = "phase", **args) -> Iterator[None]:
+    '''
+    Context manager to time the code in it as phase `name`, if `performance_trace` is enabled.
+    * Extra keyword `args` are saved with the timing in trace (Eg: `span("easy_apply_step", step=2)`)
+    * Spans can be nested, trace viewers show inner spans under the outer ones
+    '''
+    if not performance_trace:
+        yield
+        return
+    started, timer = time_ns() // 1000, perf_counter()
+    try:
+        yield
+    finally:
+        record(name, category, started, perf_counter() - timer, args)
+
+
+def timed(name: str, category: str = "phase") -> Callable[[Callable], Callable]:
+    '''
+    Decorator to time every call of a function as phase `name`, if `performance_trace` is enabled
+    '''
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not performance_trace: return function(*args, **kwargs)
+            with span(name, category):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instrument_driver(driver: WebDriver) -> WebDriver:
+    '''
+    Function to count and time every WebDriver command sent by `driver` and it's elements, by command type (Eg: "executeScript", "findElements").
+    * Returns the same `driver`
+    '''
+    execute = driver.execute
+    def timed_execute(driver_command: str, params: dict = None) -> dict:
+        started, timer = time_ns() // 1000, perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            record(driver_command, "webdriver", started, perf_counter() - timer, {})
+    driver.execute = timed_execute      # Elements send their commands through their driver's `execute()`
+    return driver
+
+
+def print_performance_summary(title: str) -> None:
+    '''
+    Function to print time taken by phases and WebDriver commands since last summary, and start counting afresh.
+    * Phases include time of phases nested in them
+    '''
+    global __span_stats, __command_stats
+    with __lock:
+        span_stats, command_stats = __span_stats, __command_stats
+        __span_stats, __command_stats = {}, {}
+    if not span_stats and not command_stats: return
+    lines = [f"\nPerformance summary of {title}:"]
+    for heading, stats in (("Phase", span_stats), ("WebDriver command", command_stats)):
+        if not stats: continue
+        lines.append(f'{heading:<28}{"Calls":>8}{"Total (s)":>12}{"Avg (ms)":>11}{"Max (ms)":>11}')
+        for name, (calls, total, longest) in sorted(stats.items(), key=lambda item: item[1][1], reverse=True):
+            lines.append(f"{name:<28}{calls:>8}{total:>12.2f}{total / calls * 1000:>11.1f}{longest * 1000:>11.1f}")
+        lines.append("")
+    if __trace_file: lines.append(f'Trace saved to "{performance_trace_path}", open it in https://ui.perfetto.dev to see where time goes.')
+    print_lg("\n".join(lines))
+
+
+def close_trace() -> None:
+    '''
+    Function to close the trace file, if open
+    '''
+    global __trace_file
+    with __lock:
+        if __trace_file: __trace_file.close()
+        __trace_file = None
+
+
+atexit.register(close_trace)
@@ -44,6 +44,14 @@ def check_list(var: list, var_name: str, options: list=[], min_length: int=0) ->
         if len(options) > 0 and element not in options: raise ValueError(f'Invalid input for {var_name}. Expecting all elements to be values from {options}. This "{element}" is NOT in options!')
     return True
 
+def check_dict(var: dict, var_name: str) -> Union[bool, TypeError, ValueError]:
+    if not isinstance(var, dict): raise TypeError(f'Invalid input for {var_name}. Expecting a Dictionary!')
+    for key, value in var.items():
+        if not isinstance(key, str): raise TypeError(f'Invalid input for {var_name}. All keys in the dictionary must be strings!')
+        if isinstance(value, bool) or not isinstance(value, (int, float)): raise TypeError(f'Invalid input for {var_name}. All values in the dictionary must be numbers!')
+        if value < 0: raise ValueError(f'Invalid input for {var_name}. "{key}" can not be negative!')
+    return True
+
 
 
 from config.personals import *
@@ -100,6 +108,10 @@ def validate_questions() -> Union[None, ValueError, TypeError]:
     check_boolean(pause_before_submit, "pause_before_submit")
     check_boolean(pause_at_failed_question, "pause_at_failed_question")
     check_boolean(overwrite_previous_answers, "overwrite_previous_answers")
+    check_boolean(use_answer_memory, "use_answer_memory")
+    check_string(answer_memory_path, "answer_memory_path", min_length=1)
+    if isinstance(answer_memory_match, bool) or not isinstance(answer_memory_match, (int, float)) or not 0 <= answer_memory_match <= 1:
+        raise ValueError(f'Invalid input for answer_memory_match. Expecting a number from 0 to 1 in {__validation_file_path}!')
 
 
 from config.search import *
@@ -142,6 +154,7 @@ def validate_search() -> Union[None, ValueError, TypeError]:
     check_list(about_company_bad_words, "about_company_bad_words")
     check_list(about_company_good_words, "about_company_good_words")
     check_list(bad_words, "bad_words")
+    check_boolean(match_whole_words, "match_whole_words")
     check_boolean(security_clearance, "security_clearance")
     check_boolean(did_masters, "did_masters")
     check_int(current_experience, "current_experience", -1)
@@ -282,16 +295,50 @@ def validate_settings() -> Union[None, ValueError, TypeError]:
     check_string(file_name, "file_name", min_length=1)
     check_string(failed_file_name, "failed_file_name", min_length=1)
     check_string(logs_folder_path, "logs_folder_path", min_length=1)
+    check_string(log_level, "log_level", ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+    check_string(log_format, "log_format", ["text", "json"])
+    check_int(log_max_size, "log_max_size", 0)
+    check_int(log_backup_count, "log_backup_count", 0)
+    check_string(history_db_path, "history_db_path", min_length=1)
+    check_boolean(write_history_csv, "write_history_csv")
+    check_string(locator_stats_path, "locator_stats_path", min_length=1)
+    check_boolean(performance_trace, "performance_trace")
+    check_string(performance_trace_path, "performance_trace_path", min_length=1)
 
     check_int(click_gap, "click_gap", 0)
+    check_int(max_wait_time, "max_wait_time", 1)
+    check_dict(humanize_jitter, "humanize_jitter")
+    check_int(run_cycle_cooldown, "run_cycle_cooldown", 0)
+    check_int(parallel_workers, "parallel_workers", 0)
+    check_string(worker_profiles_path, "worker_profiles_path", min_length=1)
+    check_int(prefetch_jobs, "prefetch_jobs", 0)
+    check_boolean(keep_browser_open, "keep_browser_open")
+    check_int(browser_debug_port, "browser_debug_port", 1024)
+    check_boolean(save_login_cookies, "save_login_cookies")
+    check_string(cookie_jar_path, "cookie_jar_path", min_length=1)
 
     check_boolean(run_in_background, "run_in_background")
+    check_boolean(lean_browsing, "lean_browsing")
+    check_list(lean_allowed_urls, "lean_allowed_urls")
+    check_boolean(log_page_stats, "log_page_stats")
     check_boolean(disable_extensions, "disable_extensions")
     check_boolean(safe_mode, "safe_mode")
     check_boolean(smooth_scroll, "smooth_scroll")
     check_boolean(keep_screen_awake, "keep_screen_awake")
     check_boolean(stealth_mode, "stealth_mode")
 
+    check_int(skills_extraction_pending, "skills_extraction_pending", 1)
+    check_int(skills_extraction_timeout, "skills_extraction_timeout", 0)
+    check_boolean(llm_cache_enabled, "llm_cache_enabled")
+    check_string(llm_cache_path, "llm_cache_path", min_length=1)
+    check_int(llm_cache_ttl, "llm_cache_ttl", 0)
+    check_int(llm_cache_max_entries, "llm_cache_max_entries", 0)
+    check_int(llm_max_concurrency, "llm_max_concurrency", 1)
+    check_int(llm_requests_per_minute, "llm_requests_per_minute", 0)
+    check_int(llm_max_retries, "llm_max_retries", 0)
+    check_int(llm_retry_base_delay, "llm_retry_base_delay", 0)
+    check_string(llm_capabilities_path, "llm_capabilities_path", min_length=1)
+
 
 
 
@@ -0,0 +1,115 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+from random import uniform
+from typing import Any, Callable, Optional, Union
+
+from config.settings import max_wait_time, humanize_jitter
+from modules.helpers import print_lg, sleep
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+dom_settle_script = """
+var selector = arguments[0] instanceof Element ? null : arguments[0];
+var target = selector === null ? arguments[0] : document.querySelector(selector);
+var quietMs = arguments[1];
+var timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var quietTimer = null;
+var observer = new MutationObserver(function() {
+    if (!target) {     // Still waiting for the target to be rendered
+        target = document.querySelector(selector);
+        if (target) watch();
+        return;
+    }
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(finish, quietMs, true);
+});
+var timeoutTimer = setTimeout(finish, timeoutMs, false);
+function finish(settled) {
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(timeoutTimer);
+    done(settled);
+}
+function watch() {
+    observer.disconnect();
+    observer.observe(target, {childList: true, subtree: true, attributes: true, characterData: true});
+    quietTimer = setTimeout(finish, quietMs, true);
+}
+if (target) watch();
+else observer.observe(document.documentElement, {childList: true, subtree: true});
+"""
+
+suggestions_script = """
+return Array.from(document.querySelectorAll('[role="listbox"] [role="option"], .basic-typeahead__selectable')).some(function(option) {
+    return option.offsetParent !== null;
+});
+"""
+
+
+def get_wait_time(time: Optional[float] = None) -> float:
+    '''
+    Function to cap any wait at `max_wait_time` from settings.
+    * Returns `max_wait_time` if `time` is `None`
+    '''
+    return max_wait_time if time is None else min(time, max_wait_time)
+
+
+def wait_until(driver: WebDriver, condition: Callable[[WebDriver], Any], time: Optional[float] = None, poll: float = 0.1) -> Union[Any, bool]:
+    '''
+    Waits till `condition` (an `expected_conditions` predicate or any callable taking the driver) returns a truthy value.
+    - Returns the value returned by `condition`, else `False` if not met within `time` seconds.
+    - `time` is capped at `max_wait_time`.
+    '''
+    try:
+        return WebDriverWait(driver, get_wait_time(time), poll_frequency=poll).until(condition)
+    except TimeoutException:
+        return False
+
+
+def wait_for_dom_settle(driver: WebDriver, target: Union[str, WebElement], quiet: float = 0.3, time: Optional[float] = None) -> bool:
+    '''
+    Waits till the DOM subtree of `target` (CSS selector or `WebElement`) stops changing for `quiet` seconds.
+    - Uses a `MutationObserver` in the page, so returns as soon as the subtree is quiet.
+    - If `target` selector matches nothing yet (Eg: right after navigation), waits for it to appear first, within the same `time`.
+    - Returns `True` if settled, `False` if `target` was not found or it kept changing for `time` seconds.
+    '''
+    time = get_wait_time(time)
+    try:
+        return driver.execute_async_script(dom_settle_script, target, int(quiet * 1000), int(time * 1000))
+    except Exception as e:
+        print_lg("Failed to wait for page to settle!", e)
+        return False
+
+
+def wait_for_suggestions(driver: WebDriver, time: float = 3.0) -> bool:
+    '''
+    Waits till auto complete suggestions of a search or input box are visible.
+    - Returns `True` if visible, else `False` after `time` seconds.
+    '''
+    return bool(wait_until(driver, lambda _: driver.execute_script(suggestions_script), time))
+
+
+def humanize(site: str = "linkedin.com") -> None:
+    '''
+    Function to pause for a random human like period, configured per site in `humanize_jitter`.
+    * This is only for looking less like a bot, correctness waits must use `wait_until()` and friends.
+    * Falls back to `humanize_jitter["default"]` if `site` is not configured.
+    '''
+    max_jitter = humanize_jitter.get(site, humanize_jitter.get("default", 0))
+    if max_jitter > 0: sleep(uniform(0, max_jitter))
@@ -23,26 +23,27 @@ DEBUG_MODE_STR = os.getenv('DEBUG_MODE', 'True').lower()
 DEBUG_MODE = DEBUG_MODE_STR == 'true'
 
 # Standard library imports
-import csv
 import re
+import threading
+import multiprocessing
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from queue import Full as QueueFull
 from datetime import datetime
+from time import perf_counter
 from random import choice, shuffle, randint
 from typing import Literal, Optional, Union, List, Tuple
 
-# Set CSV field size limit to prevent field size errors
-csv.field_size_limit(1000000)  # Set to 1MB instead of default 131KB
-
 # Selenium imports
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support.select import Select
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import (
     NoSuchElementException,
     ElementClickInterceptedException,
     NoSuchWindowException,
     ElementNotInteractableException,
+    TimeoutException,
     WebDriverException
 )
 
@@ -55,9 +56,24 @@ from config.settings import *
 from modules.open_chrome import *
 from modules.helpers import *
 from modules.clickers_and_finders import *
+from modules.browser_daemon import detach_browser
+from modules.cookie_jar import save_cookies, restore_cookies, has_login_cookie
+from modules.answer_rules import get_answer_key
+from modules.form_fields import read_form_fields, write_form_fields
+from modules.locators import locate, locate_all, probe, try_locate, wait_locate, save_locator_stats
+from modules.lean_browsing import start_page_stats, report_page_stats, print_page_stats_summary
+from modules.profiler import span, timed, print_performance_summary
+from modules.matcher import compile_matcher, find_all, find_first
+from modules.prefetch import start_prefetch, stop_prefetch, prefetch_descriptions, get_prefetched_description, discard_prefetched
+from modules.answer_memory import recall_answer, learn_answers
+from modules.apply_slots import reserve_apply_slot, release_apply_slot
+from modules.history_db import add_job, append_csv_history, get_applied_job_ids as get_history_job_ids
+from modules.waits import wait_until, wait_for_dom_settle, wait_for_suggestions, humanize
 from modules.validator import validate_config
 from modules.ai.openaiConnections import ai_create_openai_client, ai_extract_skills, ai_answer_question, ai_close_openai_client
 from modules.ai.deepseekConnections import deepseek_create_client, deepseek_extract_skills, deepseek_answer_question
+from modules.ai.cache import print_cache_stats
+from modules.ai.client import print_client_stats
 from modules.ai.geminiConnections import gemini_create_client, gemini_extract_skills, gemini_answer_question
 
 # Cross-platform confirm function is imported from modules.helpers
@@ -112,6 +128,11 @@ failed_count = 0
 skip_count = 0
 dailyEasyApplyLimitReached = False
 
+bad_words_matcher = compile_matcher(bad_words, match_whole_words)
+about_company_bad_words_matcher = compile_matcher(about_company_bad_words, match_whole_words)
+about_company_good_words_matcher = compile_matcher(about_company_good_words, match_whole_words)
+clearance_words_matcher = compile_matcher(['polygraph', 'clearance', 'secret'])
+
 re_experience = re.compile(r'[(]?\s*(\d+)\s*[)]?\s*[-to]*\s*\d*[+]*\s*year[s]?', re.IGNORECASE)
 
 desired_salary_lakhs = str(round(desired_salary / 100000, 2))
@@ -127,6 +148,8 @@ notice_period_weeks = str(notice_period//7)
 notice_period = str(notice_period)
 
 aiClient = None
+skills_executor = None
+skills_slots = threading.BoundedSemaphore(max(skills_extraction_pending, 1))
 ##> ------ Dheeraj Deshwal : dheeraj9811 Email:dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Feature ------
 about_company_for_ai = None # TODO extract about company for AI
 ##<
@@ -135,17 +158,37 @@ about_company_for_ai = None # TODO extract about company for AI
 
 
 #< Login Functions
+# Checks current page for "Sign in" or "Join now" links and buttons in one call, instead of waiting on each of them
+logged_in_script = """
+if (location.href === "https://www.linkedin.com/feed/") return true;
+if (/^\\/(login|uas\\/login|checkpoint|authwall|signup)/.test(location.pathname)) return false;
+var texts = Array.from(document.querySelectorAll('a, button[type="submit"]'), function(element) { return element.textContent.trim(); });
+return !texts.some(function(text) { return text === "Sign in" || text === "Join now"; });
+"""
+
 def is_logged_in_LN() -> bool:
     '''
     Function to check if user is logged-in in LinkedIn
     * Returns: `True` if user is logged-in or `False` if not
     '''
-    if driver.current_url == "https://www.linkedin.com/feed/": return True
-    if try_linkText(driver, "Sign in"): return False
-    if try_xp(driver, '//button[@type="submit" and contains(text(), "Sign in")]'):  return False
-    if try_linkText(driver, "Join now"): return False
-    print_lg("Didn't find Sign in link, so assuming user is logged in!")
-    return True
+    if not has_login_cookie(driver): return False
+    try:
+        return driver.execute_script(logged_in_script)
+    except Exception as e:
+        print_lg("Couldn't check login from page, so assuming user is logged in!", e)
+        return True
+
+
+def open_linkedin_logged_in() -> None:
+    '''
+    Function to open LinkedIn feed logged-in, restoring saved login cookies if enabled, else logging in with `login_LN()`
+    '''
+    if save_login_cookies: restore_cookies(driver)
+    if has_login_cookie(driver):
+        driver.get("https://www.linkedin.com/feed/")
+        if is_logged_in_LN(): return print_lg("Already logged in!")
+    login_LN()
+    if save_login_cookies: save_cookies(driver)
 
 
 def login_LN() -> None:
@@ -170,10 +213,10 @@ def login_LN() -> None:
             print_lg("Couldn't find password field.")
             # print_lg(e)
         # Find the login submit button and click it
-        driver.find_element(By.XPATH, '//button[@type="submit" and contains(text(), "Sign in")]').click()
+        locate(driver, "login_submit").click()
     except Exception as e1:
         try:
-            profile_button = find_by_class(driver, "profile__details")
+            profile_button = wait_locate(driver, "saved_profile_button")
             profile_button.click()
         except Exception as e2:
             # print_lg(e1, e2)
@@ -194,17 +237,13 @@ def login_LN() -> None:
 def get_applied_job_ids() -> set:
     '''
     Function to get a `set` of applied job's Job IDs
-    * Returns a set of Job IDs from existing applied jobs history csv file
+    * Returns a set of Job IDs from applications history database
     '''
-    job_ids = set()
     try:
-        with open(file_name, 'r', encoding='utf-8') as file:
-            reader = csv.reader(file)
-            for row in reader:
-                job_ids.add(row[0])
-    except FileNotFoundError:
-        print_lg(f"The CSV file '{file_name}' does not exist.")
-    return job_ids
+        return get_history_job_ids()
+    except Exception as e:
+        print_lg(f"Failed to read applied jobs history from '{history_db_path}'!", e)
+        return set()
 
 
 
@@ -222,7 +261,8 @@ def set_search_location() -> None:
             actions.send_keys(Keys.TAB, Keys.TAB).perform()
             actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
             actions.send_keys(search_location.strip()).perform()
-            sleep(2)
+            wait_for_suggestions(driver)
+            humanize()
             actions.send_keys(Keys.ENTER).perform()
             try_xp(driver, ".//button[@aria-label='Cancel']")
         except Exception as e:
@@ -230,6 +270,7 @@ def set_search_location() -> None:
             print_lg("Failed to update search location, continuing with default location!", e)
 
 
+@timed("filters")
 def apply_filters() -> None:
     '''
     Function to apply job search filters
@@ -275,7 +316,7 @@ def apply_filters() -> None:
         multi_sel_noWait(driver, commitments)
         if benefits or commitments: buffer(recommended_wait)
 
-        show_results_button: WebElement = driver.find_element(By.XPATH, '//button[contains(@aria-label, "Apply current filters to show")]')
+        show_results_button: WebElement = locate(driver, "show_results_button")
         show_results_button.click()
 
         global pause_after_filters
@@ -293,9 +334,9 @@ def get_page_info() -> tuple[Optional[WebElement], Optional[int]]:
     Function to get pagination element and current page number
     '''
     try:
-        pagination_element = try_find_by_classes(driver, ["jobs-search-pagination__pages", "artdeco-pagination", "artdeco-pagination__pages"])
+        pagination_element = locate(driver, "pagination")
         scroll_to_view(driver, pagination_element)
-        current_page = int(pagination_element.find_element(By.XPATH, "//button[contains(@class, 'active')]").text)
+        current_page = int(locate(pagination_element, "active_page_button").text)
     except Exception as e:
         print_lg("Failed to find Pagination element, hence couldn't scroll till end!")
         pagination_element = None
@@ -305,25 +346,33 @@ def get_page_info() -> tuple[Optional[WebElement], Optional[int]]:
 
 
 
-def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_jobs: set) -> tuple[str, str, str, str, str, bool]:
+job_cards_script = """
+var cards = arguments[0] ? [arguments[0]] : document.querySelectorAll('li[data-occludable-job-id]');
+return Array.from(cards).map(function(card) {
+    var link = card.querySelector('a');
+    var subtitle = card.querySelector('.artdeco-entity-lockup__subtitle');
+    var footerState = card.querySelector('.job-card-container__footer-job-state');
+    return {
+        element: card,
+        link: link,
+        job_id: card.getAttribute('data-occludable-job-id'),
+        title: link ? link.innerText : '',
+        subtitle: subtitle ? subtitle.innerText : '',
+        metadata: Array.from(card.querySelectorAll('.job-card-container__metadata-item')).map(function(item) { return item.innerText.trim(); }),
+        footer_state: footerState ? footerState.innerText.trim() : ''
+    };
+});
+"""
+
+
+def parse_job_card(card: dict) -> dict:
     '''
-    # Function to get job main details.
-    Returns a tuple of (job_id, title, company, work_location, work_style, skip)
-    * job_id: Job ID
-    * title: Job title
-    * company: Company name
-    * work_location: Work location of this job
-    * work_style: Work style of this job (Remote, On-site, Hybrid)
-    * skip: A boolean flag to skip this job
+    Function to parse a raw job card returned by `job_cards_script` into job details.
+    * Takes in `card` of type `dict` with raw `title`, `subtitle` and `metadata` texts
+    * Returns the same `dict` updated with `title`, `company`, `work_location`, `work_style` and `rendered`
     '''
-    job_details_button = job.find_element(By.TAG_NAME, 'a')  # job.find_element(By.CLASS_NAME, "job-card-list__title")  # Problem in India
-    scroll_to_view(driver, job_details_button, True)
-    job_id = job.get_dom_attribute('data-occludable-job-id')
-    title = job_details_button.text
-    title = title[:title.find("\n")]
-    # company = job.find_element(By.CLASS_NAME, "job-card-container__primary-description").text
-    # work_location = job.find_element(By.CLASS_NAME, "job-card-container__metadata-item").text
-    other_details = job.find_element(By.CLASS_NAME, 'artdeco-entity-lockup__subtitle').text
+    title = card["title"].strip().split("\n")[0]
+    other_details = card["subtitle"].strip()
     index = other_details.find(' · ')
     company = other_details[:index] if index != -1 else other_details
     
@@ -345,41 +394,92 @@ def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_j
         work_style = "Unknown"
     
     # Fallback: Try to get location from metadata items if available
-    if not work_location or work_location == "":
-        try:
-            metadata_items = job.find_elements(By.CLASS_NAME, "job-card-container__metadata-item")
-            if metadata_items:
-                work_location = metadata_items[0].text.strip()
-                # Check if work style is in the metadata
-                for item in metadata_items:
-                    text = item.text.strip()
-                    if text in ["Remote", "On-site", "Hybrid"]:
-                        work_style = text
-                        break
-        except:
-            pass
-    
-    # If still empty, set defaults
-    if not work_location:
-        work_location = "Unknown"
-    if not work_style:
-        work_style = "Unknown"
+    metadata_items = card["metadata"]
+    if not work_location and metadata_items:
+        work_location = metadata_items[0]
+        # Check if work style is in the metadata
+        for text in metadata_items:
+            if text in ["Remote", "On-site", "Hybrid"]:
+                work_style = text
+                break
     
-    # Skip if previously rejected due to blacklist or already applied
-    skip = False
+    card.update({
+        "title": title,
+        "company": company,
+        "work_location": work_location or "Unknown",
+        "work_style": work_style or "Unknown",
+        "rendered": card["link"] is not None,
+    })
+    return card
+
+
+@timed("read_cards")
+def get_job_cards(job: Optional[WebElement] = None) -> List[dict]:
+    '''
+    Function to read all job cards of current search results page in a single WebDriver call.
+    * Takes in optional `job` of type `WebElement` to re-read only that card
+    * Returns a `list` of parsed job card `dict`s (see `parse_job_card()`)
+    '''
+    return [parse_job_card(card) for card in driver.execute_script(job_cards_script, job)]
+
+
+def render_job_card(card: dict) -> dict:
+    '''
+    Function to scroll to a job card LinkedIn hasn't rendered yet (occluded) and re-read it.
+    * Returns the updated `card`
+    '''
+    scroll_to_view(driver, card["element"], True)
+    try:
+        WebDriverWait(driver, 2).until(lambda _: card["element"].find_elements(By.TAG_NAME, "a"))
+        card.update(get_job_cards(card["element"])[0])
+    except Exception as e:
+        print_lg(f'Job card with Job ID: {card["job_id"]} did not render!')
+    return card
+
+
+def skip_job_card(card: dict, applied_jobs: set, blacklisted_companies: set, rejected_jobs: set) -> bool:
+    '''
+    Function to check if a job card can be skipped before clicking it.
+    * Returns `True` if the job is previously rejected, blacklisted or already applied, else `False`
+    '''
+    job_id = card["job_id"]
+    if job_id in rejected_jobs: 
+        print_lg(f'Skipping previously rejected job. Job ID: {job_id}!')
+        return True
+    if job_id in applied_jobs:
+        print_lg(f'Already applied to job. Job ID: {job_id}!')
+        return True
+    if not card["rendered"] and not render_job_card(card)["rendered"]:
+        print_lg(f'Skipping job that could not be read. Job ID: {job_id}!')
+        return True
+    title, company = card["title"], card["company"]
     if company in blacklisted_companies:
         print_lg(f'Skipping "{title} | {company}" job (Blacklisted Company). Job ID: {job_id}!')
-        skip = True
-    elif job_id in rejected_jobs: 
-        print_lg(f'Skipping previously rejected "{title} | {company}" job. Job ID: {job_id}!')
-        skip = True
-    try:
-        if job.find_element(By.CLASS_NAME, "job-card-container__footer-job-state").text == "Applied":
-            skip = True
-            print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
-    except: pass
+        return True
+    if card["footer_state"] == "Applied":
+        print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
+        return True
+    return False
+
+
+@timed("open_job")
+def get_job_main_details(card: dict) -> tuple[str, str, str, str, str, dict]:
+    '''
+    # Function to get job main details.
+    Clicks on the job card and returns a tuple of (job_id, title, company, work_location, work_style, details)
+    * job_id: Job ID
+    * title: Job title
+    * company: Company name
+    * work_location: Work location of this job
+    * work_style: Work style of this job (Remote, On-site, Hybrid)
+    * details: Snapshot of job details pane (see `get_job_details_snapshot()`)
+    '''
+    job_details_button = card["link"]  # job.find_element(By.CLASS_NAME, "job-card-list__title")  # Problem in India
+    job_id, title, company = card["job_id"], card["title"], card["company"]
+    work_location, work_style = card["work_location"], card["work_style"]
+    scroll_to_view(driver, job_details_button, True)
     try: 
-        if not skip: job_details_button.click()
+        job_details_button.click()
     except Exception as e:
         print_lg(f'Failed to click "{title} | {company}" job on details button. Job ID: {job_id}!') 
         # print_lg(e)
@@ -387,111 +487,140 @@ def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_j
         job_details_button.click() # To pass the error outside
     buffer(click_gap)
     
-    # After clicking, try to get more accurate location and work style from job details page
-    if not skip:
-        try:
-            # Wait for job details page to load
-            sleep(1.5)
-            # Try to get location from job details page using the tertiary description container
-            try:
-                tertiary_container = driver.find_element(By.CLASS_NAME, "job-details-jobs-unified-top-card__tertiary-description-container")
-                # Get the first span with class 'tvm__text tvm__text--low-emphasis' which contains location
-                # The structure is: <span class="tvm__text tvm__text--low-emphasis">Seattle, WA</span>
-                location_spans = tertiary_container.find_elements(By.XPATH, ".//span[contains(@class, 'tvm__text') and contains(@class, 'tvm__text--low-emphasis')]")
-                if location_spans:
-                    # First span usually contains the location (e.g., "Seattle, WA")
-                    location_text = location_spans[0].text.strip()
-                    # Clean up the text (remove any HTML comments or extra whitespace)
-                    location_text = ' '.join(location_text.split())
-                    if location_text and location_text != "" and not location_text.startswith("·"):
-                        # Check if it looks like a location (contains comma or is a city/state format)
-                        if ',' in location_text or (len(location_text.split()) <= 3 and any(char.isalpha() for char in location_text)):
-                            work_location = location_text
-            except Exception as e:
-                # Try alternative method: look for location in the primary description container
-                try:
-                    primary_container = driver.find_element(By.CLASS_NAME, "job-details-jobs-unified-top-card__primary-description-container")
-                    # Look for location text in various spans
-                    all_spans = primary_container.find_elements(By.XPATH, ".//span[contains(@class, 'tvm__text')]")
-                    for span in all_spans:
-                        text = span.text.strip()
-                        text = ' '.join(text.split())
-                        # Check if it looks like a location (city, state format)
-                        if text and ',' in text and len(text.split(',')) == 2:
-                            parts = text.split(',')
-                            if len(parts[0].split()) <= 3 and len(parts[1].strip().split()) <= 2:
-                                work_location = text
-                                break
-                except:
-                    pass
-            
-            # Try to get work style from the page
-            if work_style == "Unknown" or work_style == "":
-                try:
-                    # Look for work style in the tertiary container or nearby elements
-                    try:
-                        tertiary_container = driver.find_element(By.CLASS_NAME, "job-details-jobs-unified-top-card__tertiary-description-container")
-                        container_text = tertiary_container.text
-                        for style in ["Remote", "On-site", "Hybrid"]:
-                            if style in container_text:
-                                work_style = style
-                                break
-                    except:
-                        pass
-                    
-                    # Also try looking in the primary description area
-                    if work_style == "Unknown" or work_style == "":
-                        try:
-                            primary_container = driver.find_element(By.CLASS_NAME, "job-details-jobs-unified-top-card__primary-description-container")
-                            container_text = primary_container.text
-                            for style in ["Remote", "On-site", "Hybrid"]:
-                                if style in container_text:
-                                    work_style = style
-                                    break
-                        except:
-                            pass
-                    
-                    # Fallback: search the entire job details area
-                    if work_style == "Unknown" or work_style == "":
-                        try:
-                            work_style_elements = driver.find_elements(By.XPATH, "//span[contains(text(), 'Remote') or contains(text(), 'On-site') or contains(text(), 'Hybrid')]")
-                            for elem in work_style_elements:
-                                text = elem.text.strip()
-                                if text in ["Remote", "On-site", "Hybrid"]:
-                                    work_style = text
-                                    break
-                        except:
-                            pass
-                except:
-                    pass
-        except:
-            pass  # If extraction fails, use the values from job card
+    # After clicking, get more accurate location and work style from job details pane
+    details = get_job_details_snapshot(job_id)
+    work_location, work_style = get_work_location_and_style(details, work_location, work_style)
+    
+    return (job_id,title,company,work_location,work_style,details)
+
+
+job_details_script = """
+var jobId = arguments[0];
+var waitForJob = arguments[1];
+function first(selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var element = document.querySelector(selectors[i]);
+        if (element) return element;
+    }
+    return null;
+}
+function text(element) { return element ? element.innerText.trim() : null; }
+function texts(root, selector) {
+    return root ? Array.from(root.querySelectorAll(selector)).map(function(element) { return element.innerText.trim(); }) : [];
+}
+var description = document.querySelector('.jobs-box__html-content');
+if (waitForJob) {
+    var onJobPage = location.pathname.indexOf('/jobs/view/' + jobId) === 0;
+    if (!description || !(onJobPage || document.querySelector('.job-details-jobs-unified-top-card__job-title a[href*="/jobs/view/' + jobId + '"]'))) return null;
+}
+var topCard = first([
+    '.job-details-jobs-unified-top-card__primary-description-container',
+    '.job-details-jobs-unified-top-card__primary-description',
+    '.jobs-unified-top-card__primary-description',
+    '.jobs-details__main-content'
+]);
+var tertiary = document.querySelector('.job-details-jobs-unified-top-card__tertiary-description-container');
+var primary = document.querySelector('.job-details-jobs-unified-top-card__primary-description-container');
+var posted = topCard ? Array.from(topCard.querySelectorAll('span')).find(function(span) {
+    return span.textContent.replace(/\\s+/g, ' ').trim().indexOf(' ago') !== -1;
+}) : null;
+// Work style is only looked for in the top card and job insights, by `textContent`, as `innerText` of every span in the page forces layout
+var workStyleSpan = Array.from(document.querySelectorAll(
+    '.job-details-preferences-and-skills span, .job-details-fit-level-preferences span, ' +
+    '.job-details-jobs-unified-top-card__job-insight span, .job-details-jobs-unified-top-card__primary-description-container span'
+)).find(function(span) {
+    return ['Remote', 'On-site', 'Hybrid'].indexOf(span.textContent.trim()) !== -1;
+});
+var hirer = document.querySelector('.hirer-card__hirer-information');
+var hirerLink = hirer ? hirer.querySelector('a') : null;
+return {
+    tertiary_text: text(tertiary),
+    tertiary_spans: texts(tertiary, 'span.tvm__text.tvm__text--low-emphasis'),
+    primary_text: text(primary),
+    primary_spans: texts(primary, 'span.tvm__text'),
+    work_style: workStyleSpan ? workStyleSpan.textContent.trim() : null,
+    top_card_text: text(topCard),
+    time_posted_text: text(posted),
+    hr_name: hirer ? text(hirer.querySelector('span')) : null,
+    hr_link: hirerLink ? hirerLink.href : null,
+    title: text(document.querySelector('.job-details-jobs-unified-top-card__job-title')),
+    company: text(document.querySelector('.job-details-jobs-unified-top-card__company-name')),
+    about_company: text(document.querySelector('.jobs-company__box')),
+    description: text(description),
+    applied: document.querySelector('.jobs-s-apply__application-link') !== null
+};
+"""
+
+
+@timed("load_details")
+def get_job_details_snapshot(job_id: str, time: float = 5.0) -> dict:
+    '''
+    Function to read the job details pane in a single script evaluation.
+    * Waits for a max of `time` seconds till the pane shows job `job_id`, then takes snapshot of whatever is loaded
+    * Returns a `dict` with `tertiary_text`, `tertiary_spans`, `primary_text`, `primary_spans`, `work_style`, `top_card_text`, 
+      `time_posted_text`, `hr_name`, `hr_link`, `title`, `company`, `about_company`, `description` (`None` if not found) and `applied`
+    '''
+    try:
+        return WebDriverWait(driver, time, poll_frequency=0.2).until(lambda _: driver.execute_script(job_details_script, job_id, True))
+    except TimeoutException:
+        print_lg(f'Job details of Job ID: {job_id} did not load in {time} seconds, using whatever is loaded!')
+        return driver.execute_script(job_details_script, job_id, False)
+
+
+def get_work_location_and_style(details: dict, work_location: str, work_style: str) -> tuple[str, str]:
+    '''
+    Function to get work location and work style from job details snapshot.
+    * Falls back to given `work_location` and `work_style` from job card if not found
+    * Returns a tuple of (work_location, work_style)
+    '''
+    if details["tertiary_text"] is not None:
+        if details["tertiary_spans"]:
+            # First span usually contains the location (e.g., "Seattle, WA")
+            location_text = ' '.join(details["tertiary_spans"][0].split())
+            if location_text and not location_text.startswith("·"):
+                # Check if it looks like a location (contains comma or is a city/state format)
+                if ',' in location_text or (len(location_text.split()) <= 3 and any(char.isalpha() for char in location_text)):
+                    work_location = location_text
+    else:
+        # Look for location (city, state format) in the primary description container
+        for text in details["primary_spans"]:
+            text = ' '.join(text.split())
+            parts = text.split(',')
+            if len(parts) == 2 and len(parts[0].split()) <= 3 and len(parts[1].strip().split()) <= 2:
+                work_location = text
+                break
+    
+    if work_style == "Unknown" or work_style == "":
+        for container_text in [details["tertiary_text"], details["primary_text"]]:
+            for style in ["Remote", "On-site", "Hybrid"]:
+                if container_text and style in container_text:
+                    return work_location, style
+        # Fallback: search the entire job details area
+        if details["work_style"]: work_style = details["work_style"]
     
-    return (job_id,title,company,work_location,work_style,skip)
+    return work_location, work_style
 
 
 # Function to check for Blacklisted words in About Company
-def check_blacklist(rejected_jobs: set, job_id: str, company: str, blacklisted_companies: set) -> Union[Tuple[set, set, WebElement], ValueError]:
-    jobs_top_card = try_find_by_classes(driver, ["job-details-jobs-unified-top-card__primary-description-container","job-details-jobs-unified-top-card__primary-description","jobs-unified-top-card__primary-description","jobs-details__main-content"])
-    about_company_org = find_by_class(driver, "jobs-company__box")
-    scroll_to_view(driver, about_company_org)
-    about_company_org = about_company_org.text
-    about_company = about_company_org.lower()
-    skip_checking = False
-    for word in about_company_good_words:
-        if word.lower() in about_company:
-            print_lg(f'Found the word "{word}". So, skipped checking for blacklist words.')
-            skip_checking = True
-            break
-    if not skip_checking:
-        for word in about_company_bad_words: 
-            if word.lower() in about_company: 
-                rejected_jobs.add(job_id)
-                blacklisted_companies.add(company)
-                raise ValueError(f'\n"{about_company_org}"\n\nContains "{word}".')
+@timed("blacklist_check")
+def check_blacklist(rejected_jobs: set, job_id: str, company: str, blacklisted_companies: set, details: dict) -> Union[Tuple[set, set], ValueError]:
+    about_company_org = details["about_company"]
+    if about_company_org is None:
+        # About Company section is lazy loaded, scroll to it if it wasn't in the snapshot
+        about_company_ele = wait_locate(driver, "about_company")
+        scroll_to_view(driver, about_company_ele)
+        about_company_org = about_company_ele.text
+    good_word = find_first(about_company_good_words_matcher, about_company_org)
+    if good_word:
+        print_lg(f'Found the word "{good_word}". So, skipped checking for blacklist words.')
+    else:
+        bad_word = find_first(about_company_bad_words_matcher, about_company_org)
+        if bad_word: 
+            rejected_jobs.add(job_id)
+            blacklisted_companies.add(company)
+            raise ValueError(f'\n"{about_company_org}"\n\nContains "{bad_word}".')
     buffer(click_gap)
-    scroll_to_view(driver, jobs_top_card)
-    return rejected_jobs, blacklisted_companies, jobs_top_card
+    return rejected_jobs, blacklisted_companies
 
 
 
@@ -506,7 +635,44 @@ def extract_years_of_experience(text: str) -> int:
 
 
 
-def get_job_description(
+def screen_job_description(jobDescription: str) -> tuple[
+    Union[int, Literal['Unknown']],
+    bool,
+    Optional[str],
+    Optional[str]
+    ]:
+    '''
+    Function to check if a job can be skipped from it's description, using `bad_words`, `security_clearance` and `current_experience`.
+    ### Returns:
+    - `experience_required: int | 'Unknown'`
+    - `skip: bool`
+    - `skipReason: Optional[str]`
+    - `skipMessage: Optional[str]`
+    '''
+    experience_required = "Unknown"
+    found_masters = 0
+    jobDescriptionLow = jobDescription.lower()
+    
+    found_bad_words = find_all(bad_words_matcher, jobDescription)
+    if found_bad_words:
+        words = ", ".join(sorted({f'"{word}"' for word, _ in found_bad_words}))
+        skipMessage = f'\n{jobDescription}\n\nContains bad word {words}. Skipping this job!\n'
+        return experience_required, True, "Found a Bad Word in About Job", skipMessage
+    if security_clearance == False and find_first(clearance_words_matcher, jobDescription):
+        skipMessage = f'\n{jobDescription}\n\nFound "Clearance" or "Polygraph". Skipping this job!\n'
+        return experience_required, True, "Asking for Security clearance", skipMessage
+    if did_masters and 'master' in jobDescriptionLow:
+        print_lg(f'Found the word "master" in \n{jobDescription}')
+        found_masters = 2
+    experience_required = extract_years_of_experience(jobDescription)
+    if current_experience > -1 and experience_required > current_experience + found_masters:
+        skipMessage = f'\n{jobDescription}\n\nExperience required {experience_required} > Current Experience {current_experience + found_masters}. Skipping this job!\n'
+        return experience_required, True, "Required experience is high", skipMessage
+    return experience_required, False, None, None
+
+
+@timed("description_filter")
+def get_job_description(details: dict
 ) -> tuple[
     Union[str, Literal['Unknown']],
     Union[int, Literal['Unknown']],
@@ -516,7 +682,7 @@ def get_job_description(
     ]:
     '''
     # Job Description
-    Function to extract job description from About the Job.
+    Function to extract job description from About the Job of job details snapshot `details`.
     ### Returns:
     - `jobDescription: str | 'Unknown'`
     - `experience_required: int | 'Unknown'`
@@ -527,36 +693,16 @@ def get_job_description(
     # Initialize default values
     jobDescription = "Unknown"
     experience_required = "Unknown"
-    found_masters = 0
     skip = False
     skipReason = None
     skipMessage = None
     
     try:
         ##> ------ Dheeraj Deshwal : dheeraj9811 Email:dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Feature ------
-        jobDescription = find_by_class(driver, "jobs-box__html-content").text
+        jobDescription = details["description"]
+        if jobDescription is None: jobDescription = wait_locate(driver, "job_description").text
         ##<
-        jobDescriptionLow = jobDescription.lower()
-        
-        for word in bad_words:
-            if word.lower() in jobDescriptionLow:
-                skipMessage = f'\n{jobDescription}\n\nContains bad word "{word}". Skipping this job!\n'
-                skipReason = "Found a Bad Word in About Job"
-                skip = True
-                break
-        if not skip and security_clearance == False and ('polygraph' in jobDescriptionLow or 'clearance' in jobDescriptionLow or 'secret' in jobDescriptionLow):
-            skipMessage = f'\n{jobDescription}\n\nFound "Clearance" or "Polygraph". Skipping this job!\n'
-            skipReason = "Asking for Security clearance"
-            skip = True
-        if not skip:
-            if did_masters and 'master' in jobDescriptionLow:
-                print_lg(f'Found the word "master" in \n{jobDescription}')
-                found_masters = 2
-            experience_required = extract_years_of_experience(jobDescription)
-            if current_experience > -1 and experience_required > current_experience + found_masters:
-                skipMessage = f'\n{jobDescription}\n\nExperience required {experience_required} > Current Experience {current_experience + found_masters}. Skipping this job!\n'
-                skipReason = "Required experience is high"
-                skip = True
+        experience_required, skip, skipReason, skipMessage = screen_job_description(jobDescription)
     except Exception as e:
         if jobDescription == "Unknown":
             print_lg("Unable to extract job description!")
@@ -566,16 +712,48 @@ def get_job_description(
             # print_lg(e)
     
     return jobDescription, experience_required, skip, skipReason, skipMessage
+
+
+def skip_prefetched_job(card: dict, rejected_jobs: set) -> bool:
+    '''
+    Function to check if a job can be skipped without clicking it, from it's description fetched in background by `prefetch_descriptions()`.
+    * Returns `True` if the job is rejected by `screen_job_description()`, `False` if not or if description is not prefetched yet
+    '''
+    global skip_count
+    job_id = card["job_id"]
+    description = get_prefetched_description(job_id)
+    if description is None: return False
+    try:
+        _, skip, reason, message = screen_job_description(description)
+    except Exception as e:
+        return False
+    if not skip: return False
+    print_lg(f'Skipping "{card["title"]} | {card["company"]}" job without opening it. Job ID: {job_id}!', message)
+    failed_job(job_id, "https://www.linkedin.com/jobs/view/"+job_id, "Pending", "Unknown", reason, message, "Skipped", "Not Available")
+    rejected_jobs.add(job_id)
+    skip_count += 1
+    return True
         
 
 
 # Function to upload resume
 def upload_resume(modal: WebElement, resume: str) -> tuple[bool, str]:
     try:
-        modal.find_element(By.NAME, "file").send_keys(os.path.abspath(resume))
+        locate(modal, "resume_upload").send_keys(os.path.abspath(resume))
         return True, os.path.basename(default_resume_path)
     except: return False, "Previous resume"
 
+def get_rule_answer(answer_key: str, work_location: str) -> str:
+    '''
+    Function to get the answer for `answer_key` of a rule in modules/answer_rules.py
+    '''
+    if answer_key == "location":
+        # Use formatted location (city, state) if available, otherwise fall back to work_location
+        return formatted_location if formatted_location else (current_city if current_city else work_location)
+    if answer_key == "proficiency": return 'Professional'
+    if answer_key == "hear_about_job": return "https://github.com/GodsScion/Auto_job_applier_linkedIn"
+    return globals()[answer_key]     # Name of a variable in config
+
 # Function to answer common questions for Easy Apply
 def answer_common_questions(label: str, answer: str) -> str:
     if 'sponsorship' in label or 'visa' in label: answer = require_visa
@@ -583,61 +761,41 @@ def answer_common_questions(label: str, answer: str) -> str:
 
 
 # Function to answer the questions for Easy Apply
+@timed("answer_questions")
 def answer_questions(modal: WebElement, questions_list: set, work_location: str, job_description: Optional[str] = None ) -> set:
-    # Get all questions from the page
+    # Get all questions from the page, and describe them in one call
      
-    all_questions = modal.find_elements(By.XPATH, ".//div[@data-test-form-element]")
+    all_questions = locate_all(modal, "form_questions")
     # all_questions = modal.find_elements(By.CLASS_NAME, "jobs-easy-apply-form-element")
     # all_list_questions = modal.find_elements(By.XPATH, ".//div[@data-test-text-entity-list-form-component]")
     # all_single_line_questions = modal.find_elements(By.XPATH, ".//div[@data-test-single-line-text-form-component]")
     # all_questions = all_questions + all_list_questions + all_single_line_questions
 
-    for Question in all_questions:
+    writes = {}     # { handle: answer } written together after deciding all answers
+    written = []    # [ (handle, question, type, previous answer) ] added to `questions_list` after writing
+    for field in read_form_fields(driver, all_questions):
+        label_org = "Unknown" if field["label"] is None else field["label"]
         # Check if it's a select Question
-        select = try_xp(Question, ".//select", False)
-        if select:
-            label_org = "Unknown"
-            try:
-                label = Question.find_element(By.TAG_NAME, "label")
-                label_org = label.find_element(By.TAG_NAME, "span").text
-            except: pass
+        if field["kind"] == "select":
             answer = 'Yes'
             label = label_org.lower()
-            select = Select(select)
-            selected_option = select.first_selected_option.text
+            selected_option = field["value"]
             optionsText = []
             options = '"List of phone country codes"'
             if label != "phone country code":
-                optionsText = [option.text for option in select.options]
+                optionsText = field["options"]
                 options = "".join([f' "{option}",' for option in optionsText])
             prev_answer = selected_option
             if overwrite_previous_answers or selected_option == "Select an option":
                 ##> ------ WINDY_WINDWARD Email:karthik.sarode23@gmail.com - Added fuzzy logic to answer location based questions ------
-                if 'email' in label or 'phone' in label: 
+                answer_key = get_answer_key("select", label)
+                if answer_key == "previous_answer": 
                     answer = prev_answer
-                elif 'gender' in label or 'sex' in label: 
-                    answer = gender
-                elif 'disability' in label: 
-                    answer = disability_status
-                elif 'proficiency' in label: 
-                    answer = 'Professional'
-                # Add location handling
-                elif any(loc_word in label for loc_word in ['location', 'city', 'state', 'country']):
-                    if 'country' in label:
-                        answer = country 
-                    elif 'state' in label:
-                        answer = state
-                    elif 'city' in label:
-                        # Use formatted location (city, state) if available, otherwise fall back to work_location
-                        answer = formatted_location if formatted_location else (current_city if current_city else work_location)
-                    else:
-                        # For general location questions, use formatted location
-                        answer = formatted_location if formatted_location else (current_city if current_city else work_location)
+                elif answer_key:
+                    answer = get_rule_answer(answer_key, work_location)
                 else: 
-                    answer = answer_common_questions(label,answer)
-                try: 
-                    select.select_by_visible_text(answer)
-                except NoSuchElementException as e:
+                    answer = answer_common_questions(label, recall_answer(label_org, "select", optionsText) or answer)
+                if answer not in field["options"]:
                     # Define similar phrases for common answers
                     possible_answer_phrases = []
                     if answer == 'Decline':
@@ -660,62 +818,50 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                         for option in optionsText:
                             # Check if phrase is in option or option is in phrase (bidirectional matching)
                             if phrase.lower() in option.lower() or option.lower() in phrase.lower():
-                                select.select_by_visible_text(option)
                                 answer = option
                                 foundOption = True
                                 break
                     if not foundOption:
                         #TODO: Use AI to answer the question need to be implemented logic to extract the options for the question
                         print_lg(f'Failed to find an option with text "{answer}" for question labelled "{label_org}", answering randomly!')
-                        select.select_by_index(randint(1, len(select.options)-1))
-                        answer = select.first_selected_option.text
+                        answer = field["options"][randint(1, len(field["options"])-1)]
                         randomly_answered_questions.add((f'{label_org} [ {options} ]',"select"))
+                writes[field["handle"]] = answer
             questions_list.add((f'{label_org} [ {options} ]', answer, "select", prev_answer))
             continue
         
         # Check if it's a radio Question
-        radio = try_xp(Question, './/fieldset[@data-test-form-builder-radio-button-form-component="true"]', False)
-        if radio:
+        if field["kind"] == "radio":
             prev_answer = None
-            label = try_xp(radio, './/span[@data-test-form-builder-radio-button-form-component__title]', False)
-            try: label = find_by_class(label, "visually-hidden", 2.0)
-            except: pass
-            label_org = label.text if label else "Unknown"
             answer = 'Yes'
             label = label_org.lower()
+            question_label = label_org
 
             label_org += ' [ '
-            options = radio.find_elements(By.TAG_NAME, 'input')
             options_labels = []
+            options_texts = []
             
-            for option in options:
-                id = option.get_attribute("id")
-                option_label = try_xp(radio, f'.//label[@for="{id}"]', False)
-                options_labels.append( f'"{option_label.text if option_label else "Unknown"}"<{option.get_attribute("value")}>' ) # Saving option as "label <value>"
-                if option.is_selected(): prev_answer = options_labels[-1]
+            for option in field["options"]:
+                options_texts.append(option["label"])
+                options_labels.append( f'"{option["label"]}"<{option["value"]}>' ) # Saving option as "label <value>"
+                if option["checked"]: prev_answer = options_labels[-1]
                 label_org += f' {options_labels[-1]},'
 
             if overwrite_previous_answers or prev_answer is None:
-                if 'citizenship' in label or 'employment eligibility' in label: answer = us_citizenship
-                elif 'veteran' in label or 'protected' in label: answer = veteran_status
-                elif 'disability' in label or 'handicapped' in label: 
-                    answer = disability_status
-                else: answer = answer_common_questions(label,answer)
-                foundOption = try_xp(radio, f".//label[normalize-space()='{answer}']", False)
-                if foundOption: 
-                    actions.move_to_element(foundOption).click().perform()
-                else:    
+                answer_key = get_answer_key("radio", label)
+                if answer_key: answer = get_rule_answer(answer_key, work_location)
+                else: answer = answer_common_questions(label, recall_answer(question_label, "radio", options_texts) or answer)
+                foundOption = next((i for i, option_text in enumerate(options_texts) if " ".join(option_text.split()) == answer), None)
+                if foundOption is None:
                     possible_answer_phrases = ["Decline", "not wish", "don't wish", "Prefer not", "not want"] if answer == 'Decline' else [answer]
-                    ele = options[0]
                     answer = options_labels[0]
                     for phrase in possible_answer_phrases:
                         for i, option_label in enumerate(options_labels):
                             if phrase in option_label:
-                                foundOption = options[i]
-                                ele = foundOption
+                                foundOption = i
                                 answer = f'Decline ({option_label})' if len(possible_answer_phrases) > 1 else option_label
                                 break
-                        if foundOption: break
+                        if foundOption is not None: break
                     # if answer == 'Decline':
                     #     answer = options_labels[0]
                     #     for phrase in ["Prefer not", "not want", "not wish"]:
@@ -724,70 +870,26 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                     #             answer = f'Decline ({phrase})'
                     #             ele = foundOption
                     #             break
-                    actions.move_to_element(ele).click().perform()
-                    if not foundOption: randomly_answered_questions.add((f'{label_org} ]',"radio"))
+                    if foundOption is None: randomly_answered_questions.add((f'{label_org} ]',"radio"))
+                writes[field["handle"]] = foundOption or 0
             else: answer = prev_answer
             questions_list.add((label_org+" ]", answer, "radio", prev_answer))
             continue
         
         # Check if it's a text question
-        text = try_xp(Question, ".//input[@type='text']", False)
-        if text: 
-            do_actions = False
-            label = try_xp(Question, ".//label[@for]", False)
-            try: label = label.find_element(By.CLASS_NAME,'visually-hidden')
-            except: pass
-            label_org = label.text if label else "Unknown"
+        if field["kind"] == "text": 
+            do_actions = field["autocomplete"]
+            text = field["element"]
             answer = "" # years_of_experience
             label = label_org.lower()
 
-            prev_answer = text.get_attribute("value")
+            value = prev_answer = field["value"]
             if not prev_answer or overwrite_previous_answers:
-                if 'experience' in label or 'years' in label: answer = years_of_experience
-                elif 'phone' in label or 'mobile' in label: answer = phone_number
-                elif 'street' in label: answer = street
-                elif 'city' in label or 'location' in label or 'address' in label:
-                    # Use formatted location (city, state) if available, otherwise fall back to work_location
-                    answer = formatted_location if formatted_location else (current_city if current_city else work_location)
-                    do_actions = True
-                elif 'signature' in label: answer = full_name # 'signature' in label or 'legal name' in label or 'your name' in label or 'full name' in label: answer = full_name     # What if question is 'name of the city or university you attend, name of referral etc?'
-                elif 'name' in label:
-                    if 'full' in label: answer = full_name
-                    elif 'first' in label and 'last' not in label: answer = first_name
-                    elif 'middle' in label and 'last' not in label: answer = middle_name
-                    elif 'last' in label and 'first' not in label: answer = last_name
-                    elif 'employer' in label: answer = recent_employer
-                    else: answer = full_name
-                elif 'notice' in label:
-                    if 'month' in label:
-                        answer = notice_period_months
-                    elif 'week' in label:
-                        answer = notice_period_weeks
-                    else: answer = notice_period
-                elif 'salary' in label or 'compensation' in label or 'ctc' in label or 'pay' in label: 
-                    if 'current' in label or 'present' in label:
-                        if 'month' in label:
-                            answer = current_ctc_monthly
-                        elif 'lakh' in label:
-                            answer = current_ctc_lakhs
-                        else:
-                            answer = current_ctc
-                    else:
-                        if 'month' in label:
-                            answer = desired_salary_monthly
-                        elif 'lakh' in label:
-                            answer = desired_salary_lakhs
-                        else:
-                            answer = desired_salary
-                elif 'linkedin' in label: answer = linkedIn
-                elif 'website' in label or 'blog' in label or 'portfolio' in label or 'link' in label: answer = website
-                elif 'scale of 1-10' in label: answer = confidence_level
-                elif 'headline' in label: answer = linkedin_headline
-                elif ('hear' in label or 'come across' in label) and 'this' in label and ('job' in label or 'position' in label): answer = "https://github.com/GodsScion/Auto_job_applier_linkedIn"
-                elif 'state' in label or 'province' in label: answer = state
-                elif 'zip' in label or 'postal' in label or 'code' in label: answer = zipcode
-                elif 'country' in label: answer = country
-                else: answer = answer_common_questions(label,answer)
+                answer_key = get_answer_key("text", label)
+                if answer_key:
+                    answer = get_rule_answer(answer_key, work_location)
+                    if answer_key == "location": do_actions = True
+                else: answer = answer_common_questions(label, recall_answer(label_org, "text") or answer)
                 ##> ------ Yang Li : MARKYangL - Feature ------
                 if answer == "":
                     if use_AI and aiClient:
@@ -814,26 +916,28 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                         randomly_answered_questions.add((label_org, "text"))
                         answer = years_of_experience
                 ##<
+                if not do_actions:
+                    writes[field["handle"]] = answer
+                    written.append((field["handle"], label, "text", prev_answer))
+                    continue
+                # Suggestions are only shown when typed
                 text.clear()
                 text.send_keys(answer)
-                if do_actions:
-                    sleep(2)
-                    actions.send_keys(Keys.ARROW_DOWN)
-                    actions.send_keys(Keys.ENTER).perform()
-            questions_list.add((label, text.get_attribute("value"), "text", prev_answer))
+                wait_for_suggestions(driver)
+                actions.send_keys(Keys.ARROW_DOWN)
+                actions.send_keys(Keys.ENTER).perform()
+                value = text.get_attribute("value")
+            questions_list.add((label, value, "text", prev_answer))
             continue
 
         # Check if it's a textarea question
-        text_area = try_xp(Question, ".//textarea", False)
-        if text_area:
-            label = try_xp(Question, ".//label[@for]", False)
-            label_org = label.text if label else "Unknown"
+        if field["kind"] == "textarea":
             label = label_org.lower()
             answer = ""
-            prev_answer = text_area.get_attribute("value")
+            value = prev_answer = field["value"]
             if not prev_answer or overwrite_previous_answers:
-                if 'summary' in label: answer = linkedin_summary
-                elif 'cover' in label: answer = cover_letter
+                answer_key = get_answer_key("textarea", label)
+                if answer_key: answer = get_rule_answer(answer_key, work_location)
                 if answer == "":
                 ##> ------ Yang Li : MARKYangL - Feature ------
                     if use_AI and aiClient:
@@ -858,63 +962,34 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                             answer = ""
                     else:
                         randomly_answered_questions.add((label_org, "textarea"))
-            text_area.clear()
-            text_area.send_keys(answer)
-            if do_actions:
-                    sleep(2)
-                    actions.send_keys(Keys.ARROW_DOWN)
-                    actions.send_keys(Keys.ENTER).perform()
-            questions_list.add((label, text_area.get_attribute("value"), "textarea", prev_answer))
+                writes[field["handle"]] = answer
+                written.append((field["handle"], label, "textarea", prev_answer))
+                continue
+            questions_list.add((label, value, "textarea", prev_answer))
             ##<
             continue
 
         # Check if it's a range/slider question (for years of experience, etc.)
-        # Try standard HTML range input first
-        range_input = try_xp(Question, ".//input[@type='range']", False)
-        slider_container = None
-        slider_thumb = None
-        
-        # Also check for custom slider components (LinkedIn might use div-based sliders)
-        if not range_input:
-            try:
-                # Look for slider container or track
-                slider_container = Question.find_element(By.XPATH, ".//div[contains(@class, 'slider') or contains(@role, 'slider') or contains(@class, 'range')]")
-                # Try to find the actual input or value element
-                range_input = try_xp(slider_container, ".//input[@type='range']", False)
-                if not range_input:
-                    # Look for hidden input that stores the value
-                    range_input = try_xp(slider_container, ".//input[@type='hidden']", False)
-                # Try to find slider thumb (the draggable part)
-                try:
-                    slider_thumb = slider_container.find_element(By.XPATH, ".//div[contains(@class, 'thumb') or contains(@class, 'handle')]")
-                except:
-                    pass
-            except:
-                pass
-        
-        if range_input or slider_container:
-            label = try_xp(Question, ".//label[@for]", False)
-            try: 
-                label = label.find_element(By.CLASS_NAME,'visually-hidden')
-            except: pass
-            label_org = label.text if label else "Unknown"
+        # Standard HTML range input, or custom slider components (LinkedIn might use div-based sliders) with their input and draggable thumb
+        if field["kind"] == "range":
+            range_input = field["element"]
+            slider_container = field["slider"]
+            slider_thumb = field["thumb"]
             label = label_org.lower()
             
             # Get current value
-            try:
-                prev_answer = range_input.get_attribute("value")
-            except:
-                prev_answer = None
+            prev_answer = field["value"]
             
             # Determine the answer based on the question
             answer_value = None
-            if 'experience' in label or 'years' in label:
+            answer_key = get_answer_key("range", label)
+            if answer_key == "years_of_experience":
                 # Use years_of_experience from config
                 try:
                     answer_value = float(years_of_experience) if years_of_experience else 0
                 except:
                     answer_value = 0
-            elif 'scale' in label or '1-10' in label or 'confidence' in label:
+            elif answer_key == "confidence_level":
                 # Use confidence_level for scale questions
                 try:
                     answer_value = float(confidence_level) if confidence_level else 5
@@ -923,8 +998,8 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
             else:
                 # Default to middle value if we can't determine
                 try:
-                    min_val = float(range_input.get_attribute("min") or "0")
-                    max_val = float(range_input.get_attribute("max") or "10")
+                    min_val = float(field["min"] or "0")
+                    max_val = float(field["max"] or "10")
                     answer_value = (min_val + max_val) / 2
                 except:
                     answer_value = 5
@@ -934,9 +1009,9 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                 try:
                     # Get min and max values
                     if range_input:
-                        min_val = float(range_input.get_attribute("min") or "0")
-                        max_val = float(range_input.get_attribute("max") or "10")
-                        step = float(range_input.get_attribute("step") or "0.1")
+                        min_val = float(field["min"] or "0")
+                        max_val = float(field["max"] or "10")
+                        step = float(field["step"] or "0.1")
                     else:
                         # Default values for custom sliders
                         min_val = 0.0
@@ -966,7 +1041,7 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                             scroll_to_view(driver, slider_container)
                             sleep(0.3)
                             # Try to find the slider track
-                            slider_track = try_xp(slider_container, ".//div[contains(@class, 'track') or contains(@class, 'rail')]", False)
+                            slider_track = field["track"]
                             if not slider_track:
                                 slider_track = slider_container
                             
@@ -1036,25 +1111,23 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
             continue
 
         # Check if it's a checkbox question
-        checkbox = try_xp(Question, ".//input[@type='checkbox']", False)
-        if checkbox:
-            label = try_xp(Question, ".//span[@class='visually-hidden']", False)
-            label_org = label.text if label else "Unknown"
+        if field["kind"] == "checkbox":
             label = label_org.lower()
-            answer = try_xp(Question, ".//label[@for]", False)  # Sometimes multiple checkboxes are given for 1 question, Not accounted for that yet
-            answer = answer.text if answer else "Unknown"
-            prev_answer = checkbox.is_selected()
-            checked = prev_answer
+            answer = "Unknown" if field["option"] is None else field["option"]  # Sometimes multiple checkboxes are given for 1 question, Not accounted for that yet
+            prev_answer = field["value"]
             if not prev_answer:
-                try:
-                    actions.move_to_element(checkbox).click().perform()
-                    checked = True
-                except Exception as e: 
-                    print_lg("Checkbox click failed!", e)
-                    pass
-            questions_list.add((f'{label} ([X] {answer})', checked, "checkbox", prev_answer))
+                writes[field["handle"]] = True
+                written.append((field["handle"], f'{label} ([X] {answer})', "checkbox", prev_answer))
+                continue
+            questions_list.add((f'{label} ([X] {answer})', prev_answer, "checkbox", prev_answer))
             continue
 
+    # Write all answers in one call
+    values = write_form_fields(driver, writes)
+    for handle, question, question_type, prev_answer in written:
+        if handle not in values: print_lg(f'Failed to answer question "{question}"!')
+        questions_list.add((question, values.get(handle), question_type, prev_answer))
+
 
     # Select todays date
     try_xp(driver, "//button[contains(@aria-label, 'This is today')]")
@@ -1075,12 +1148,13 @@ def external_apply(pagination_element: WebElement, job_id: str, job_link: str, r
     global tabs_count, dailyEasyApplyLimitReached
     if easy_apply_only:
         try:
-            if "exceeded the daily application limit" in driver.find_element(By.CLASS_NAME, "artdeco-inline-feedback__message").text: dailyEasyApplyLimitReached = True
+            feedback_message = probe(driver, "inline_feedback_message")
+            if feedback_message and "exceeded the daily application limit" in feedback_message.text: dailyEasyApplyLimitReached = True
         except: pass
         print_lg("Easy apply failed I guess!")
         if pagination_element != None: return True, application_link, tabs_count
     try:
-        wait.until(EC.element_to_be_clickable((By.XPATH, ".//button[contains(@class,'jobs-apply-button') and contains(@class, 'artdeco-button--3')]"))).click() # './/button[contains(span, "Apply") and not(span[contains(@class, "disabled")])]'
+        wait_locate(driver, "apply_button", clickable=True).click() # './/button[contains(span, "Apply") and not(span[contains(@class, "disabled")])]'
         wait_span_click(driver, "Continue", 1, True, False)
         windows = driver.window_handles
         tabs_count = len(windows)
@@ -1105,26 +1179,24 @@ def follow_company(modal: WebDriver = driver) -> None:
     Function to follow or un-follow easy applied companies based om `follow_companies`
     '''
     try:
-        follow_checkbox_input = try_xp(modal, ".//input[@id='follow-company-checkbox' and @type='checkbox']", False)
+        follow_checkbox_input = try_locate(modal, "follow_company_checkbox")
         if follow_checkbox_input and follow_checkbox_input.is_selected() != follow_companies:
-            try_xp(modal, ".//label[@for='follow-company-checkbox']")
+            try_locate(modal, "follow_company_label", click=True)
     except Exception as e:
         print_lg("Failed to update follow companies checkbox!", e)
     
 
 
 #< Failed attempts logging
+@timed("save_history")
 def failed_job(job_id: str, job_link: str, resume: str, date_listed, error: str, exception: Exception, application_link: str, screenshot_name: str) -> None:
     '''
-    Function to update failed jobs list in excel
+    Function to save failed job in applications history
     '''
     try:
-        with open(failed_file_name, 'a', newline='', encoding='utf-8') as file:
-            fieldnames = ['Job ID', 'Job Link', 'Resume Tried', 'Date listed', 'Date Tried', 'Assumed Reason', 'Stack Trace', 'External Job link', 'Screenshot Name']
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            if file.tell() == 0: writer.writeheader()
-            writer.writerow({'Job ID':truncate_for_csv(job_id), 'Job Link':truncate_for_csv(job_link), 'Resume Tried':truncate_for_csv(resume), 'Date listed':truncate_for_csv(date_listed), 'Date Tried':datetime.now(), 'Assumed Reason':truncate_for_csv(error), 'Stack Trace':truncate_for_csv(exception), 'External Job link':truncate_for_csv(application_link), 'Screenshot Name':truncate_for_csv(screenshot_name)})
-            file.close()
+        row = {'Job ID':job_id, 'Job Link':job_link, 'Resume Tried':resume, 'Date listed':date_listed, 'Date Tried':datetime.now(), 'Assumed Reason':error, 'Stack Trace':exception, 'External Job link':application_link, 'Screenshot Name':screenshot_name}
+        add_job("failed_jobs", row)
+        if write_history_csv: append_csv_history("failed_jobs", row)
     except Exception as e:
         print_lg("Failed to update failed jobs list!", e)
 
@@ -1144,24 +1216,96 @@ def screenshot(driver: WebDriver, job_id: str, failedAt: str) -> str:
 
 
 
+#< Skills extraction
+@timed("ai_extract_skills")
+def extract_skills(description: str) -> Union[dict, List[str], str]:
+    '''
+    Function to extract skills from job `description` using selected `ai_provider`
+    '''
+    ##> ------ Yang Li : MARKYangL - Feature ------
+    try:
+        if ai_provider.lower() == "openai":
+            skills = ai_extract_skills(aiClient, description, stream=False)
+        elif ai_provider.lower() == "deepseek":
+            skills = deepseek_extract_skills(aiClient, description, stream=False)
+        elif ai_provider.lower() == "gemini":
+            skills = gemini_extract_skills(aiClient, description)
+        else:
+            skills = "In Development"
+        print_lg(f"Extracted skills using {ai_provider} AI")
+    except Exception as e:
+        print_lg("Failed to extract skills:", e)
+        skills = "Error extracting skills"
+    ##<
+    return skills
+
+
+def submit_skills_extraction(description: str) -> Union[Future, str]:
+    '''
+    Function to start extracting skills from job `description` in background, while the bot continues applying.
+    * Returns a `Future` of the skills, resolved by `resolve_skills()`
+    * Returns "Skipped (AI busy)" without waiting, if `skills_extraction_pending` descriptions are already waiting for AI
+    '''
+    global skills_executor
+    if not skills_slots.acquire(blocking=False):
+        print_lg("AI is still busy extracting skills of previous jobs, skipping skills extraction for this job.")
+        return "Skipped (AI busy)"
+    try:
+        if skills_executor is None: skills_executor = ThreadPoolExecutor(max_workers=max(llm_max_concurrency, 1), thread_name_prefix="skills_extractor")   # AI requests are limited by modules/ai/client.py
+        future = skills_executor.submit(extract_skills, description)
+    except Exception as e:
+        skills_slots.release()
+        print_lg("Failed to start skills extraction:", e)
+        return "Error extracting skills"
+    future.add_done_callback(lambda _: skills_slots.release())
+    return future
+
+
+def resolve_skills(skills: Union[Future, str, List[str], dict]) -> Union[str, List[str], dict]:
+    '''
+    Function to get extracted skills of a `Future` from `submit_skills_extraction()`, waits at most `skills_extraction_timeout` seconds.
+    * Returns `skills` as is, if it's not a `Future`
+    '''
+    if not isinstance(skills, Future): return skills
+    try:
+        return skills.result(timeout=skills_extraction_timeout)
+    except FutureTimeoutError:
+        print_lg(f"AI took longer than {skills_extraction_timeout} seconds to extract skills, saving job without skills.")
+        return "Timed out extracting skills"
+    except Exception as e:
+        print_lg("Failed to extract skills:", e)
+        return "Error extracting skills"
+
+
+def stop_skills_extraction() -> None:
+    '''
+    Function to stop the skills extraction thread, skills still waiting for AI are discarded
+    '''
+    global skills_executor
+    if skills_executor is not None:
+        skills_executor.shutdown(wait=False, cancel_futures=True)
+        skills_executor = None
+#>
+
+
+
+@timed("save_history")
 def submitted_jobs(job_id: str, title: str, company: str, work_location: str, work_style: str, description: str, experience_required: Union[int, Literal['Unknown', 'Error in extraction']], 
-                   skills: Union[List[str], Literal['In Development']], hr_name: Union[str, Literal['Unknown']], hr_link: Union[str, Literal['Unknown']], resume: str, 
+                   skills: Union[Future, List[str], Literal['In Development']], hr_name: Union[str, Literal['Unknown']], hr_link: Union[str, Literal['Unknown']], resume: str, 
                    reposted: bool, date_listed: Union[datetime, Literal['Unknown']], date_applied:  Union[datetime, Literal['Pending']], job_link: str, application_link: str, 
                    questions_list: Optional[set], connect_request: Literal['In Development']) -> None:
     '''
-    Function to create or update the Applied jobs CSV file, once the application is submitted successfully
+    Function to save applied job in applications history, once the application is submitted successfully
     '''
     try:
-        with open(file_name, mode='a', newline='', encoding='utf-8') as csv_file:
-            fieldnames = ['Job ID', 'Title', 'Company', 'Work Location', 'Work Style', 'About Job', 'Experience required', 'Skills required', 'HR Name', 'HR Link', 'Resume', 'Re-posted', 'Date Posted', 'Date Applied', 'Job Link', 'External Job link', 'Questions Found', 'Connect Request']
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            if csv_file.tell() == 0: writer.writeheader()
-            writer.writerow({'Job ID':truncate_for_csv(job_id), 'Title':truncate_for_csv(title), 'Company':truncate_for_csv(company), 'Work Location':truncate_for_csv(work_location), 'Work Style':truncate_for_csv(work_style), 
-                            'About Job':truncate_for_csv(description), 'Experience required': truncate_for_csv(experience_required), 'Skills required':truncate_for_csv(skills), 
-                                'HR Name':truncate_for_csv(hr_name), 'HR Link':truncate_for_csv(hr_link), 'Resume':truncate_for_csv(resume), 'Re-posted':truncate_for_csv(reposted), 
-                                'Date Posted':truncate_for_csv(date_listed), 'Date Applied':truncate_for_csv(date_applied), 'Job Link':truncate_for_csv(job_link), 
-                                'External Job link':truncate_for_csv(application_link), 'Questions Found':truncate_for_csv(questions_list), 'Connect Request':truncate_for_csv(connect_request)})
-        csv_file.close()
+        skills = resolve_skills(skills)
+        row = {'Job ID':job_id, 'Title':title, 'Company':company, 'Work Location':work_location, 'Work Style':work_style, 
+                'About Job':description, 'Experience required':experience_required, 'Skills required':skills, 
+                'HR Name':hr_name, 'HR Link':hr_link, 'Resume':resume, 'Re-posted':reposted, 
+                'Date Posted':date_listed, 'Date Applied':date_applied, 'Job Link':job_link, 
+                'External Job link':application_link, 'Questions Found':questions_list, 'Connect Request':connect_request}
+        add_job("applied_jobs", row)
+        if write_history_csv: append_csv_history("applied_jobs", row)
     except Exception as e:
         print_lg("Failed to update submitted jobs list!", e)
 
@@ -1177,21 +1321,297 @@ def discard_job() -> None:
 
 
 
+@timed("apply_job")
+def apply_to_job(job_id: str, title: str, company: str, work_location: str, work_style: str, details: dict, pagination_element: Optional[WebElement], 
+                 applied_jobs: Union[set, dict], rejected_jobs: set, blacklisted_companies: set) -> Literal['applied', 'skipped', 'stop']:
+    '''
+    Function to apply to the job currently open in the job details pane and save it's details.
+    * `details` is the snapshot of job details pane (see `get_job_details_snapshot()`)
+    * Returns `'applied'` if applied or external link collected, `'skipped'` if skipped or failed, `'stop'` if we should stop applying
+    '''
+    global failed_count, skip_count, easy_applied_count, external_jobs_count, tabs_count, pause_before_submit, pause_at_failed_question, useNewResume
+
+    # Redundant fail safe check for applied jobs!
+    if job_id in applied_jobs or details["applied"]:
+        print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
+        return "skipped"
+    print_lg(f'Trying to Apply to "{title} | {company}" job. Job ID: {job_id}')
+    
+    # Wait for user confirmation before proceeding with this job
+    confirmation = debug_confirm(
+        f'Job Details:\n\nTitle: {title}\nCompany: {company}\nLocation: {work_location}\nWork Style: {work_style}\n\nProceed with this job application?',
+        "Confirm Job Application",
+        ["Skip Job", "Proceed"],
+        default_button="Proceed"
+    )
+    if confirmation == "Skip Job":
+        print_lg(f'Skipping "{title} | {company}" job as requested by user.')
+        return "skipped"
+
+    job_link = "https://www.linkedin.com/jobs/view/"+job_id
+    application_link = "Easy Applied"
+    date_applied = "Pending"
+    hr_link = "Unknown"
+    hr_name = "Unknown"
+    connect_request = "In Development" # Still in development
+    date_listed = "Unknown"
+    skills = "Needs an AI" # Still in development
+    resume = "Pending"
+    reposted = False
+    questions_list = None
+    screenshot_name = "Not Available"
+
+    try:
+        rejected_jobs, blacklisted_companies = check_blacklist(rejected_jobs,job_id,company,blacklisted_companies,details)
+    except ValueError as e:
+        print_lg(e, 'Skipping this job!\n')
+        failed_job(job_id, job_link, resume, date_listed, "Found Blacklisted words in About Company", e, "Skipped", screenshot_name)
+        skip_count += 1
+        return "skipped"
+    except Exception as e:
+        print_lg("Failed to scroll to About Company!")
+        # print_lg(e)
+
+
+
+    # Hiring Manager info
+    if details["hr_link"] and details["hr_name"] is not None:
+        hr_link = details["hr_link"]
+        hr_name = details["hr_name"]
+        # if connect_hr:
+        #     driver.switch_to.new_window('tab')
+        #     driver.get(hr_link)
+        #     wait_span_click("More")
+        #     wait_span_click("Connect")
+        #     wait_span_click("Add a note")
+        #     message_box = driver.find_element(By.XPATH, "//textarea")
+        #     message_box.send_keys(connect_request_message)
+        #     if close_tabs: driver.close()
+        #     driver.switch_to.window(linkedIn_tab) 
+        # def message_hr(hr_info_card):
+        #     if not hr_info_card: return False
+        #     hr_info_card.find_element(By.XPATH, ".//span[normalize-space()='Message']").click()
+        #     message_box = driver.find_element(By.XPATH, "//div[@aria-label='Write a message…']")
+        #     message_box.send_keys()
+        #     try_xp(driver, "//button[normalize-space()='Send']")        
+    else:
+        print_lg(f'HR info was not given for "{title}" with Job ID: {job_id}!')
+
+
+    # Calculation of date posted
+    try:
+        # try: time_posted_text = find_by_class(driver, "jobs-unified-top-card__posted-date", 2).text
+        # except: 
+        time_posted_text = details["time_posted_text"]
+        print("Time Posted: " + time_posted_text)
+        if time_posted_text.__contains__("Reposted"):
+            reposted = True
+            time_posted_text = time_posted_text.replace("Reposted", "")
+        date_listed = calculate_date_posted(time_posted_text.strip())
+    except Exception as e:
+        print_lg("Failed to calculate the date posted!",e)
+
+
+    description, experience_required, skip, reason, message = get_job_description(details)
+    if skip:
+        print_lg(message)
+        failed_job(job_id, job_link, resume, date_listed, reason, message, "Skipped", screenshot_name)
+        rejected_jobs.add(job_id)
+        skip_count += 1
+        return "skipped"
+
+    
+    if use_AI and description != "Unknown":
+        skills = submit_skills_extraction(description)
+
+    uploaded = False
+    # Case 1: Easy Apply Button
+    if try_locate(driver, "easy_apply_button", click=True):
+        # Wait for user confirmation before starting Easy Apply
+        confirmation = debug_confirm(
+            f'Ready to start Easy Apply for:\n\nTitle: {title}\nCompany: {company}\n\nProceed with Easy Apply?',
+            "Confirm Easy Apply",
+            ["Cancel", "Proceed"],
+            default_button="Proceed"
+        )
+        if confirmation == "Cancel":
+            print_lg(f'Cancelled Easy Apply for "{title} | {company}" job as requested by user.')
+            discard_job()
+            return "skipped"
+        try: 
+            try:
+                errored = ""
+                modal = wait_locate(driver, "easy_apply_modal")
+                wait_span_click(modal, "Next", 1)
+                # if description != "Unknown":
+                #     resume = create_custom_resume(description)
+                resume = "Previous resume"
+                next_button = True
+                questions_list = set()
+                next_counter = 0
+                while next_button:
+                    next_counter += 1
+                    if next_counter >= 15: 
+                        if pause_at_failed_question:
+                            screenshot(driver, job_id, "Needed manual intervention for failed question")
+                            debug_confirm("Couldn't answer one or more questions.\nPlease click \"Continue\" once done.\nDO NOT CLICK Back, Next or Review button in LinkedIn.\n\n\n\n\nYou can turn off \"Pause at failed question\" setting in config.py", "Help Needed", ["Continue"], default_button="Continue")
+                            next_counter = 1
+                            continue
+                        if questions_list: print_lg("Stuck for one or some of the following questions...", questions_list)
+                        screenshot_name = screenshot(driver, job_id, "Failed at questions")
+                        errored = "stuck"
+                        raise Exception("Seems like stuck in a continuous loop of next, probably because of new questions.")
+                    with span("easy_apply_step", step=next_counter):
+                        questions_list = answer_questions(modal, questions_list, work_location, job_description=description)
+                        if useNewResume and not uploaded: uploaded, resume = upload_resume(modal, default_resume_path)
+                        next_button = probe(modal, "review_button")
+                        is_review = True
+                        if not next_button:
+                            try:
+                                next_button = locate(modal, "next_button")
+                                is_review = False
+                            except NoSuchElementException:
+                                # No Next or Review button found, might already be on review page
+                                next_button = None
+                    
+                        # Wait for user confirmation before clicking Next (but not for Review button)
+                        if not is_review and next_button:
+                            confirmation = debug_confirm(
+                                f'Ready to proceed to next step in Easy Apply.\n\nJob: {title} | {company}\nStep: {next_counter}\n\nClick Next?',
+                                "Confirm Next Step",
+                                ["Cancel", "Next"],
+                                default_button="Next"
+                            )
+                            if confirmation == "Cancel":
+                                print_lg(f'Cancelled Easy Apply for "{title} | {company}" job as requested by user.')
+                                discard_job()
+                                raise Exception("Job application cancelled by user!")
+                    
+                        if next_button:
+                            try: 
+                                next_button.click()
+                                buffer(click_gap)
+                            except ElementClickInterceptedException: break    # Happens when it tries to click Next button in About Company photos section
+                        else:
+                            # Already on review page, break out of loop
+                            break
+
+            except NoSuchElementException: errored = "nose"
+            finally:
+                if questions_list and errored != "stuck": 
+                    print_lg("Answered the following questions...", questions_list)
+                    print("\n\n" + "\n".join(str(question) for question in questions_list) + "\n\n")
+                # Try to click Review button if not already on review page
+                try:
+                    # Check if we're already on review page by looking for Submit button
+                    if probe(driver, "submit_application"):
+                        print_lg("Already on review page")
+                    else:
+                        # Not on review page, try to click Review
+                        review_clicked = False
+                        try:
+                            review_button = probe(modal, "review_button")
+                            if review_button:
+                                scroll_to_view(driver, review_button, True)
+                                review_button.click()
+                                buffer(click_gap)
+                                review_clicked = True
+                        except: pass
+                        if not review_clicked and not wait_span_click(driver, "Review", 1, scrollTop=True):
+                            print_lg("Note: Review button not found, may already be on review page")
+                except:
+                    pass  # Modal might not be accessible, continue anyway
+                cur_pause_before_submit = pause_before_submit
+                if errored != "stuck" and cur_pause_before_submit:
+                    decision = debug_confirm('1. Please verify your information.\n2. If you edited something, please return to this final screen.\n3. DO NOT CLICK "Submit Application".\n\n\n\n\nYou can turn off "Pause before submit" setting in config.py\nTo TEMPORARILY disable pausing, click "Disable Pause"', "Confirm your information",["Disable Pause", "Discard Application", "Submit Application"], default_button="Submit Application")
+                    if decision == "Discard Application": raise Exception("Job application discarded by user!")
+                    pause_before_submit = False if "Disable Pause" == decision else True
+                    # try_xp(modal, ".//span[normalize-space(.)='Review']")
+                follow_company(modal)
+                
+                # Wait for user confirmation before submitting application (only if pause_before_submit is False)
+                if errored != "stuck" and not cur_pause_before_submit:
+                    confirmation = debug_confirm(
+                        f'Ready to submit application for:\n\nTitle: {title}\nCompany: {company}\n\nSubmit application?',
+                        "Confirm Submit Application",
+                        ["Cancel", "Submit"],
+                        default_button="Submit"
+                    )
+                    if confirmation == "Cancel":
+                        print_lg(f'Cancelled submission for "{title} | {company}" job as requested by user.')
+                        discard_job()
+                        raise Exception("Job application submission cancelled by user!")
+                
+                with span("submit"):
+                    submitted = wait_span_click(driver, "Submit application", 2, scrollTop=True)
+                if submitted: 
+                    date_applied = datetime.now()
+                    if not wait_span_click(driver, "Done", 2): actions.send_keys(Keys.ESCAPE).perform()
+                elif errored != "stuck" and cur_pause_before_submit and "Yes" in debug_confirm("You submitted the application, didn't you 😒?", "Failed to find Submit Application!", ["Yes", "No"], default_button="Yes"):
+                    date_applied = datetime.now()
+                    wait_span_click(driver, "Done", 2)
+                else:
+                    print_lg("Since, Submit Application failed, discarding the job application...")
+                    # if screenshot_name == "Not Available":  screenshot_name = screenshot(driver, job_id, "Failed to click Submit application")
+                    # else:   screenshot_name = [screenshot_name, screenshot(driver, job_id, "Failed to click Submit application")]
+                    if errored == "nose": raise Exception("Failed to click Submit application 😑")
+
+
+        except Exception as e:
+            print_lg("Failed to Easy apply!")
+            # print_lg(e)
+            critical_error_log("Somewhere in Easy Apply process",e)
+            failed_job(job_id, job_link, resume, date_listed, "Problem in Easy Applying", e, application_link, screenshot_name)
+            failed_count += 1
+            discard_job()
+            return "skipped"
+    else:
+        # Case 2: Apply externally
+        # Wait for user confirmation before external apply
+        confirmation = debug_confirm(
+            f'This job requires external application:\n\nTitle: {title}\nCompany: {company}\n\nOpen external application link?',
+            "Confirm External Apply",
+            ["Skip", "Open Link"],
+            default_button="Open Link"
+        )
+        if confirmation == "Skip":
+            print_lg(f'Skipping external application for "{title} | {company}" job as requested by user.')
+            return "skipped"
+        skip, application_link, tabs_count = external_apply(pagination_element, job_id, job_link, resume, date_listed, application_link, screenshot_name)
+        if dailyEasyApplyLimitReached:
+            print_lg("\n###############  Daily application limit for Easy Apply is reached!  ###############\n")
+            return "stop"
+        if skip: return "skipped"
+
+    learn_answers(questions_list, randomly_answered_questions)
+    submitted_jobs(job_id, title, company, work_location, work_style, description, experience_required, skills, hr_name, hr_link, resume, reposted, date_listed, date_applied, job_link, application_link, questions_list, connect_request)
+    if uploaded:   useNewResume = False
+
+    print_lg(f'Successfully saved "{title} | {company}" job. Job ID: {job_id} info')
+    if application_link == "Easy Applied": easy_applied_count += 1
+    else:   external_jobs_count += 1
+    return "applied"
+
+
+
 # Function to apply to jobs
 def apply_to_jobs(search_terms: List[str]) -> None:
     applied_jobs = get_applied_job_ids()
     rejected_jobs = set()
     blacklisted_companies = set()
-    global current_city, failed_count, skip_count, easy_applied_count, external_jobs_count, tabs_count, pause_before_submit, pause_at_failed_question, useNewResume
+    global current_city
     current_city = current_city.strip()
+    if prefetch_jobs > 0: start_prefetch(driver)
 
     if randomize_search_order:  shuffle(search_terms)
     for searchTerm in search_terms:
+        if log_page_stats: start_page_stats(driver)    # First page's stats include loading the search and applying filters
         driver.get(f"https://www.linkedin.com/jobs/search/?keywords={searchTerm}")
         print_lg("\n________________________________________________________________________________________________________________________\n")
         print_lg(f'\n>>>> Now searching for "{searchTerm}" <<<<\n\n')
 
         apply_filters()
+        page_started = perf_counter()
 
         current_count = 0
         try:
@@ -1201,303 +1621,34 @@ def apply_to_jobs(search_terms: List[str]) -> None:
 
                 pagination_element, current_page = get_page_info()
 
-                # Find all job listings in current page
-                buffer(3)
-                job_listings = driver.find_elements(By.XPATH, "//li[@data-occludable-job-id]")  
+                # Find all job listings in current page, once the results list stops changing
+                wait_for_dom_settle(driver, "ul:has(> li[data-occludable-job-id])")
+                if log_page_stats: report_page_stats(driver, perf_counter() - page_started)
+                job_cards = get_job_cards()
 
             
-                for job in job_listings:
+                for index, card in enumerate(job_cards):
                     # Screen awake feature removed (was using pyautogui)
                     # if keep_screen_awake: pyautogui.press('shiftright')
                     if current_count >= switch_number: break
                     print_lg("\n-@-\n")
 
-                    job_id,title,company,work_location,work_style,skip = get_job_main_details(job, blacklisted_companies, rejected_jobs)
-                    
-                    if skip: continue
-                    # Redundant fail safe check for applied jobs!
-                    try:
-                        if job_id in applied_jobs or find_by_class(driver, "jobs-s-apply__application-link", 2):
-                            print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
-                            continue
-                    except Exception as e:
-                        print_lg(f'Trying to Apply to "{title} | {company}" job. Job ID: {job_id}')
-                    
-                    # Wait for user confirmation before proceeding with this job
-                    confirmation = debug_confirm(
-                        f'Job Details:\n\nTitle: {title}\nCompany: {company}\nLocation: {work_location}\nWork Style: {work_style}\n\nProceed with this job application?',
-                        "Confirm Job Application",
-                        ["Skip Job", "Proceed"],
-                        default_button="Proceed"
-                    )
-                    if confirmation == "Skip Job":
-                        print_lg(f'Skipping "{title} | {company}" job as requested by user.')
-                        continue
-
-                    job_link = "https://www.linkedin.com/jobs/view/"+job_id
-                    application_link = "Easy Applied"
-                    date_applied = "Pending"
-                    hr_link = "Unknown"
-                    hr_name = "Unknown"
-                    connect_request = "In Development" # Still in development
-                    date_listed = "Unknown"
-                    skills = "Needs an AI" # Still in development
-                    resume = "Pending"
-                    reposted = False
-                    questions_list = None
-                    screenshot_name = "Not Available"
-
-                    try:
-                        rejected_jobs, blacklisted_companies, jobs_top_card = check_blacklist(rejected_jobs,job_id,company,blacklisted_companies)
-                    except ValueError as e:
-                        print_lg(e, 'Skipping this job!\n')
-                        failed_job(job_id, job_link, resume, date_listed, "Found Blacklisted words in About Company", e, "Skipped", screenshot_name)
-                        skip_count += 1
-                        continue
-                    except Exception as e:
-                        print_lg("Failed to scroll to About Company!")
-                        # print_lg(e)
-
-
-
-                    # Hiring Manager info
-                    try:
-                        hr_info_card = WebDriverWait(driver,2).until(EC.presence_of_element_located((By.CLASS_NAME, "hirer-card__hirer-information")))
-                        hr_link = hr_info_card.find_element(By.TAG_NAME, "a").get_attribute("href")
-                        hr_name = hr_info_card.find_element(By.TAG_NAME, "span").text
-                        # if connect_hr:
-                        #     driver.switch_to.new_window('tab')
-                        #     driver.get(hr_link)
-                        #     wait_span_click("More")
-                        #     wait_span_click("Connect")
-                        #     wait_span_click("Add a note")
-                        #     message_box = driver.find_element(By.XPATH, "//textarea")
-                        #     message_box.send_keys(connect_request_message)
-                        #     if close_tabs: driver.close()
-                        #     driver.switch_to.window(linkedIn_tab) 
-                        # def message_hr(hr_info_card):
-                        #     if not hr_info_card: return False
-                        #     hr_info_card.find_element(By.XPATH, ".//span[normalize-space()='Message']").click()
-                        #     message_box = driver.find_element(By.XPATH, "//div[@aria-label='Write a message…']")
-                        #     message_box.send_keys()
-                        #     try_xp(driver, "//button[normalize-space()='Send']")        
-                    except Exception as e:
-                        print_lg(f'HR info was not given for "{title}" with Job ID: {job_id}!')
-                        # print_lg(e)
-
-
-                    # Calculation of date posted
-                    try:
-                        # try: time_posted_text = find_by_class(driver, "jobs-unified-top-card__posted-date", 2).text
-                        # except: 
-                        time_posted_text = jobs_top_card.find_element(By.XPATH, './/span[contains(normalize-space(), " ago")]').text
-                        print("Time Posted: " + time_posted_text)
-                        if time_posted_text.__contains__("Reposted"):
-                            reposted = True
-                            time_posted_text = time_posted_text.replace("Reposted", "")
-                        date_listed = calculate_date_posted(time_posted_text.strip())
-                    except Exception as e:
-                        print_lg("Failed to calculate the date posted!",e)
-
-
-                    description, experience_required, skip, reason, message = get_job_description()
-                    if skip:
-                        print_lg(message)
-                        failed_job(job_id, job_link, resume, date_listed, reason, message, "Skipped", screenshot_name)
-                        rejected_jobs.add(job_id)
-                        skip_count += 1
+                    # Fetch descriptions of next jobs in background, while this one is being applied
+                    prefetch_descriptions(upcoming["job_id"] for upcoming in job_cards[index+1:index+1+prefetch_jobs] if upcoming["job_id"] not in rejected_jobs and upcoming["job_id"] not in applied_jobs)
+                    if skip_job_card(card, applied_jobs, blacklisted_companies, rejected_jobs):
+                        discard_prefetched(card["job_id"])
                         continue
+                    if skip_prefetched_job(card, rejected_jobs): continue
 
+                    job_id,title,company,work_location,work_style,details = get_job_main_details(card)
+                    # Description still being fetched in background is used if the job details pane didn't have it
+                    if details["description"] is None: details["description"] = get_prefetched_description(job_id, 2)
+                    discard_prefetched(job_id)
                     
-                    if use_AI and description != "Unknown":
-                        ##> ------ Yang Li : MARKYangL - Feature ------
-                        try:
-                            if ai_provider.lower() == "openai":
-                                skills = ai_extract_skills(aiClient, description)
-                            elif ai_provider.lower() == "deepseek":
-                                skills = deepseek_extract_skills(aiClient, description)
-                            elif ai_provider.lower() == "gemini":
-                                skills = gemini_extract_skills(aiClient, description)
-                            else:
-                                skills = "In Development"
-                            print_lg(f"Extracted skills using {ai_provider} AI")
-                        except Exception as e:
-                            print_lg("Failed to extract skills:", e)
-                            skills = "Error extracting skills"
-                        ##<
-
-                    uploaded = False
-                    # Case 1: Easy Apply Button
-                    if try_xp(driver, ".//button[contains(@class,'jobs-apply-button') and contains(@class, 'artdeco-button--3') and contains(@aria-label, 'Easy')]"):
-                        # Wait for user confirmation before starting Easy Apply
-                        confirmation = debug_confirm(
-                            f'Ready to start Easy Apply for:\n\nTitle: {title}\nCompany: {company}\n\nProceed with Easy Apply?',
-                            "Confirm Easy Apply",
-                            ["Cancel", "Proceed"],
-                            default_button="Proceed"
-                        )
-                        if confirmation == "Cancel":
-                            print_lg(f'Cancelled Easy Apply for "{title} | {company}" job as requested by user.')
-                            discard_job()
-                            continue
-                        try: 
-                            try:
-                                errored = ""
-                                modal = find_by_class(driver, "jobs-easy-apply-modal")
-                                wait_span_click(modal, "Next", 1)
-                                # if description != "Unknown":
-                                #     resume = create_custom_resume(description)
-                                resume = "Previous resume"
-                                next_button = True
-                                questions_list = set()
-                                next_counter = 0
-                                while next_button:
-                                    next_counter += 1
-                                    if next_counter >= 15: 
-                                        if pause_at_failed_question:
-                                            screenshot(driver, job_id, "Needed manual intervention for failed question")
-                                            debug_confirm("Couldn't answer one or more questions.\nPlease click \"Continue\" once done.\nDO NOT CLICK Back, Next or Review button in LinkedIn.\n\n\n\n\nYou can turn off \"Pause at failed question\" setting in config.py", "Help Needed", ["Continue"], default_button="Continue")
-                                            next_counter = 1
-                                            continue
-                                        if questions_list: print_lg("Stuck for one or some of the following questions...", questions_list)
-                                        screenshot_name = screenshot(driver, job_id, "Failed at questions")
-                                        errored = "stuck"
-                                        raise Exception("Seems like stuck in a continuous loop of next, probably because of new questions.")
-                                    questions_list = answer_questions(modal, questions_list, work_location, job_description=description)
-                                    if useNewResume and not uploaded: uploaded, resume = upload_resume(modal, default_resume_path)
-                                    try: 
-                                        next_button = modal.find_element(By.XPATH, './/span[normalize-space(.)="Review"]')
-                                        is_review = True
-                                    except NoSuchElementException:  
-                                        try:
-                                            next_button = modal.find_element(By.XPATH, './/button[contains(span, "Next")]')
-                                            is_review = False
-                                        except NoSuchElementException:
-                                            # No Next or Review button found, might already be on review page
-                                            is_review = True
-                                            next_button = None
-                                    
-                                    # Wait for user confirmation before clicking Next (but not for Review button)
-                                    if not is_review and next_button:
-                                        confirmation = debug_confirm(
-                                            f'Ready to proceed to next step in Easy Apply.\n\nJob: {title} | {company}\nStep: {next_counter}\n\nClick Next?',
-                                            "Confirm Next Step",
-                                            ["Cancel", "Next"],
-                                            default_button="Next"
-                                        )
-                                        if confirmation == "Cancel":
-                                            print_lg(f'Cancelled Easy Apply for "{title} | {company}" job as requested by user.')
-                                            discard_job()
-                                            raise Exception("Job application cancelled by user!")
-                                    
-                                    if next_button:
-                                        try: 
-                                            next_button.click()
-                                            buffer(click_gap)
-                                        except ElementClickInterceptedException: break    # Happens when it tries to click Next button in About Company photos section
-                                    else:
-                                        # Already on review page, break out of loop
-                                        break
-
-                            except NoSuchElementException: errored = "nose"
-                            finally:
-                                if questions_list and errored != "stuck": 
-                                    print_lg("Answered the following questions...", questions_list)
-                                    print("\n\n" + "\n".join(str(question) for question in questions_list) + "\n\n")
-                                # Try to click Review button if not already on review page
-                                try:
-                                    # Check if we're already on review page by looking for Submit button
-                                    try:
-                                        driver.find_element(By.XPATH, './/span[normalize-space(.)="Submit application"]')
-                                        print_lg("Already on review page")
-                                    except:
-                                        # Not on review page, try to click Review
-                                        review_clicked = False
-                                        try:
-                                            review_button = modal.find_element(By.XPATH, './/span[normalize-space(.)="Review"]')
-                                            scroll_to_view(driver, review_button, True)
-                                            review_button.click()
-                                            buffer(click_gap)
-                                            review_clicked = True
-                                        except:
-                                            try:
-                                                review_button = modal.find_element(By.XPATH, './/button[contains(., "Review")]')
-                                                scroll_to_view(driver, review_button, True)
-                                                review_button.click()
-                                                buffer(click_gap)
-                                                review_clicked = True
-                                            except:
-                                                if not wait_span_click(driver, "Review", 1, scrollTop=True):
-                                                    print_lg("Note: Review button not found, may already be on review page")
-                                except:
-                                    pass  # Modal might not be accessible, continue anyway
-                                cur_pause_before_submit = pause_before_submit
-                                if errored != "stuck" and cur_pause_before_submit:
-                                    decision = debug_confirm('1. Please verify your information.\n2. If you edited something, please return to this final screen.\n3. DO NOT CLICK "Submit Application".\n\n\n\n\nYou can turn off "Pause before submit" setting in config.py\nTo TEMPORARILY disable pausing, click "Disable Pause"', "Confirm your information",["Disable Pause", "Discard Application", "Submit Application"], default_button="Submit Application")
-                                    if decision == "Discard Application": raise Exception("Job application discarded by user!")
-                                    pause_before_submit = False if "Disable Pause" == decision else True
-                                    # try_xp(modal, ".//span[normalize-space(.)='Review']")
-                                follow_company(modal)
-                                
-                                # Wait for user confirmation before submitting application (only if pause_before_submit is False)
-                                if errored != "stuck" and not cur_pause_before_submit:
-                                    confirmation = debug_confirm(
-                                        f'Ready to submit application for:\n\nTitle: {title}\nCompany: {company}\n\nSubmit application?',
-                                        "Confirm Submit Application",
-                                        ["Cancel", "Submit"],
-                                        default_button="Submit"
-                                    )
-                                    if confirmation == "Cancel":
-                                        print_lg(f'Cancelled submission for "{title} | {company}" job as requested by user.')
-                                        discard_job()
-                                        raise Exception("Job application submission cancelled by user!")
-                                
-                                if wait_span_click(driver, "Submit application", 2, scrollTop=True): 
-                                    date_applied = datetime.now()
-                                    if not wait_span_click(driver, "Done", 2): actions.send_keys(Keys.ESCAPE).perform()
-                                elif errored != "stuck" and cur_pause_before_submit and "Yes" in debug_confirm("You submitted the application, didn't you 😒?", "Failed to find Submit Application!", ["Yes", "No"], default_button="Yes"):
-                                    date_applied = datetime.now()
-                                    wait_span_click(driver, "Done", 2)
-                                else:
-                                    print_lg("Since, Submit Application failed, discarding the job application...")
-                                    # if screenshot_name == "Not Available":  screenshot_name = screenshot(driver, job_id, "Failed to click Submit application")
-                                    # else:   screenshot_name = [screenshot_name, screenshot(driver, job_id, "Failed to click Submit application")]
-                                    if errored == "nose": raise Exception("Failed to click Submit application 😑")
-
-
-                        except Exception as e:
-                            print_lg("Failed to Easy apply!")
-                            # print_lg(e)
-                            critical_error_log("Somewhere in Easy Apply process",e)
-                            failed_job(job_id, job_link, resume, date_listed, "Problem in Easy Applying", e, application_link, screenshot_name)
-                            failed_count += 1
-                            discard_job()
-                            continue
-                    else:
-                        # Case 2: Apply externally
-                        # Wait for user confirmation before external apply
-                        confirmation = debug_confirm(
-                            f'This job requires external application:\n\nTitle: {title}\nCompany: {company}\n\nOpen external application link?',
-                            "Confirm External Apply",
-                            ["Skip", "Open Link"],
-                            default_button="Open Link"
-                        )
-                        if confirmation == "Skip":
-                            print_lg(f'Skipping external application for "{title} | {company}" job as requested by user.')
-                            continue
-                        skip, application_link, tabs_count = external_apply(pagination_element, job_id, job_link, resume, date_listed, application_link, screenshot_name)
-                        if dailyEasyApplyLimitReached:
-                            print_lg("\n###############  Daily application limit for Easy Apply is reached!  ###############\n")
-                            return
-                        if skip: continue
-
-                    submitted_jobs(job_id, title, company, work_location, work_style, description, experience_required, skills, hr_name, hr_link, resume, reposted, date_listed, date_applied, job_link, application_link, questions_list, connect_request)
-                    if uploaded:   useNewResume = False
-
-                    print_lg(f'Successfully saved "{title} | {company}" job. Job ID: {job_id} info')
+                    status = apply_to_job(job_id, title, company, work_location, work_style, details, pagination_element, applied_jobs, rejected_jobs, blacklisted_companies)
+                    if status == "stop": return
+                    if status == "skipped": continue
                     current_count += 1
-                    if application_link == "Easy Applied": easy_applied_count += 1
-                    else:   external_jobs_count += 1
                     applied_jobs.add(job_id)
                     
                     # Wait for user confirmation before moving to next job
@@ -1530,7 +1681,9 @@ def apply_to_jobs(search_terms: List[str]) -> None:
                     return
                 
                 try:
+                    if log_page_stats: start_page_stats(driver)
                     pagination_element.find_element(By.XPATH, f"//button[@aria-label='Page {current_page+1}']").click()
+                    page_started = perf_counter()
                     print_lg(f"\n>-> Now on Page {current_page+1} \n")
                 except NoSuchElementException:
                     print_lg(f"\n>-> Didn't find Page {current_page+1}. Probably at the end page of results!\n")
@@ -1543,23 +1696,231 @@ def apply_to_jobs(search_terms: List[str]) -> None:
             print_lg("Failed to find Job listings!")
             critical_error_log("In Applier", e)
             try:
-                print_lg(driver.page_source, pretty=True)
+                print_lg(driver.page_source, pretty=True, level="DEBUG")
             except Exception as page_source_error:
                 print_lg(f"Failed to get page source, browser might have crashed. {page_source_error}")
             # print_lg(e)
 
-        
+
+
+#< Parallel apply workers
+def create_ai_client() -> None:
+    '''
+    Function to create the client of selected `ai_provider` and save it as `aiClient`
+    '''
+    global aiClient
+    if ai_provider == "openai":
+        aiClient = ai_create_openai_client()
+    ##> ------ Yang Li : MARKYangL - Feature ------
+    # Create DeepSeek client
+    elif ai_provider == "deepseek":
+        aiClient = deepseek_create_client()
+    elif ai_provider == "gemini":
+        aiClient = gemini_create_client()
+    ##<
+
+
+def close_ai_client() -> None:
+    '''
+    Function to close `aiClient` if it's open
+    '''
+    stop_skills_extraction()
+    ##> ------ Yang Li : MARKYangL - Feature ------
+    if use_AI and aiClient:
+        try:
+            if ai_provider.lower() == "openai":
+                ai_close_openai_client(aiClient)
+            elif ai_provider.lower() == "deepseek":
+                ai_close_openai_client(aiClient)
+            elif ai_provider.lower() == "gemini":
+                pass # Gemini client does not need to be closed
+            print_lg(f"Closed {ai_provider} AI client.")
+        except Exception as e:
+            print_lg("Failed to close AI client:", e)
+    ##<
+
+
+def apply_worker(worker_id: int, job_queue: multiprocessing.Queue, shared: dict) -> None:
+    '''
+    Function run by each parallel apply worker in it's own process with it's own Chrome `driver`.
+    * Takes `(job_id, search_term)` from `job_queue` till it gets `None` or daily Easy Apply limit is reached
+    '''
+    global linkedIn_tab, tabs_count, pause_before_submit, pause_at_failed_question
+    pause_before_submit = False
+    pause_at_failed_question = False
+    rejected_jobs = set()
+    blacklisted_companies = set()
+    try:
+        tabs_count = len(driver.window_handles)
+        open_linkedin_logged_in()
+        linkedIn_tab = driver.current_window_handle
+        if use_AI: create_ai_client()
+        print_lg(f"Worker {worker_id} is ready to apply!")
+
+        while not shared["daily_limit"].is_set():
+            item = job_queue.get()
+            if item is None: break
+            job_id, search_term = item
+            if not reserve_apply_slot(shared, job_id, search_term): continue
+            status = "skipped"
+            try:
+                print_lg(f"\n-@- Worker {worker_id} -@-\n")
+                driver.get("https://www.linkedin.com/jobs/view/"+job_id)
+                details = get_job_details_snapshot(job_id)
+                title = details["title"] or "Unknown"
+                company = details["company"] or "Unknown"
+                work_location, work_style = get_work_location_and_style(details, "Unknown", "Unknown")
+                if company in blacklisted_companies:
+                    print_lg(f'Skipping "{title} | {company}" job (Blacklisted Company). Job ID: {job_id}!')
+                    continue
+                status = apply_to_job(job_id, title, company, work_location, work_style, details, None, shared["applied_jobs"], rejected_jobs, blacklisted_companies)
+            except (NoSuchWindowException, WebDriverException) as e:
+                raise e
+            except Exception as e:
+                critical_error_log(f"In Apply Worker {worker_id}", e)
+            finally:
+                release_apply_slot(shared, job_id, search_term, status == "applied")
+            if dailyEasyApplyLimitReached:
+                print_lg("\n###############  Daily application limit for Easy Apply is reached!  ###############\n")
+                shared["daily_limit"].set()
+            if status == "stop": break
+    except (NoSuchWindowException, WebDriverException) as e:
+        print_lg(f"Browser window of worker {worker_id} closed or session is invalid. Stopping worker.", e)
+    except Exception as e:
+        critical_error_log(f"In Apply Worker {worker_id}", e)
+    finally:
+        with shared["lock"]:
+            for key, count in [("easy_applied_count", easy_applied_count), ("external_jobs_count", external_jobs_count), ("failed_count", failed_count), ("skip_count", skip_count)]:
+                shared["stats"][key] += count
+        close_ai_client()
+        if performance_trace: print_performance_summary(f"Worker {worker_id}")
+        try: driver.quit()
+        except Exception as e: print_lg(f"Browser of worker {worker_id} already closed.", e)
+        save_locator_stats()
+        stop_log_writer()   # Worker processes exit without running `atexit` handlers
+
+
+def queue_job(job_queue: multiprocessing.Queue, item: Optional[Tuple[str, str]], shared: dict, workers: List[multiprocessing.Process]) -> bool:
+    '''
+    Function to put `item` in `job_queue`, waiting while it's full, so we never collect too far ahead of the workers.
+    * Gives up if daily Easy Apply limit is reached or no worker is alive to take it (`item` `None` only waits for living workers)
+    * Returns `True` if `item` was queued, else `False`
+    '''
+    while True:
+        try:
+            job_queue.put(item, timeout=1)
+            return True
+        except QueueFull:
+            if (item is not None and shared["daily_limit"].is_set()) or not any(worker.is_alive() for worker in workers): return False
+
+
+def harvest_jobs(search_terms: List[str], job_queue: multiprocessing.Queue, shared: dict, workers: List[multiprocessing.Process]) -> None:
+    '''
+    Function to collect jobs from search results of each search term and queue them for the apply `workers`.
+    * Stops collecting for a search term once workers applied to `switch_number` jobs of it
+    * Stops collecting if daily Easy Apply limit is reached or all workers stopped
+    '''
+    rejected_jobs = set()
+    blacklisted_companies = set()
+    queued_jobs = set()
+    if randomize_search_order:  shuffle(search_terms)
+    for searchTerm in search_terms:
+        if shared["daily_limit"].is_set(): return
+        driver.get(f"https://www.linkedin.com/jobs/search/?keywords={searchTerm}")
+        print_lg("\n________________________________________________________________________________________________________________________\n")
+        print_lg(f'\n>>>> Now collecting jobs for "{searchTerm}" <<<<\n\n')
+
+        apply_filters()
+
+        try:
+            while shared["term_counts"].get(searchTerm, 0) < switch_number and not shared["daily_limit"].is_set():
+                wait.until(EC.presence_of_all_elements_located((By.XPATH, "//li[@data-occludable-job-id]")))
+                pagination_element, current_page = get_page_info()
+                wait_for_dom_settle(driver, "ul:has(> li[data-occludable-job-id])")
+
+                for card in get_job_cards():
+                    if card["job_id"] in queued_jobs or skip_job_card(card, shared["applied_jobs"], blacklisted_companies, rejected_jobs): continue
+                    queued_jobs.add(card["job_id"])
+                    if not queue_job(job_queue, (card["job_id"], searchTerm), shared, workers):
+                        if not shared["daily_limit"].is_set(): print_lg("All apply workers stopped. Ending job collection.")
+                        return
+
+                if pagination_element == None:
+                    print_lg("Couldn't find pagination element, probably at the end page of results!")
+                    break
+                try:
+                    pagination_element.find_element(By.XPATH, f"//button[@aria-label='Page {current_page+1}']").click()
+                    print_lg(f"\n>-> Now on Page {current_page+1} \n")
+                except NoSuchElementException:
+                    print_lg(f"\n>-> Didn't find Page {current_page+1}. Probably at the end page of results!\n")
+                    break
+        except (NoSuchWindowException, WebDriverException) as e:
+            print_lg("Browser window closed or session is invalid. Ending job collection.", e)
+            raise e
+        except Exception as e:
+            print_lg("Failed to find Job listings!")
+            critical_error_log("In Job Collector", e)
+
+
+def run_parallel(search_terms: List[str]) -> None:
+    '''
+    Function to apply to jobs of `search_terms` with `parallel_workers` browsers.
+    * This browser collects jobs, each worker process opens it's own Chrome with profile in `worker_profiles_path` and applies
+    * Applied jobs, `switch_number` per search term and daily Easy Apply limit are shared by all workers
+    '''
+    global dailyEasyApplyLimitReached, easy_applied_count, external_jobs_count, failed_count, skip_count
+    context = multiprocessing.get_context("spawn") # Workers must not inherit this process's driver
+    manager = context.Manager()
+    shared = {
+        "lock": manager.Lock(),
+        "daily_limit": manager.Event(),
+        "applied_jobs": manager.dict({job_id: True for job_id in get_applied_job_ids()}),
+        "term_counts": manager.dict(),
+        "in_progress": manager.dict(),
+        "stats": manager.dict(easy_applied_count=0, external_jobs_count=0, failed_count=0, skip_count=0),
+    }
+    job_queue = context.Queue(maxsize=parallel_workers * 5)
+
+    workers = []
+    for worker_id in range(1, parallel_workers+1):
+        os.environ["WORKER_PROFILE_DIR"] = f"{worker_profiles_path}/worker_{worker_id}".replace("//", "/")
+        os.environ["WORKER_LOG_NAME"] = f"log_worker_{worker_id}.txt"     # Own log file, as log.txt is rotated by this process
+        worker = context.Process(target=apply_worker, args=(worker_id, job_queue, shared), name=f"Apply Worker {worker_id}")
+        worker.start()
+        workers.append(worker)
+    os.environ.pop("WORKER_PROFILE_DIR", None)
+    os.environ.pop("WORKER_LOG_NAME", None)
+    print_lg(f"Started {parallel_workers} apply workers!")
+
+    try:
+        harvest_jobs(search_terms, job_queue, shared, workers)
+    finally:
+        for worker in workers:
+            if worker.is_alive(): queue_job(job_queue, None, shared, workers)
+        job_queue.cancel_join_thread()     # Jobs left in the queue by stopped workers must not keep this process from exiting
+        for worker in workers:
+            worker.join()
+        stats = dict(shared["stats"])
+        easy_applied_count += stats["easy_applied_count"]
+        external_jobs_count += stats["external_jobs_count"]
+        failed_count += stats["failed_count"]
+        skip_count += stats["skip_count"]
+        if shared["daily_limit"].is_set(): dailyEasyApplyLimitReached = True
+        manager.shutdown()
+#>
+
+
 def run(total_runs: int) -> int:
     if dailyEasyApplyLimitReached:
         return total_runs
     print_lg(f"\nCycle {total_runs}: Searching for jobs posted within '{date_posted}' (sorted by '{sort_by}')")
-    apply_to_jobs(search_terms)
-    if not dailyEasyApplyLimitReached:
-        print_lg("Sleeping for 10 min...")
-        sleep(300)
-        print_lg("Few more min... Gonna start with in next 5 min...")
-        sleep(300)
-    buffer(3)
+    if parallel_workers > 1: run_parallel(search_terms)
+    else: apply_to_jobs(search_terms)
+    if performance_trace: print_performance_summary(f"Cycle {total_runs}")
+    if not dailyEasyApplyLimitReached and run_non_stop and run_cycle_cooldown > 0:
+        print_lg(f"Resting for {run_cycle_cooldown} secs before next cycle...")
+        sleep(run_cycle_cooldown)
+    humanize()
     return total_runs + 1
 
 
@@ -1569,7 +1930,7 @@ linkedIn_tab = False
 
 def main() -> None:
     try:
-        global linkedIn_tab, tabs_count, useNewResume, aiClient
+        global linkedIn_tab, tabs_count, useNewResume
         alert_title = "Error Occurred. Closing Browser!"
         total_runs = 1        
         validate_config()
@@ -1595,8 +1956,7 @@ def main() -> None:
         
         # Login to LinkedIn
         tabs_count = len(driver.window_handles)
-        driver.get("https://www.linkedin.com/login")
-        if not is_logged_in_LN(): login_LN()
+        open_linkedin_logged_in()
         
         linkedIn_tab = driver.current_window_handle
 
@@ -1612,15 +1972,8 @@ def main() -> None:
         #     except Exception as e:
         #         print_lg("Opening OpenAI chatGPT tab failed!")
         if use_AI:
-            if ai_provider == "openai":
-                aiClient = ai_create_openai_client()
-            ##> ------ Yang Li : MARKYangL - Feature ------
-            # Create DeepSeek client
-            elif ai_provider == "deepseek":
-                aiClient = deepseek_create_client()
-            elif ai_provider == "gemini":
-                aiClient = gemini_create_client()
-            ##<
+            # Parallel workers create their own AI clients
+            if parallel_workers <= 1: create_ai_client()
 
             try:
                 about_company_for_ai = " ".join([word for word in (first_name+" "+last_name).split() if len(word) > 3])
@@ -1659,6 +2012,10 @@ def main() -> None:
         print_lg("Total applied or collected:     {}".format(easy_applied_count + external_jobs_count))
         print_lg("\nFailed jobs:                    {}".format(failed_count))
         print_lg("Irrelevant jobs skipped:        {}\n".format(skip_count))
+        if use_AI:
+            print_cache_stats()
+            print_client_stats()
+        if log_page_stats: print_page_stats_summary(lean_browsing)
         if randomly_answered_questions: print_lg("\n\nQuestions randomly answered:\n  {}  \n\n".format(";\n".join(str(question) for question in randomly_answered_questions)))
         quote = choice([
             "You're one step closer than before.", 
@@ -1675,22 +2032,13 @@ def main() -> None:
             "The only limit to our realization of tomorrow will be our doubts of today. - Franklin D. Roosevelt"
             ])
         msg = f"\n{quote}\n\n\nBest regards,\nSai Vignesh Golla\nhttps://www.linkedin.com/in/saivigneshgolla/\n\n"
-        print_lg(msg,"Closing the browser...")
-        ##> ------ Yang Li : MARKYangL - Feature ------
-        if use_AI and aiClient:
-            try:
-                if ai_provider.lower() == "openai":
-                    ai_close_openai_client(aiClient)
-                elif ai_provider.lower() == "deepseek":
-                    ai_close_openai_client(aiClient)
-                elif ai_provider.lower() == "gemini":
-                    pass # Gemini client does not need to be closed
-                print_lg(f"Closed {ai_provider} AI client.")
-            except Exception as e:
-                print_lg("Failed to close AI client:", e)
-        ##<
+        print_lg(msg,"Leaving the browser open for next run..." if keep_browser_open else "Closing the browser...")
+        close_ai_client()
+        stop_prefetch()
         try:
-            if driver:
+            if driver and keep_browser_open:
+                detach_browser(driver)
+            elif driver:
                 driver.quit()
         except WebDriverException as e:
             print_lg("Browser already closed.", e)
@@ -0,0 +1,33 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+# Tests must never touch logs, history or caches of real runs, so every file path in config is pointed to a temporary
+# folder here, before any module of modules/ imports them.
+
+import os
+import tempfile
+
+import config.settings as settings
+import config.questions as questions
+
+test_dir = tempfile.mkdtemp(prefix="auto_job_applier_tests_")
+
+settings.logs_folder_path = os.path.join(test_dir, "logs/")
+settings.history_db_path = os.path.join(test_dir, "applications_history.db")
+settings.locator_stats_path = os.path.join(test_dir, "locator_stats.json")
+settings.llm_cache_path = os.path.join(test_dir, "llm_cache.db")
+settings.llm_capabilities_path = os.path.join(test_dir, "llm_capabilities.json")
+settings.file_name = os.path.join(test_dir, "all_applied_applications_history.csv")
+settings.failed_file_name = os.path.join(test_dir, "all_failed_applications_history.csv")
+questions.answer_memory_path = os.path.join(test_dir, "answer_memory.json")
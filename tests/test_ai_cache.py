@@ -0,0 +1,110 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+import modules.ai.cache as cache
+from modules.ai.cache import get_cache_key, get_cached_response, save_cached_response
+
+
+def close_connection() -> None:
+    local = vars(cache)["__local"]
+    if getattr(local, "connection", None) is not None:
+        local.connection.close()
+        del local.connection
+
+
+@pytest.fixture
+def clock(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[List[float]]:
+    '''
+    Empty cache in `tmp_path` with 1 day TTL and 3 entries, and a clock to move time forward (`clock[0] += secs`)
+    '''
+    close_connection()
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(cache, "llm_cache_path", str(tmp_path / "llm_cache.db"))
+    monkeypatch.setattr(cache, "llm_cache_enabled", True)
+    monkeypatch.setattr(cache, "llm_cache_ttl", 1)
+    monkeypatch.setattr(cache, "llm_cache_max_entries", 3)
+    monkeypatch.setattr(cache, "time", lambda: now[0])
+    yield now
+    close_connection()
+
+
+def test_key_changes_with_every_input() -> None:
+    base = get_cache_key("openai", "gpt-4o-mini", [{"role": "user", "content": "Hi"}], {"type": "json_object"}, 0.2)
+    assert base == get_cache_key("openai", "gpt-4o-mini", [{"content": "Hi", "role": "user"}], {"type": "json_object"}, 0.2)
+    assert len({base,
+                get_cache_key("deepseek", "gpt-4o-mini", [{"role": "user", "content": "Hi"}], {"type": "json_object"}, 0.2),
+                get_cache_key("openai", "gpt-4o", [{"role": "user", "content": "Hi"}], {"type": "json_object"}, 0.2),
+                get_cache_key("openai", "gpt-4o-mini", [{"role": "user", "content": "Hey"}], {"type": "json_object"}, 0.2),
+                get_cache_key("openai", "gpt-4o-mini", [{"role": "user", "content": "Hi"}], None, 0.2),
+                get_cache_key("openai", "gpt-4o-mini", [{"role": "user", "content": "Hi"}], {"type": "json_object"}, None)}) == 6
+
+
+def test_key_includes_api_url(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache, "llm_api_url", "http://localhost:11434/v1/")
+    local = get_cache_key("openai", "llama3", "Hi")
+    assert local == get_cache_key("openai", "llama3", "Hi")
+    monkeypatch.setattr(cache, "llm_api_url", "http://localhost:11434/v1")
+    assert local == get_cache_key("openai", "llama3", "Hi")     # Trailing "/" doesn't matter
+    gemini = get_cache_key("gemini", "gemini-1.5-flash", "Hi")
+    monkeypatch.setattr(cache, "llm_api_url", "https://api.together.xyz/v1")
+    assert local != get_cache_key("openai", "llama3", "Hi")
+    assert gemini == get_cache_key("gemini", "gemini-1.5-flash", "Hi")     # Gemini always uses Google's API
+
+
+def test_save_and_get(clock: List[float]) -> None:
+    assert get_cached_response("key") is None
+    save_cached_response("key", "openai", "gpt-4o-mini", {"tech_stack": ["Python"]})
+    assert get_cached_response("key") == {"tech_stack": ["Python"]}
+
+
+def test_errors_not_saved(clock: List[float]) -> None:
+    save_cached_response("error", "openai", "gpt-4o-mini", {"error": "Rate limited"})
+    save_cached_response("none", "openai", "gpt-4o-mini", None)
+    assert get_cached_response("error") is None and get_cached_response("none") is None
+
+
+def test_ttl(clock: List[float]) -> None:
+    save_cached_response("key", "openai", "gpt-4o-mini", "Yes")
+    clock[0] += 86400 - 1
+    assert get_cached_response("key") == "Yes"
+    clock[0] += 2
+    assert get_cached_response("key") is None
+
+
+def test_ttl_zero_never_expires(clock: List[float], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache, "llm_cache_ttl", 0)
+    save_cached_response("key", "openai", "gpt-4o-mini", "Yes")
+    clock[0] += 365 * 86400
+    assert get_cached_response("key") == "Yes"
+
+
+def test_least_recently_used_evicted(clock: List[float]) -> None:
+    for key in ["a", "b", "c"]:
+        save_cached_response(key, "openai", "gpt-4o-mini", key)
+        clock[0] += 1
+    assert get_cached_response("a") == "a"      # "b" is now the least recently used
+    clock[0] += 1
+    save_cached_response("d", "openai", "gpt-4o-mini", "d")
+    assert [get_cached_response(key) for key in ["a", "b", "c", "d"]] == ["a", None, "c", "d"]
+
+
+def test_disabled(clock: List[float], monkeypatch: pytest.MonkeyPatch) -> None:
+    save_cached_response("key", "openai", "gpt-4o-mini", "Yes")
+    monkeypatch.setattr(cache, "llm_cache_enabled", False)
+    assert get_cached_response("key") is None
@@ -0,0 +1,152 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import threading
+
+from time import monotonic, time
+from email.utils import formatdate
+from typing import Any, Callable, Optional
+
+import pytest
+
+import modules.ai.client as client
+from modules.ai.client import client_stats, get_retry_after, is_retryable, llm_request, llm_request_batch, submit_llm_request
+
+
+class Response:
+    def __init__(self, headers: dict) -> None:
+        self.headers = headers
+
+
+class APIError(Exception):
+    '''
+    Error like the ones raised by AI provider clients, with a `status_code` and the `response`
+    '''
+    def __init__(self, status_code: int, headers: Optional[dict] = None) -> None:
+        super().__init__(f"Error code: {status_code}")
+        self.status_code = status_code
+        self.response = Response(headers or {})
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(client, "llm_max_retries", 3)
+    monkeypatch.setattr(client, "llm_retry_base_delay", 0)
+    monkeypatch.setattr(client, "llm_requests_per_minute", 0)
+
+
+def failing(errors: list, result: Any = "ok") -> Callable[[], Any]:
+    '''
+    Request that raises each of `errors` on consecutive calls, then returns `result`. Calls are counted in `.calls`
+    '''
+    def call() -> Any:
+        call.calls += 1
+        if errors: raise errors.pop(0)
+        return result
+    call.calls = 0
+    return call
+
+
+def test_get_retry_after() -> None:
+    assert get_retry_after(APIError(429, {"retry-after": "2"})) == 2
+    assert get_retry_after(APIError(429, {"retry-after-ms": "1500", "retry-after": "9"})) == 1.5
+    assert 8 <= get_retry_after(APIError(429, {"retry-after": formatdate(time() + 10, usegmt=True)})) <= 10
+    assert get_retry_after(APIError(429, {"retry-after": "soon"})) is None
+    assert get_retry_after(APIError(429)) is None
+    assert get_retry_after(ValueError()) is None
+
+
+def test_is_retryable() -> None:
+    assert all(is_retryable(APIError(status)) for status in [408, 409, 429, 500, 502, 503, 504])
+    assert not any(is_retryable(APIError(status)) for status in [400, 401, 403, 404, 422])
+    assert is_retryable(TimeoutError()) and is_retryable(ConnectionError())
+    error = ValueError()
+    error.code = 503        # Google API errors have `code`
+    assert is_retryable(error) and not is_retryable(ValueError())
+
+
+def test_retries_until_success() -> None:
+    call = failing([APIError(500), APIError(429)])
+    retries = client_stats["retries"]
+    assert llm_request(None, call) == "ok"
+    assert call.calls == 3 and client_stats["retries"] == retries + 2
+
+
+def test_gives_up_after_max_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(client, "llm_max_retries", 1)
+    call = failing([APIError(500), APIError(503)])
+    with pytest.raises(APIError) as error:
+        llm_request(None, call)
+    assert error.value.status_code == 503 and call.calls == 2
+
+
+def test_no_retry_for_bad_request() -> None:
+    call = failing([APIError(400)])
+    with pytest.raises(APIError):
+        llm_request(None, call)
+    assert call.calls == 1
+
+
+def test_waits_as_server_asked() -> None:
+    call = failing([APIError(429, {"retry-after": "0.3"})])
+    rate_limited = client_stats["rate_limited"]
+    started = monotonic()
+    assert llm_request(None, call) == "ok"
+    assert monotonic() - started >= 0.3 and client_stats["rate_limited"] == rate_limited + 1
+
+
+def test_identical_requests_in_flight_are_sent_once() -> None:
+    started, release = threading.Event(), threading.Event()
+    calls = []
+    def call() -> str:
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "answer"
+    coalesced = client_stats["coalesced"]
+    first = submit_llm_request("same prompt", call)
+    assert started.wait(5)      # First request is in flight
+    second = submit_llm_request("same prompt", call)
+    other = submit_llm_request(None, lambda: "other")
+    release.set()
+    assert first.result(5) == second.result(5) == "answer" and other.result(5) == "other"
+    assert len(calls) == 1 and client_stats["coalesced"] == coalesced + 1
+    assert llm_request("same prompt", lambda: "new answer") == "new answer"     # Finished requests are not shared
+
+
+def test_failure_shared_with_identical_requests() -> None:
+    release = threading.Event()
+    def call() -> str:
+        release.wait(5)
+        raise APIError(401)
+    first = submit_llm_request("failing prompt", call)
+    second = submit_llm_request("failing prompt", call)
+    release.set()
+    for future in (first, second):
+        with pytest.raises(APIError): future.result(5)
+
+
+def test_batch_keeps_order_and_errors() -> None:
+    error = APIError(404)
+    results = llm_request_batch([("a", lambda: 1), (None, failing([error])), ("c", lambda: 3)])
+    assert results == [1, error, 3]
+
+
+def test_requests_per_minute(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(client, "llm_requests_per_minute", 600)     # A request every 0.1 secs once the bucket is empty
+    monkeypatch.setattr(client, "__tokens", 0.0)
+    monkeypatch.setattr(client, "__tokens_updated", monotonic())
+    started = monotonic()
+    llm_request_batch([(None, lambda: None) for _ in range(3)])
+    assert monotonic() - started >= 0.25
@@ -0,0 +1,110 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import json
+
+from pathlib import Path
+
+import pytest
+
+import modules.answer_memory as answer_memory
+from modules.answer_memory import learn_answers, normalize, parse_question, recall_answer, remember_answer, save_memory
+
+
+@pytest.fixture
+def memory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    '''
+    Empty answer memory saved in `tmp_path`
+    '''
+    path = tmp_path / "answer_memory.json"
+    monkeypatch.setattr(answer_memory, "answer_memory_path", str(path))
+    monkeypatch.setattr(answer_memory, "use_answer_memory", True)
+    monkeypatch.setattr(answer_memory, "answer_memory_match", 0.7)
+    monkeypatch.setattr(answer_memory, "__memory", {})
+    monkeypatch.setattr(answer_memory, "__index", {})
+    return path
+
+
+def test_normalize() -> None:
+    assert normalize("  Are you OK?? (Yes/No) ") == "are you ok yes no"
+
+
+def test_parse_select() -> None:
+    question = ('Degree [  "Select an option", "Bachelors", "Masters", ]', "Masters", "select", "Select an option")
+    assert parse_question(question) == ("Degree", "select", ["Select an option", "Bachelors", "Masters"], "Masters")
+    assert parse_question(('Phone country code [ "List of phone country codes" ]', "India (+91)", "select", "")) is None
+
+
+def test_parse_radio() -> None:
+    label = 'Are you ok? [  "Yes"<Yes>,  "No"<No>, ]'
+    assert parse_question((label, '"No"<No>', "radio", None)) == ("Are you ok?", "radio", ["Yes", "No"], "No")
+    assert parse_question((label, "Yes", "radio", None)) == ("Are you ok?", "radio", ["Yes", "No"], "Yes")
+    assert parse_question((label, "Maybe", "radio", None)) is None
+
+
+def test_parse_only_reusable_text() -> None:
+    assert parse_question(("How many years of Python?", "5", "text", "")) == ("How many years of Python?", "text", [], "5")
+    assert parse_question(("Are you willing to relocate?", "Yes", "text", "")) is not None
+    assert parse_question(("Why do you want to work at Acme?", "I love Acme's products", "text", "")) is None
+    assert parse_question(("Cover letter", "Dear hiring manager, ...", "textarea", "")) is None
+    assert parse_question(("Rate your Python", "7", "range", "")) is None
+
+
+def test_recall_exact_and_similar(memory: Path) -> None:
+    remember_answer("How many years of experience do you have with Python?", "text", None, "5")
+    assert recall_answer("How many years of experience do you have with Python?", "text") == "5"
+    assert recall_answer("how many years of experience do you have with python", "text") == "5"
+    assert recall_answer("How many years of experience have you with Python?", "text") == "5"
+    assert recall_answer("How many years of experience do you have with Java?", "text") == "5"     # Similar enough at 0.7
+    assert recall_answer("Do you have a valid driver's license?", "text") is None
+
+
+def test_recall_needs_same_kind_and_options(memory: Path) -> None:
+    remember_answer("Are you willing to relocate?", "radio", ["Yes", "No"], "Yes")
+    assert recall_answer("Are you willing to relocate?", "radio", ["No", "Yes"]) == "Yes"     # Order of options doesn't matter
+    assert recall_answer("Are you willing to relocate?", "radio", ["Yes", "No", "Maybe"]) is None
+    assert recall_answer("Are you willing to relocate?", "select", ["Yes", "No"]) is None
+
+
+def test_exact_match_only(memory: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(answer_memory, "answer_memory_match", 1)
+    remember_answer("Years of Python?", "text", None, "5")
+    assert recall_answer("Years of Python?", "text") == "5"
+    assert recall_answer("Years of Python experience?", "text") is None
+
+
+def test_recall_skips_answers_not_reusable(memory: Path) -> None:
+    vars(answer_memory)["__memory"]["text::why acme::"] = {"question": "Why Acme", "kind": "text", "options": [], "answer": "Because", "count": 1}
+    assert recall_answer("Why Acme", "text") is None
+
+
+def test_learn_answers_skips_random_ones(memory: Path) -> None:
+    questions = {
+        ('Are you ok? [  "Yes"<Yes>,  "No"<No>, ]', '"Yes"<Yes>', "radio", None),
+        ('Gender [  "Male", "Female", "Decline", ]', "Female", "select", "Select an option"),
+        ("Notice period in days", "30", "text", ""),
+    }
+    learn_answers(questions, {('Gender [  "Male", "Female", "Decline", ]', "select")})
+    saved = json.loads(memory.read_text(encoding="utf-8"))
+    assert {entry["question"]: entry["answer"] for entry in saved.values()} == {"Are you ok?": "Yes", "Notice period in days": "30"}
+
+
+def test_save_merges_answers_saved_meanwhile(memory: Path) -> None:
+    other = {"text::notice period::": {"question": "Notice period", "kind": "text", "options": [], "answer": "30", "count": 1, "updated": "2024-12-01T00:00:00"}}
+    memory.write_text(json.dumps(other), encoding="utf-8")
+    remember_answer("Years of Python?", "text", None, "5")
+    save_memory()
+    saved = json.loads(memory.read_text(encoding="utf-8"))
+    assert {entry["answer"] for entry in saved.values()} == {"30", "5"}
+    assert recall_answer("Notice period", "text") == "30"
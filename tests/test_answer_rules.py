@@ -0,0 +1,45 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import pytest
+
+from modules.answer_rules import answer_rules, get_answer_key, label_corpus
+
+
+@pytest.mark.parametrize("question_type, label, expected", label_corpus)
+def test_label_corpus(question_type: str, label: str, expected: str) -> None:
+    assert get_answer_key(question_type, label) == expected
+
+
+def test_unknown_question_type() -> None:
+    assert get_answer_key("checkbox", "Email address") is None
+
+
+def test_first_matching_rule_wins() -> None:
+    # "name" alone is full_name, but it's after first_name and last_name rules
+    assert get_answer_key("text", "Name") == "full_name"
+    assert get_answer_key("text", "Last name (as on passport)") == "last_name"
+
+
+def test_word_inside_longer_word() -> None:
+    # "link" is inside "linkedin", both are found so the earlier rule wins
+    assert get_answer_key("text", "LinkedIn URL") == "linkedIn"
+
+
+def test_excluded_words() -> None:
+    assert get_answer_key("text", "First and last name") not in ("first_name", "last_name")
+
+
+def test_every_question_type_has_rules() -> None:
+    assert set(answer_rules) == {"select", "radio", "text", "textarea", "range"}
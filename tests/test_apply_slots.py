@@ -0,0 +1,65 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import threading
+
+import pytest
+
+import modules.apply_slots as apply_slots
+from modules.apply_slots import reserve_apply_slot, release_apply_slot
+
+
+@pytest.fixture
+def shared(monkeypatch: pytest.MonkeyPatch) -> dict:
+    monkeypatch.setattr(apply_slots, "switch_number", 2)
+    return {"lock": threading.Lock(), "applied_jobs": {"applied": True}, "term_counts": {}, "in_progress": {}}
+
+
+def test_already_applied_job(shared: dict) -> None:
+    assert not reserve_apply_slot(shared, "applied", "python")
+    assert shared["in_progress"] == {}
+
+
+def test_jobs_in_progress_count_towards_limit(shared: dict) -> None:
+    assert reserve_apply_slot(shared, "1", "python")
+    assert reserve_apply_slot(shared, "2", "python")
+    assert not reserve_apply_slot(shared, "3", "python")
+    assert reserve_apply_slot(shared, "3", "java")      # Other search terms have their own limit
+
+
+def test_failed_application_frees_slot(shared: dict) -> None:
+    assert reserve_apply_slot(shared, "1", "python")
+    assert reserve_apply_slot(shared, "2", "python")
+    release_apply_slot(shared, "1", "python", applied=False)
+    assert "1" not in shared["applied_jobs"]
+    assert reserve_apply_slot(shared, "3", "python")
+
+
+def test_applied_job_is_counted(shared: dict) -> None:
+    assert reserve_apply_slot(shared, "1", "python")
+    release_apply_slot(shared, "1", "python", applied=True)
+    assert shared["applied_jobs"]["1"] and shared["term_counts"] == {"python": 1} and shared["in_progress"] == {"python": 0}
+    assert not reserve_apply_slot(shared, "1", "python")
+
+
+def test_workers_never_exceed_limit(shared: dict) -> None:
+    reserved = []
+    def worker(job_id: str) -> None:
+        if reserve_apply_slot(shared, job_id, "python"):
+            reserved.append(job_id)
+            release_apply_slot(shared, job_id, "python", applied=True)
+    threads = [threading.Thread(target=worker, args=(str(index),)) for index in range(20)]
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+    assert len(reserved) == 2 and shared["term_counts"]["python"] == 2
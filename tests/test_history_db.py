@@ -0,0 +1,170 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+import csv
+import threading
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+import modules.history_db as history_db
+from modules.history_db import (add_job, applied_columns, export_csv_history, get_applied_job_ids, get_applied_jobs, get_connection,
+                                query_applied_jobs, update_date_applied, update_dates_applied)
+
+
+def close_connection() -> None:
+    local = vars(history_db)["__local"]
+    if getattr(local, "connection", None) is not None:
+        local.connection.close()
+        del local.connection
+
+
+@pytest.fixture
+def db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    '''
+    Fresh history database in `tmp_path`, with CSV history files that don't exist yet
+    '''
+    close_connection()
+    monkeypatch.setattr(history_db, "history_db_path", str(tmp_path / "history.db"))
+    monkeypatch.setattr(history_db, "tables", {
+        "applied_jobs": (history_db.applied_columns, str(tmp_path / "applied.csv")),
+        "failed_jobs": (history_db.failed_columns, str(tmp_path / "failed.csv")),
+    })
+    monkeypatch.setattr(history_db, "__initialized", False)
+    yield tmp_path
+    close_connection()
+
+
+def applied_job(job_id: str, company: str = "Acme", date_applied: str = "2024-12-01 10:00:00", easy: bool = True) -> dict:
+    return {"Job ID": job_id, "Title": f"Engineer {job_id}", "Company": company, "Date Applied": date_applied,
+            "External Job link": "Easy Applied" if easy else f"https://careers.example.com/{job_id}"}
+
+
+def test_add_and_get_jobs(db: Path) -> None:
+    add_job("applied_jobs", applied_job("1"))
+    add_job("applied_jobs", applied_job("2"))
+    add_job("applied_jobs", applied_job("2"))
+    add_job("failed_jobs", {"Job ID": "3", "Assumed Reason": "Stuck"})
+    assert get_applied_job_ids() == {"1", "2"}
+    jobs = get_applied_jobs(["job_id", "company", "hr_name"])
+    assert [job["job_id"] for job in jobs] == ["1", "2", "2"]
+    assert jobs[0] == {"job_id": "1", "company": "Acme", "hr_name": None}
+
+
+def test_csv_history_imported_on_first_use(db: Path) -> None:
+    with open(db / "applied.csv", "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=["Job ID", "Title", "Company"])     # Old files may miss newer columns
+        writer.writeheader()
+        writer.writerows([{"Job ID": "10", "Title": "A", "Company": "X"}, {"Job ID": "11", "Title": "B", "Company": "Y"}])
+    assert get_applied_job_ids() == {"10", "11"}
+    assert get_applied_jobs(["job_id", "date_applied"])[0] == {"job_id": "10", "date_applied": ""}
+
+
+def test_export_csv_history(db: Path) -> None:
+    add_job("applied_jobs", applied_job("1", company="Acme, Inc."))
+    assert export_csv_history(str(db / "export.csv")) == 1
+    with open(db / "export.csv", "r", encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert list(rows[0]) == list(applied_columns.values())
+    assert rows[0]["Company"] == "Acme, Inc."
+
+
+def test_schema_has_indexes(db: Path) -> None:
+    indexes = {row[0] for row in get_connection().execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"applied_jobs_job_id", "applied_jobs_company", "applied_jobs_date_applied", "failed_jobs_job_id"} <= indexes
+
+
+@pytest.fixture
+def jobs(db: Path) -> None:
+    add_job("applied_jobs", applied_job("1", "Acme", "2024-12-01 10:00:00"))
+    add_job("applied_jobs", applied_job("2", "Globex", "2024-12-02 09:00:00", easy=False))
+    add_job("applied_jobs", applied_job("3", "acme labs", "2024-12-03 23:59:59"))
+    add_job("applied_jobs", applied_job("4", "Initech", "Pending"))
+
+
+def get_ids(rows: list) -> list:
+    return [row["job_id"] for row in rows]
+
+
+def test_query_all(jobs: None) -> None:
+    rows, total = query_applied_jobs(["job_id"])
+    assert get_ids(rows) == ["1", "2", "3", "4"] and total == 4
+
+
+def test_query_company_case_insensitive(jobs: None) -> None:
+    rows, total = query_applied_jobs(["job_id"], company="ACME")
+    assert get_ids(rows) == ["1", "3"] and total == 2
+
+
+def test_query_dates_inclusive_and_skip_pending(jobs: None) -> None:
+    rows, _ = query_applied_jobs(["job_id"], date_from="2024-12-02", date_to="2024-12-03")
+    assert get_ids(rows) == ["2", "3"]
+    rows, _ = query_applied_jobs(["job_id"], date_to="2024-12-31")
+    assert "4" not in get_ids(rows)
+
+
+def test_query_application_type(jobs: None) -> None:
+    assert get_ids(query_applied_jobs(["job_id"], application_type="external")[0]) == ["2"]
+    assert get_ids(query_applied_jobs(["job_id"], application_type="easy")[0]) == ["1", "3", "4"]
+
+
+def test_query_sort_and_page(jobs: None) -> None:
+    rows, total = query_applied_jobs(["job_id"], sort_by="company", descending=True, limit=2, offset=1)
+    assert get_ids(rows) == ["4", "2"] and total == 4     # acme labs, Initech, Globex, Acme (lower case sorts after upper case)
+
+
+def test_query_rejects_unknown_sort_column(jobs: None) -> None:
+    with pytest.raises(ValueError):
+        query_applied_jobs(sort_by="company; DROP TABLE applied_jobs")
+
+
+def get_dates() -> dict:
+    return {job["job_id"]: job["date_applied"] for job in get_applied_jobs(["job_id", "date_applied"])}
+
+
+def test_update_date_applied(jobs: None) -> None:
+    assert update_date_applied("4", "2024-12-04 12:00:00") == 1
+    assert update_date_applied("404", "2024-12-04 12:00:00") == 0
+    assert get_dates()["4"] == "2024-12-04 12:00:00"
+
+
+def test_update_dates_applied_returns_found_ids_once(jobs: None) -> None:
+    assert update_dates_applied(["1", "404", "3", "1"], "2025-01-01") == ["1", "3"]
+    assert get_dates() == {"1": "2025-01-01", "2": "2024-12-02 09:00:00", "3": "2025-01-01", "4": "Pending"}
+
+
+def test_update_dates_applied_rolls_back_on_error(jobs: None) -> None:
+    def job_ids():
+        yield "1"
+        raise RuntimeError("Failed while updating")
+    with pytest.raises(RuntimeError):
+        update_dates_applied(job_ids(), "2025-01-01")
+    assert get_dates()["1"] == "2024-12-01 10:00:00"
+    assert update_dates_applied(["2"], "2025-01-02") == ["2"]    # Connection is usable after the rollback
+
+
+def test_concurrent_updates(jobs: None) -> None:
+    errors = []
+    def update(date: str) -> None:
+        try:
+            update_dates_applied(["1", "2", "3"], date)
+        except Exception as e:
+            errors.append(e)
+    threads = [threading.Thread(target=update, args=(f"2025-01-{day:02}",)) for day in range(1, 9)]
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+    dates = get_dates()
+    assert not errors and dates["1"] == dates["2"] == dates["3"]     # Each update is atomic, the last one wins for all jobs
@@ -0,0 +1,48 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+version:    24.12.29.12.30
+'''
+
+from modules.matcher import compile_matcher, find_all, find_first
+
+
+def test_empty_word_list() -> None:
+    assert compile_matcher([]) is None
+    assert compile_matcher(["", "  "]) is None
+    assert find_all(None, "anything") == [] and find_first(None, "anything") is None
+
+
+def test_case_insensitive_substrings() -> None:
+    matcher = compile_matcher(["PHP", "Clearance"])
+    assert find_all(matcher, "Experience with phpunit, security CLEARANCE required") == [("php", 16), ("CLEARANCE", 34)]
+
+
+def test_whole_words() -> None:
+    matcher = compile_matcher(["PHP", "Go", "C++", ".NET"], whole_words=True)
+    assert find_all(matcher, "PHPUnit, Golang, Google and C#") == []
+    assert find_all(matcher, "PHP, Go (C++) or .NET.") == [("PHP", 0), ("Go", 5), ("C++", 9), (".NET", 17)]
+    assert find_first(matcher, "Write go-lang services") == "go"
+
+
+def test_longer_phrase_wins_over_prefix() -> None:
+    matcher = compile_matcher(["senior", "senior engineer"], whole_words=True)
+    assert find_all(matcher, "Senior Engineer, not a senior manager") == [("Senior Engineer", 0), ("senior", 23)]
+
+
+def test_words_are_escaped() -> None:
+    matcher = compile_matcher(["a.b", "(x)"])
+    assert find_first(matcher, "aXb") is None
+    assert find_first(matcher, "see (x) and a.b") == "(x)"
+
+
+def test_find_first_empty_text() -> None:
+    assert find_first(compile_matcher(["php"]), "") is None